@@ -1,35 +1,45 @@
 import streamlit as st
+import streamlit.components.v1 as components
 import pandas as pd
+import altair as alt
 import json
 import time
 import io
+import itertools
 import os
-import base64
 import urllib.parse
 import random
 import string
 import re
 import smtplib
-import numpy as np
-import cv2
+from functools import partial
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from datetime import date, datetime
-from reportlab.pdfgen import canvas
-from reportlab.lib.pagesizes import A4
-from reportlab.lib import colors
-from reportlab.lib.colors import HexColor
-from reportlab.lib.utils import ImageReader
-from reportlab.platypus import Table, TableStyle
-from reportlab.lib.units import inch
 from streamlit_gsheets import GSheetsConnection
-from PIL import Image, ImageEnhance
-
-# --- TRY IMPORTING ZXING ---
-try:
-    import zxingcpp
-except ImportError:
-    zxingcpp = None
+from hk_storage import SCHEMA, STORAGE_BACKEND, CachedStorage, match_mask, open_backend
+from hk_outbox import OUTBOX_FILE, WriteBehindQueue
+from hk_validation import gstin_state, is_valid_email, is_valid_mobile, is_valid_pan, is_valid_gstin, validate_columns
+from hk_import import CUSTOMER_RULES, import_customers
+from hk_export import EXPORT_MIME, export_file, export_worksheet
+from hk_pdf import PDF_CACHE_DIR, PdfCache, render_pdf_bytes
+from hk_thumbs import ThumbnailStore
+from hk_tax import compute_invoice_tax
+from hk_catalog import BarcodeRegistry, barcode_keys, cart_index, filter_items, page_count, page_slice
+from hk_bulk import BULK_FORMATS, bulk_generate_file, bulk_output_path, iter_invoice_jobs
+from hk_scan import BarcodeDecoder, ScanDebouncer, zxingcpp
+from hk_rollup import DAILY_BUCKETS, RollupStore
+from hk_lines import LINE_FORMATS, export_lines, hsn_turnover, invoice_lines, migrate_invoice_lines, top_sellers
+from hk_ledger import RECEIPT_MODES, LedgerStore, ageing, ledger_entries, party_statement
+from hk_stock import LOW_STOCK, StockStore, inward_lines
+from hk_gst import build_returns, gstr1_excel, gstr1_json, gstr3b_json, return_period, summary
+
+# --- LIVE SCANNER COMPONENT ---
+# scanner_component/index.html decodes camera frames in the browser and sends
+# every read as {"code", "at"}. The timestamp makes a repeat scan of the same
+# barcode a new value, so on_change fires for it and ScanDebouncer alone
+# decides which reads count.
+live_scanner_component = components.declare_component("hk_live_scanner", path=os.path.join(os.path.dirname(os.path.abspath(__file__)), "scanner_component"))
 
 # --- PAGE CONFIG ---
 st.set_page_config(page_title="HisaabKeeper Cloud", layout="wide", page_icon="🧾")
@@ -108,22 +118,6 @@ st.markdown("""
 SENDER_EMAIL = "your_email@gmail.com"  # <--- REPLACE THIS
 SENDER_PASSWORD = "xxxx xxxx xxxx xxxx"  # <--- REPLACE THIS
 APP_NAME = "HisaabKeeper"
-LOGO_FILE = "logo.png" 
-SIGNATURE_FILE = "signature.png"
-
-# --- STATE CODES ---
-STATE_CODES = {
-    "01": "Jammu & Kashmir", "02": "Himachal Pradesh", "03": "Punjab", "04": "Chandigarh",
-    "05": "Uttarakhand", "06": "Haryana", "07": "Delhi", "08": "Rajasthan", "09": "Uttar Pradesh",
-    "10": "Bihar", "11": "Sikkim", "12": "Arunachal Pradesh", "13": "Nagaland", "14": "Manipur",
-    "15": "Mizoram", "16": "Tripura", "17": "Meghalaya", "18": "Assam", "19": "West Bengal",
-    "20": "Jharkhand", "21": "Odisha", "22": "Chhattisgarh", "23": "Madhya Pradesh",
-    "24": "Gujarat", "25": "Daman & Diu", "26": "Dadra & Nagar Haveli", "27": "Maharashtra",
-    "28": "Andhra Pradesh (Old)", "29": "Karnataka", "30": "Goa", "31": "Lakshadweep",
-    "32": "Kerala", "33": "Tamil Nadu", "34": "Puducherry", "35": "Andaman & Nicobar Islands",
-    "36": "Telangana", "37": "Andhra Pradesh", "38": "Ladakh", "97": "Other Territory",
-    "99": "Centre Jurisdiction"
-}
 
 # --- HELPER FUNCTIONS ---
 def format_indian_currency(amount):
@@ -147,26 +141,6 @@ def get_whatsapp_web_link(mobile, msg):
     return f"https://web.whatsapp.com/send?phone={clean}&text={urllib.parse.quote(msg)}"
 
 def generate_unique_id(): return ''.join(random.choices(string.ascii_uppercase + string.digits, k=16))
-def is_valid_email(email): return re.match(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$', email) is not None
-def is_valid_mobile(mobile): return re.match(r'^[6-9]\d{9}$', mobile) is not None
-def is_valid_pan(pan): return re.match(r'^[A-Z]{5}[0-9]{4}[A-Z]{1}$', pan) is not None
-def is_valid_gstin(gstin): return re.match(r'^[0-9]{2}[A-Z]{5}[0-9]{4}[A-Z]{1}[1-9A-Z]{1}Z[0-9A-Z]{1}$', gstin) is not None
-
-def image_to_base64(image_file):
-    if image_file is None: return None
-    try:
-        img = Image.open(image_file)
-        img.thumbnail((150, 150))
-        buff = io.BytesIO()
-        img = img.convert('RGB')
-        img.save(buff, format="JPEG", quality=70)
-        return base64.b64encode(buff.getvalue()).decode()
-    except: return None
-
-def base64_to_image(base64_string):
-    if not base64_string or str(base64_string) == 'nan': return None
-    try: return io.BytesIO(base64.b64decode(base64_string))
-    except: return None
 
 def get_save_directory(profile_data, is_letterhead=False):
     return "invoices_letterhead" if is_letterhead else "invoices_main"
@@ -184,401 +158,283 @@ def send_otp_email(to_email, otp_code):
     except Exception as e: st.error(f"Failed to send email: {e}"); return False
 
 def to_excel_bytes(df):
-    output = io.BytesIO()
-    with pd.ExcelWriter(output, engine='openpyxl') as writer:
-        df.to_excel(writer, index=False, sheet_name='Sheet1')
-    return output.getvalue()
+    return export_file([df], list(df.columns)).read()
 
 # --- SCANNER ENGINE ---
-def robust_barcode_decode(pil_image):
+def robust_barcode_decode(image):
     if zxingcpp is None: return None
-    try:
-        img_np = np.array(pil_image.convert('RGB'))
-        results = zxingcpp.read_barcodes(img_np)
-        if results: return results[0].text
-        
-        gray = cv2.cvtColor(img_np, cv2.COLOR_RGB2GRAY)
-        results = zxingcpp.read_barcodes(gray)
-        if results: return results[0].text
-        
-        enhancer = ImageEnhance.Contrast(pil_image)
-        img_enhanced = enhancer.enhance(2.0)
-        img_np_e = np.array(img_enhanced.convert('RGB'))
-        results = zxingcpp.read_barcodes(img_np_e)
-        if results: return results[0].text
-        
-        return None
-    except: return None
+    try: return get_barcode_decoder().decode(image)[0]
+    except Exception: return None  # corrupt frames raise cv2/zxing errors as well
 
 # --- DATABASE ---
-def get_db_connection():
-    return st.connection("gsheets", type=GSheetsConnection)
+@st.cache_resource
+def get_storage():
+    if STORAGE_BACKEND == "gsheets": return CachedStorage(open_backend("gsheets", gsheets_conn=st.connection("gsheets", type=GSheetsConnection)))
+    return CachedStorage(open_backend(STORAGE_BACKEND))
+
+@st.cache_resource
+def get_outbox():
+    return WriteBehindQueue(get_storage(), OUTBOX_FILE).start()
+
+@st.cache_resource
+def get_pdf_cache():
+    return PdfCache()
+
+@st.cache_resource
+def get_thumb_store():
+    return ThumbnailStore()
+
+@st.cache_resource
+def get_rollups():
+    return RollupStore()
+
+@st.cache_resource
+def get_ledger():
+    return LedgerStore()
+
+@st.cache_resource
+def get_stock():
+    return StockStore()
+
+@st.cache_resource
+def get_barcode_decoder():
+    return BarcodeDecoder()
+
+@st.cache_resource
+def get_barcode_registry():
+    return BarcodeRegistry()
+
+# Barcode -> item for the signed-in tenant; rebuilt from df_items only when
+# the Items version moves, so a scan is one dict lookup.
+def barcode_index(df_items):
+    uid = str(st.session_state["user_id"])
+    return get_barcode_registry().get(uid, get_storage().version("Items", uid), lambda: df_items)
 
 def fetch_data(worksheet_name):
-    conn = get_db_connection()
-    schema = {
-        "Users": ["UserID", "Username", "Password", "Business Name", "Tagline", "Is GST", "GSTIN", "PAN", "Mobile", "Email", "Template", "BillingStyle", "Addr1", "Addr2", "Pincode", "District", "State", "Bank Name", "Branch", "Account No", "IFSC", "UPI"],
-        "Customers": ["UserID", "Name", "GSTIN", "Address 1", "Address 2", "Address 3", "State", "Mobile", "Email"],
-        "Items": ["UserID", "Item Name", "Price", "UOM", "HSN", "Image", "Barcode", "Weight"],
-        "Invoices": ["UserID", "Bill No", "Date", "Buyer Name", "Items", "Total Taxable", "CGST", "SGST", "IGST", "Grand Total", "Ship Name", "Ship GSTIN", "Ship Addr1", "Ship Addr2", "Ship Addr3", "Payment Mode"],
-        "Receipts": ["UserID", "Date", "Party Name", "Amount", "Note"],
-        "Inward": ["UserID", "Date", "Supplier Name", "Total Value"]
-    }
-    try:
-        df = conn.read(worksheet=worksheet_name, ttl=0)
-        if worksheet_name in schema:
-            for col in schema[worksheet_name]:
-                if col not in df.columns: df[col] = ""
-            df = df[schema[worksheet_name]]
-        return df
-    except: return pd.DataFrame(columns=schema.get(worksheet_name, []))
+    try: return get_storage().read(worksheet_name)
+    except: return pd.DataFrame(columns=SCHEMA.get(worksheet_name, []))
 
 def fetch_user_data(worksheet_name):
     if not st.session_state.get("user_id"): return pd.DataFrame()
-    df = fetch_data(worksheet_name)
-    if "UserID" in df.columns:
-        return df[df["UserID"] == str(st.session_state["user_id"])]
+    try: df = get_storage().read_user(worksheet_name, st.session_state["user_id"])
+    except: df = pd.DataFrame(columns=SCHEMA.get(worksheet_name, []))
+    # Rows still waiting in the write-behind journal are shown as saved.
+    pending = get_outbox().pending_frame(worksheet_name, st.session_state["user_id"])
+    if not pending.empty: df = pd.concat([df, pending], ignore_index=True) if not df.empty else pending
     return df
 
+def find_rows(worksheet_name, equals):
+    try: return get_storage().read_where(worksheet_name, equals)
+    except: return pd.DataFrame(columns=SCHEMA.get(worksheet_name, []))
+
 def save_row_to_sheet(worksheet_name, new_row_dict):
-    conn = get_db_connection()
-    df = fetch_data(worksheet_name)
     if "UserID" not in new_row_dict: new_row_dict["UserID"] = st.session_state["user_id"]
-    new_df = pd.DataFrame([new_row_dict])
-    if df.empty: updated_df = new_df
-    else: updated_df = pd.concat([df, new_df], ignore_index=True)
     try:
-        conn.update(worksheet=worksheet_name, data=updated_df)
-        st.cache_data.clear()
+        get_storage().append(worksheet_name, [new_row_dict])
+        return True
+    except Exception as e: st.error(f"Could not save: {e}"); return False
+
+def queue_row_to_sheet(worksheet_name, new_row_dict):
+    if "UserID" not in new_row_dict: new_row_dict["UserID"] = st.session_state["user_id"]
+    try:
+        get_outbox().enqueue(worksheet_name, new_row_dict)
         return True
-    except Exception as e:
-        if "sheet" in str(e).lower() or "not found" in str(e).lower():
-            try:
-                conn.create(worksheet=worksheet_name, data=updated_df)
-                st.cache_data.clear()
-                return True
-            except: return False
-        return False
+    except Exception as e: st.error(f"Could not save locally: {e}"); return False
+
+# Queues the invoice with one InvoiceLines row per item and folds it into the
+# dashboard rollups, customer balances and stock. If a cache update fails the
+# tenant is marked for a rebuild instead; lines that fail to queue are
+# recovered by the migration. Bill No is unique per tenant (the rollups,
+# ledger and stock caches key on it), so a reused number is rejected here for
+# every billing flow.
+def bill_no_exists(bill_no):
+    past = fetch_user_data("Invoices")
+    return "Bill No" in past.columns and str(bill_no).strip() in set(past["Bill No"].astype(str).str.strip())
+
+def queue_invoice(db_row):
+    if bill_no_exists(db_row["Bill No"]): st.error(f"Invoice Number {db_row['Bill No']} already exists!"); return False
+    if not queue_row_to_sheet("Invoices", db_row): return False
+    try: get_outbox().enqueue_many("InvoiceLines", invoice_lines(db_row))
+    except Exception as e: st.warning(f"Invoice saved, but its line items were not: {e}")
+    try: get_rollups().add(db_row)
+    except Exception: get_rollups().invalidate(db_row["UserID"])
+    try: get_ledger().add_invoice(db_row)
+    except Exception: get_ledger().invalidate(db_row["UserID"])
+    try: get_stock().add_sale(db_row)
+    except Exception: get_stock().invalidate(db_row["UserID"])
+    return True
+
+def queue_inward(header, items):
+    lines = inward_lines(header, items)
+    if not queue_row_to_sheet("Inward", header): return False
+    try: get_outbox().enqueue_many("InwardLines", lines)
+    except Exception as e: st.warning(f"Purchase saved, but its line items were not: {e}"); return True
+    try: get_stock().add_inward(header, lines)
+    except Exception: get_stock().invalidate(header["UserID"])
+    return True
+
+# Stock levels for the signed-in tenant, rebuilt from history only when the
+# stock cache has never been built (or was invalidated).
+def stock_store():
+    uid = str(st.session_state["user_id"])
+    stock = get_stock()
+    if not stock.is_built(uid): stock.rebuild(uid, fetch_user_data("Invoices"), fetch_user_data("InvoiceLines"), fetch_user_data("InwardLines"))
+    return stock
+
+def queue_receipt(row):
+    if not queue_row_to_sheet("Receipts", row): return False
+    try: get_ledger().add_receipt(row)
+    except Exception: get_ledger().invalidate(row["UserID"])
+    return True
 
 def save_bulk_data(worksheet_name, new_df_chunk):
-    conn = get_db_connection()
-    df = fetch_data(worksheet_name)
     if "UserID" not in new_df_chunk.columns: new_df_chunk["UserID"] = st.session_state["user_id"]
     else: new_df_chunk["UserID"] = new_df_chunk["UserID"].fillna(st.session_state["user_id"])
-    updated_df = pd.concat([df, new_df_chunk], ignore_index=True) if not df.empty else new_df_chunk
     try:
-        conn.update(worksheet=worksheet_name, data=updated_df)
-        st.cache_data.clear()
+        get_storage().append(worksheet_name, new_df_chunk.to_dict('records'))
         return True
-    except:
-        try:
-            conn.create(worksheet=worksheet_name, data=updated_df)
-            st.cache_data.clear()
-            return True
-        except: return False
+    except Exception as e: st.error(f"Could not save: {e}"); return False
+
+def update_rows(worksheet_name, equals, changes):
+    try: return get_storage().update_where(worksheet_name, {"UserID": str(st.session_state["user_id"]), **equals}, changes) > 0
+    except Exception as e: st.error(f"Could not update: {e}"); return False
+
+def delete_rows(worksheet_name, equals):
+    try: return get_storage().delete_where(worksheet_name, {"UserID": str(st.session_state["user_id"]), **equals}) > 0
+    except Exception as e: st.error(f"Could not delete: {e}"); return False
+
+# Items are not unique by name, so edits and deletes match on the name plus
+# the barcode when several items share the name. None when even that matches
+# more than one row, so nothing is changed.
+def item_key(df_items, row):
+    key = {"Item Name": str(row["Item Name"])}
+    if not df_items.empty and match_mask(df_items, key).sum() > 1:
+        barcode = str(row.get("Barcode", "")).strip()
+        key["Barcode"] = "" if barcode == "nan" else barcode
+        if match_mask(df_items.fillna(""), key).sum() > 1: return None
+    return key
+
+def delete_item(df_items, row):
+    key = item_key(df_items, row)
+    if key is None: st.error(f"More than one item is named {row['Item Name']} with the same barcode. Give them different names or barcodes in the sheet first.")
+    elif delete_rows("Items", key): st.rerun()
+
+# Exports are built only when the button is clicked (Streamlit runs the
+# callable on its own thread, so everything it needs is captured up front).
+def export_download_button(label, worksheet_name, file_stem, fmt="xlsx"):
+    storage, outbox, user_id = get_storage(), get_outbox(), st.session_state.user_id
+    def build():
+        with export_worksheet(storage, worksheet_name, user_id, fmt, extra_chunks=[outbox.pending_frame(worksheet_name, user_id)]) as out:
+            out.seek(0); return out.read()
+    st.download_button(label, data=build, file_name=f"{file_stem}.{fmt}", mime=EXPORT_MIME[fmt], use_container_width=True)
 
 def update_user_profile(updated_profile_dict):
-    conn = get_db_connection()
-    df = fetch_data("Users")
-    idx = df[df["UserID"] == str(st.session_state["user_id"])].index
-    if not idx.empty:
-        for k, v in updated_profile_dict.items(): df.at[idx[0], k] = v
-        try:
-            conn.update(worksheet="Users", data=df)
-            st.session_state.user_profile = df.iloc[idx[0]].to_dict()
-            return True
-        except: return False
+    if update_rows("Users", {}, updated_profile_dict):
+        st.session_state.user_profile = {**st.session_state.user_profile, **updated_profile_dict}
+        return True
     return False
 
-# --- PDF ---
-def draw_header_on_canvas(c, w, h, seller, buyer, inv_no, is_letterhead, theme, font_header, font_body):
-    if not is_letterhead:
-        if theme == 'Formal':
-            c.setLineWidth(3); c.rect(20, h-160, w-40, 140); c.setLineWidth(1)
-
-        if os.path.exists(LOGO_FILE):
-            try:
-                logo = ImageReader(LOGO_FILE)
-                c.drawImage(logo, 30, h-100, width=2.0*inch, height=1.0*inch, mask='auto', preserveAspectRatio=True)
-            except: pass
-
-        center_x = (w / 2) + 20 
-        c.setFont(font_header, 18)
-        c.drawCentredString(center_x, h-50, seller.get('Business Name', 'Unknown Firm'))
-        
-        if seller.get('Tagline'):
-            c.setFont(font_body, 10)
-            c.drawCentredString(center_x, h-65, seller.get('Tagline'))
-
-        c.setFont(font_body, 9)
-        y_contact = h-80
-        
-        if seller.get('Is GST', 'No') == 'Yes':
-            if seller.get('GSTIN'):
-                c.drawCentredString(center_x, y_contact, f"GSTIN: {seller.get('GSTIN', '')}")
-                y_contact -= 12
-        else:
-            if seller.get('PAN'):
-                c.drawCentredString(center_x, y_contact, f"PAN: {seller.get('PAN', '')}")
-                y_contact -= 12
-        
-        c.drawCentredString(center_x, y_contact, seller.get('Addr1', ''))
-        y_contact -= 12
-        c.drawCentredString(center_x, y_contact, seller.get('Addr2', ''))
-        y_contact -= 12
-        full_addr_3 = f"{seller.get('District', '')}, {seller.get('State', '')} - {seller.get('Pincode', '')}"
-        c.drawCentredString(center_x, y_contact, full_addr_3)
-        y_contact -= 12
-        
-        c.drawCentredString(center_x, y_contact, f"M: {seller.get('Mobile', '')} | E: {seller.get('Email', '')}")
-    
-    title_text = "TAX INVOICE" if seller.get('Is GST', 'No') == 'Yes' else "INVOICE"
-    c.setFont(font_header, 14)
-    c.drawCentredString(w/2, h-160, title_text)
-    
-    if theme != 'Modern' and not is_letterhead:
-        c.line(30, h-165, w-30, h-165)
-    
-    y = h-190
-    ship_data = buyer.get('Shipping', {})
-    
-    c.setFont(font_header, 10); c.drawString(40, y, "Bill To:")
-    c.setFont(font_body, 10)
-    c.drawString(40, y-15, str(buyer.get('Name', '')))
-    
-    if seller.get('Is GST', 'No') == 'Yes':
-        c.drawString(40, y-30, f"GSTIN: {buyer.get('GSTIN', 'URP')}")
-        addr_start_y = y-45
+# --- LIVE SCANNING ---
+# The scanner component reports every read. on_change debounces it and adds
+# the item to the cart, and only
+# the scanner fragment reruns, so a checkout scan does not rerun the page.
+# Unknown codes fall back to the "New Barcode Detected" form.
+def add_item_to_cart(item):
+    cart = st.session_state.pos_cart
+    idx = cart_index(cart).get(item['Item Name'])
+    if idx is not None:
+        cart[idx]['Qty'] += 1
+        st.session_state[f"ret_qty_{idx}"] = cart[idx]['Qty']
     else:
-        addr_start_y = y-30
-
-    c.drawString(40, addr_start_y, f"{buyer.get('Address 1', '')}")
-    if buyer.get('Address 2'):
-        addr_start_y -= 12
-        c.drawString(40, addr_start_y, f"{buyer.get('Address 2', '')}")
-    if buyer.get('Address 3'):
-        addr_start_y -= 12
-        c.drawString(40, addr_start_y, f"{buyer.get('Address 3', '')}")
-    
-    addr_start_y -= 12
-    c.drawString(40, addr_start_y, f"M: {buyer.get('Mobile', '')}  E: {buyer.get('Email', '')}")
-
-    if ship_data:
-        x_ship = 250
-        c.setFont(font_header, 10); c.drawString(x_ship, y, "Ship To:")
-        c.setFont(font_body, 10)
-        c.drawString(x_ship, y-15, ship_data.get('Name', ''))
-        
-        if seller.get('Is GST', 'No') == 'Yes':
-            c.drawString(x_ship, y-30, f"GSTIN: {ship_data.get('GSTIN', '')}")
-            s_addr_y = y-45
-        else:
-            s_addr_y = y-30
-        
-        c.drawString(x_ship, s_addr_y, f"{ship_data.get('Addr1', '')}")
-        if ship_data.get('Addr2'):
-            s_addr_y -= 12
-            c.drawString(x_ship, s_addr_y, f"{ship_data.get('Addr2', '')}")
-        if ship_data.get('Addr3'):
-            s_addr_y -= 12
-            c.drawString(x_ship, s_addr_y, f"{ship_data.get('Addr3', '')}")
-
-    x_inv = 400
-    c.setFont(font_header, 10); c.drawString(x_inv, y, "Invoice Details:")
-    c.setFont(font_body, 10)
-    c.drawString(x_inv, y-15, f"Inv No: {inv_no}")
-    c.drawString(x_inv, y-30, f"Date: {buyer.get('Date','')}")
-    if seller.get('Is GST', 'No') == 'Yes':
-        pos_code = buyer.get('POS Code', '24')
-        c.drawString(x_inv, y-45, f"POS: {pos_code}-{STATE_CODES.get(pos_code, '')}")
-
-    return h - 300 
-
-def draw_footer_on_canvas(c, w, h, seller, font_header, font_body):
-    foot_y = 130 
-    c.line(30, foot_y + 90, w-30, foot_y + 90)
-    
-    c.setFont(font_header, 10); c.drawString(40, foot_y+75, "Bank Details:")
-    c.setFont(font_body, 9)
-    c.drawString(40, foot_y+60, f"Bank: {seller.get('Bank Name','')}")
-    c.drawString(40, foot_y+48, f"Branch: {seller.get('Branch','')}")
-    c.drawString(40, foot_y+36, f"A/c: {seller.get('Account No','')}")
-    c.drawString(40, foot_y+24, f"IFSC: {seller.get('IFSC','')}")
-    
-    sign_y = foot_y + 50 
-    c.drawRightString(w-40, sign_y, f"For, {seller.get('Business Name', '')}")
-    
-    if os.path.exists(SIGNATURE_FILE):
-        try:
-            sig_img = ImageReader(SIGNATURE_FILE)
-            c.drawImage(sig_img, w-160, sign_y-55, width=1.4*inch, height=0.7*inch, mask='auto', preserveAspectRatio=True)
-        except: pass
-
-    c.drawRightString(w-40, sign_y-60, "Authorized Signatory")
-    
-    term_y = 50
-    c.setFont(font_body, 7)
-    terms = ["(1) We declare that this invoice shows the actual price of the goods/services described.", "(2) Subject to Local Jurisdiction.", "(3) Our responsibility ceases as soon as goods are delivered."]
-    for term in terms: c.drawString(40, term_y, term); term_y -= 10
-    
-    c.setFillColor(colors.grey)
-    c.setFont(font_body, 7)
-    footer_msg = "This document is generated using HisaabKeeper to get demo or Free trial connect us on hello.hisaabkeeper@gmail.com or whats app us on +91 6353953790"
-    c.drawCentredString(w/2, 15, footer_msg)
-    c.setFillColor(colors.black)
-
-def generate_pdf(seller, buyer, items, inv_no, path, totals, is_letterhead=False):
-    c = canvas.Canvas(path, pagesize=A4)
-    w, h = A4 
-    
-    theme = seller.get('Template', 'Simple')
-    if theme == "Simple": theme = "Basic"
-    
-    if theme == 'Modern': 
-        font_header = "Helvetica-Bold"; font_body = "Helvetica"
-        accent_color = HexColor('#2C3E50'); text_color_head = colors.white; grid_color = colors.lightgrey
-    elif theme == 'Formal':
-        font_header = "Times-Bold"; font_body = "Times-Roman"
-        accent_color = colors.white; text_color_head = colors.black; grid_color = colors.black
-    else: 
-        font_header = "Helvetica-Bold"; font_body = "Helvetica"
-        accent_color = colors.grey; text_color_head = colors.whitesmoke; grid_color = colors.black
-
-    is_gst_bill = seller.get('Is GST', 'No') == 'Yes'
-    if is_gst_bill:
-        header = ["Sr.\nNo.", "Description", "HSN/SAC", "Qty", "UOM", "Rate", "Amount"]
-        col_widths = [0.5*inch, 2.6*inch, 1.0*inch, 0.8*inch, 0.6*inch, 1.0*inch, 1.2*inch]
-        span_cols = 5
-    else:
-        header = ["Sr.\nNo.", "Description", "Qty", "UOM", "Rate", "Amount"]
-        col_widths = [0.5*inch, 3.6*inch, 0.8*inch, 0.6*inch, 1.0*inch, 1.2*inch]
-        span_cols = 4
-
-    data = [header]
-    for i, item in enumerate(items, 1):
-        amt = item['Qty'] * item['Rate']
-        desc = str(item['Description']).replace('\n', ' ') 
-        if is_gst_bill:
-            data.append([str(i), desc, str(item.get('HSN', '')), f"{item['Qty']:.2f}", str(item.get('UOM', '')), f"{item['Rate']:.2f}", f"{amt:.2f}"])
-        else:
-            data.append([str(i), desc, f"{item['Qty']:.2f}", str(item.get('UOM', '')), f"{item['Rate']:.2f}", f"{amt:.2f}"])
-    
-    summary_start = len(data)
-    if is_gst_bill:
-        data.append(['Taxable Value', '', '', '', '', '', f"{totals['taxable']:.2f}"])
-        if totals.get('is_intra', True):
-            data.append(['Add: CGST', '', '', '', '', '', f"{totals['cgst']:.2f}"])
-            data.append(['Add: SGST', '', '', '', '', '', f"{totals['sgst']:.2f}"])
-        else:
-            data.append(['Add: IGST', '', '', '', '', '', f"{totals['igst']:.2f}"])
-    
-    data.append(['Grand Total', '', '', '', '', '', f"{totals['total']:.2f}"])
-    
-    last_col_idx = len(header) - 1
-    style_cmds = [
-        ('FONTNAME', (0,0), (-1,-1), font_body),
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('ALIGN', (0,0), (-1,-1), 'CENTER'),
-        ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
-        ('ALIGN', (1,1), (1, summary_start-1), 'LEFT'),
-        ('ALIGN', (0, summary_start), (len(header)-2,-1), 'RIGHT'),
-        ('TOPPADDING', (0,0), (-1,-1), 6),
-        ('BOTTOMPADDING', (0,0), (-1,-1), 6),
-        ('GRID', (0,0), (-1,-1), 0.5, grid_color)
-    ]
-
-    if theme == 'Modern':
-        style_cmds.extend([
-            ('BACKGROUND', (0,0), (-1,0), accent_color),
-            ('TEXTCOLOR', (0,0), (-1,0), text_color_head),
-            ('FONTNAME', (0,0), (-1,0), font_header),
-            ('FONTNAME', (0, summary_start), (-1, -1), font_header),
-            ('BACKGROUND', (0, -1), (-1, -1), colors.whitesmoke),
-        ])
-    
-    for i in range(summary_start, len(data)): 
-        style_cmds.append(('SPAN', (0,i), (span_cols,i)))
-    
-    main_table = Table(data, colWidths=col_widths)
-    main_table.setStyle(TableStyle(style_cmds))
-
-    hsn_table = None
-    if is_gst_bill:
-        tax_summary = {}
-        for item in items:
-            hsn_code = str(item.get('HSN', ''))
-            gst_rate = float(item.get('GST Rate', 0))
-            taxable_val = float(item['Qty']) * float(item['Rate'])
-            key = (hsn_code, gst_rate)
-            if key not in tax_summary: tax_summary[key] = {'taxable': 0.0, 'cgst': 0.0, 'sgst': 0.0, 'igst': 0.0, 'total': 0.0}
-            tax_summary[key]['taxable'] += taxable_val
-            if totals.get('is_intra', True):
-                c_val = taxable_val * (gst_rate / 2 / 100); s_val = taxable_val * (gst_rate / 2 / 100); i_val = 0
-            else:
-                c_val = 0; s_val = 0; i_val = taxable_val * (gst_rate / 100)
-            tax_summary[key]['cgst'] += c_val; tax_summary[key]['sgst'] += s_val; tax_summary[key]['igst'] += i_val; tax_summary[key]['total'] += (taxable_val + c_val + s_val + i_val)
-        
-        hsn_data = [['HSN/SAC', 'Rate', 'Taxable', 'CGST', 'SGST', 'IGST', 'Total']]
-        t_taxable = 0; t_grand = 0; t_cgst=0; t_sgst=0; t_igst=0
-        for key in sorted(tax_summary.keys(), key=lambda x: x[0]):
-            vals = tax_summary[key]
-            hsn_data.append([str(key[0]), f"{key[1]}%", f"{vals['taxable']:.2f}", f"{vals['cgst']:.2f}", f"{vals['sgst']:.2f}", f"{vals['igst']:.2f}", f"{vals['total']:.2f}"])
-            t_taxable += vals['taxable']; t_grand += vals['total']; t_cgst += vals['cgst']; t_sgst += vals['sgst']; t_igst += vals['igst']
-        hsn_data.append(['Total', '', f"{t_taxable:.2f}", f"{t_cgst:.2f}", f"{t_sgst:.2f}", f"{t_igst:.2f}", f"{t_grand:.2f}"])
-        
-        hsn_table = Table(hsn_data, colWidths=[1.2*inch, 0.8*inch, 1.2*inch, 1.0*inch, 1.0*inch, 1.0*inch, 1.2*inch])
-        hsn_table.setStyle(TableStyle([
-            ('FONTNAME', (0,0), (-1,-1), font_body), ('FONTSIZE', (0,0), (-1,-1), 8), ('ALIGN', (0,0), (-1,-1), 'CENTER'),
-            ('GRID', (0,0), (-1,-1), 0.5, colors.grey), ('BACKGROUND', (0,0), (-1,0), colors.whitesmoke),
-            ('FONTNAME', (0,0), (-1,0), font_header), ('FONTNAME', (0, -1), (-1, -1), font_header)
-        ]))
-
-    header_bottom_y = h - 300 
-    footer_height = 230 
-    usable_height = header_bottom_y - footer_height
-    
-    table_parts = []
-    current_data = main_table
-    while True:
-        w_t, h_t = current_data.wrap(w, h)
-        if h_t <= usable_height:
-            table_parts.append(current_data); break
-        else:
-            result = current_data.split(w, usable_height)
-            if len(result) == 2: table_parts.append(result[0]); current_data = result[1]
-            else: table_parts.append(current_data); break
-    
-    total_pages = len(table_parts)
-    hsn_needs_new_page = False
-    
-    if hsn_table:
-        htw, hth = hsn_table.wrapOn(c, w, h)
-        last_part_h = table_parts[-1].wrapOn(c, w, h)[1]
-        if (usable_height - last_part_h - 20) < hth:
-            total_pages += 1
-            hsn_needs_new_page = True
-
-    for page_idx, part in enumerate(table_parts):
-        y_start = draw_header_on_canvas(c, w, h, seller, buyer, inv_no, is_letterhead, theme, font_header, font_body)
-        pw, ph = part.wrapOn(c, w, h)
-        part.drawOn(c, 30, y_start - ph)
-        current_y = y_start - ph - 20
-        draw_footer_on_canvas(c, w, h, seller, font_header, font_body)
-        c.setFont(font_body, 8)
-        c.drawCentredString(w/2, 25, f"Page {page_idx+1} of {total_pages}") 
-        
-        if page_idx == len(table_parts) - 1:
-            if hsn_table:
-                htw, hth = hsn_table.wrapOn(c, w, h)
-                if not hsn_needs_new_page: hsn_table.drawOn(c, 30, current_y - hth)
+        cart.append({"Description": item['Item Name'], "HSN": item.get('HSN', ''), "Qty": 1.0,
+                     "UOM": item.get('UOM', 'PCS'), "Rate": float(item['Price']), "GST Rate": 0.0})
+
+def on_live_scan(df_items):
+    code = str((st.session_state.get("ret_live_scanner") or {}).get("code") or "").strip()
+    if not code or not st.session_state.live_scan_debouncer.accept(barcode_keys(code)[0]): return
+    item = barcode_index(df_items).lookup(code)
+    if item is None:
+        st.session_state.live_scan_unknown = code; return
+    add_item_to_cart(item)
+    st.session_state.live_scan_log = [item['Item Name']] + st.session_state.get("live_scan_log", [])[:4]
+
+@st.fragment
+def render_live_scanner(df_items):
+    if "live_scan_debouncer" not in st.session_state: st.session_state.live_scan_debouncer = ScanDebouncer()
+    live_scanner_component(key="ret_live_scanner", on_change=partial(on_live_scan, df_items))
+    unknown = st.session_state.pop("live_scan_unknown", None)
+    if unknown:
+        st.session_state.retail_scanner = unknown; st.rerun(scope="app")
+    cart = st.session_state.pos_cart
+    total = sum(float(item['Qty']) * float(item['Rate']) for item in cart)
+    st.caption(f"🛒 {len(cart)} items · ₹ {total:.2f}" + (f" · Last: {', '.join(st.session_state.live_scan_log)}" if st.session_state.get("live_scan_log") else ""))
+
+# --- PRODUCT GRID ---
+# Shared by Retail POS ("ret_" keys) and Customized billing (no prefix). Only
+# the current page of matching items is rendered, and cart lookups go through
+# a Description -> position index instead of scanning the cart per item.
+def stock_caption(qty):
+    if qty is None: return
+    if qty <= 0: st.caption(":red[Out of stock]")
+    elif qty <= LOW_STOCK: st.caption(f":orange[Only {qty:g} left]")
+    else: st.caption(f"In stock: {qty:g}")
+
+def set_grid_page(prefix, page):
+    st.session_state[f"{prefix}grid_page"] = page
+
+def render_product_grid(df_items, prefix, qty_prefix, stock=None):
+    search = st.text_input("🔍 Search Items", key=f"{prefix}grid_search", placeholder="Item name, HSN or barcode", on_change=set_grid_page, args=(prefix, 1))
+    matches = filter_items(df_items, search)
+    if matches.empty:
+        st.info("No items match your search."); return
+    pages = page_count(len(matches))
+    page = min(max(st.session_state.get(f"{prefix}grid_page", 1), 1), pages)
+    cart = st.session_state.pos_cart
+    in_cart = cart_index(cart)
+    cols = st.columns(3)
+    for n, (i, row) in enumerate(page_slice(matches, page).iterrows()):
+        with cols[n % 3]:
+            with st.container(border=True):
+                thumb = get_thumb_store().get(row.get("Image"))
+                if thumb:
+                    try: st.image(thumb, use_container_width=True)
+                    except: pass
+                st.markdown(f"**{row['Item Name']}**")
+                st.markdown(f"<span class='product-price'>₹ {row['Price']}</span>", unsafe_allow_html=True)
+                if stock is not None: stock_caption(stock(row['Item Name']))
+                
+                idx = in_cart.get(row['Item Name'])
+                if idx is not None:
+                    b_minus, b_qty, b_plus = st.columns([1, 1, 1], vertical_alignment="center")
+                    if b_minus.button("➖", key=f"{prefix}minus_{i}", use_container_width=True):
+                        if cart[idx]['Qty'] > 1: cart[idx]['Qty'] -= 1
+                        else: cart.pop(idx)
+                        # Force Update Checkout Input
+                        if idx < len(cart): st.session_state[f"{qty_prefix}{idx}"] = cart[idx]['Qty']
+                        st.rerun()
+                    
+                    b_qty.markdown(f"<div style='text-align:center; font-weight:bold;'>{int(cart[idx]['Qty'])}</div>", unsafe_allow_html=True)
+                    
+                    if b_plus.button("➕", key=f"{prefix}plus_{i}", use_container_width=True):
+                        cart[idx]['Qty'] += 1
+                        st.session_state[f"{qty_prefix}{idx}"] = cart[idx]['Qty']
+                        st.rerun()
                 else:
-                    c.showPage()
-                    y_start_new = draw_header_on_canvas(c, w, h, seller, buyer, inv_no, is_letterhead, theme, font_header, font_body)
-                    draw_footer_on_canvas(c, w, h, seller, font_header, font_body)
-                    c.drawCentredString(w/2, 25, f"Page {total_pages} of {total_pages}")
-                    hsn_table.drawOn(c, 30, y_start_new - hth)
-        c.showPage()
-    c.save()
+                    if st.button("Add", key=f"{prefix}add_{i}", use_container_width=True):
+                        cart.append({
+                            "Description": row['Item Name'],
+                            "HSN": row.get('HSN', ''),
+                            "Qty": 1.0,
+                            "UOM": row.get('UOM', 'PCS'),
+                            "Rate": float(row['Price']),
+                            "GST Rate": 0.0
+                        })
+                        st.rerun()
+    if pages > 1:
+        p_prev, p_info, p_next = st.columns([1, 2, 1], vertical_alignment="center")
+        p_prev.button("◀ Prev", key=f"{prefix}grid_prev", disabled=page <= 1, on_click=set_grid_page, args=(prefix, page - 1), use_container_width=True)
+        p_info.markdown(f"<div style='text-align:center;'>Page {page} of {pages} · {len(matches)} items</div>", unsafe_allow_html=True)
+        p_next.button("Next ▶", key=f"{prefix}grid_next", disabled=page >= pages, on_click=set_grid_page, args=(prefix, page + 1), use_container_width=True)
 
 # --- SESSION STATE INITIALIZATION ---
 if "user_id" not in st.session_state: st.session_state.user_id = None
@@ -595,6 +451,7 @@ if "bm_date" not in st.session_state: st.session_state.bm_date = date.today()
 if "reset_invoice_trigger" not in st.session_state: st.session_state.reset_invoice_trigger = False
 if "menu_selection" not in st.session_state: st.session_state.menu_selection = "Dashboard"
 if "pos_cart" not in st.session_state: st.session_state.pos_cart = []
+if "inward_items" not in st.session_state: st.session_state.inward_items = []
 
 if "im_name" not in st.session_state: st.session_state.im_name = ""
 if "im_price" not in st.session_state: st.session_state.im_price = 0.0
@@ -602,6 +459,8 @@ if "im_uom" not in st.session_state: st.session_state.im_uom = "PCS"
 if "im_hsn" not in st.session_state: st.session_state.im_hsn = ""
 if "im_barcode" not in st.session_state: st.session_state.im_barcode = ""
 if "im_weight" not in st.session_state: st.session_state.im_weight = ""
+if "im_edit_name" not in st.session_state: st.session_state.im_edit_name = None
+if "im_edit_key" not in st.session_state: st.session_state.im_edit_key = None
 if "retail_scanner" not in st.session_state: st.session_state.retail_scanner = ""
 
 # --- LOGIN PAGE ---
@@ -617,11 +476,10 @@ def login_page():
                 user_input = st.text_input("Username")
                 pwd = st.text_input("Password", type="password")
                 if st.form_submit_button("Login", type="primary"):
-                    df_users = fetch_data("Users")
+                    df_users = find_rows("Users", {"Username": user_input})
                     if "Username" in df_users.columns:
-                        df_users["Username"] = df_users["Username"].astype(str)
                         df_users["Password"] = df_users["Password"].astype(str)
-                        user_row = df_users[(df_users["Username"] == user_input) & (df_users["Password"] == pwd)]
+                        user_row = df_users[df_users["Password"] == pwd]
                         if not user_row.empty:
                             st.session_state.user_id = str(user_row.iloc[0]["UserID"])
                             st.session_state.user_profile = user_row.iloc[0].to_dict()
@@ -644,7 +502,7 @@ def login_page():
                     mob = st.text_input("Mobile Number (10 digits)")
                     em = st.text_input("Email ID")
                     if st.form_submit_button("Verify Email & Register"):
-                        df_users = fetch_data("Users")
+                        df_users = find_rows("Users", {"Username": new_username})
                         if not new_username or not new_pwd or not bn or not mob or not em: st.error("All fields mandatory.")
                         elif not is_valid_mobile(mob): st.error("Invalid Mobile Number!")
                         elif not is_valid_email(em): st.error("Invalid Email Format!")
@@ -690,6 +548,16 @@ def main_app():
     st.sidebar.caption(f"User: {profile.get('Username', 'User')}")
     if st.sidebar.button("Logout"):
         st.session_state.user_id = None; st.session_state.user_profile = {}; st.session_state.auth_mode = "login"; st.rerun()
+    if st.query_params.get("debug"):
+        st.sidebar.caption("Storage cache"); st.sidebar.json(get_storage().stats())
+        st.sidebar.caption("Write-behind queue"); st.sidebar.json(get_outbox().stats())
+        st.sidebar.caption("PDF cache"); st.sidebar.json(get_pdf_cache().stats())
+        st.sidebar.caption("Thumbnails"); st.sidebar.json(get_thumb_store().stats())
+        st.sidebar.caption("Dashboard rollups"); st.sidebar.json(get_rollups().stats())
+        st.sidebar.caption("Customer balances"); st.sidebar.json(get_ledger().stats())
+        st.sidebar.caption("Stock"); st.sidebar.json(get_stock().stats())
+        st.sidebar.caption("Barcode decoder"); st.sidebar.json(get_barcode_decoder().stats())
+        st.sidebar.caption("Barcode index"); st.sidebar.json({"builds": get_barcode_registry().builds, "tenants": len(get_barcode_registry().entries)})
     
     # --- NAVIGATION LOGIC ---
     menu_options = ["Dashboard", "Customer Master", "Item Master", "Billing Master", "Ledger", "Inward", "Company Profile"]
@@ -705,12 +573,124 @@ def main_app():
 
     if choice == "Dashboard":
         st.header("📊 Dashboard")
-        df_inv = fetch_user_data("Invoices")
-        total_sales = 0
-        if not df_inv.empty and "Grand Total" in df_inv.columns: 
-            total_sales = pd.to_numeric(df_inv["Grand Total"], errors='coerce').sum()
-        st.metric("Total Sales", format_indian_currency(total_sales))
-        st.dataframe(df_inv.tail(5), use_container_width=True)
+        # Figures come from the daily/monthly rollups, so this page does not
+        # read the Invoices table unless the rollups need a (re)build.
+        uid = str(st.session_state.user_id)
+        rollups = get_rollups()
+        if not rollups.is_built(uid): rollups.rebuild(uid, fetch_user_data("Invoices"))
+        monthly = rollups.totals(uid, "month")
+        daily = rollups.totals(uid, "day", limit=DAILY_BUCKETS)
+        today_key = date.today().isoformat()
+        this_month = monthly[monthly["Bucket"] == today_key[:7]]
+        today = daily[daily["Bucket"] == today_key]
+        m1, m2, m3, m4 = st.columns(4)
+        m1.metric("Total Sales", format_indian_currency(monthly["Sales"].sum()))
+        m2.metric("This Month", format_indian_currency(this_month["Sales"].sum()))
+        m3.metric("Today", format_indian_currency(today["Sales"].sum()))
+        m4.metric("Invoices", f"{int(monthly['Invoices'].sum()):,}")
+
+        view = st.radio("Period", ["Daily", "Monthly"], horizontal=True, key="dash_period", label_visibility="collapsed")
+        frame, period = (daily, "day") if view == "Daily" else (monthly, "month")
+        if frame.empty: st.info("No invoices yet. Charts appear once you save your first invoice.")
+        else:
+            g1, g2 = st.columns([2, 1])
+            with g1:
+                st.markdown("**Sales**")
+                st.altair_chart(alt.Chart(frame).mark_bar().encode(
+                    x=alt.X("Bucket:O", title=None), y=alt.Y("Sales:Q", title="₹"),
+                    tooltip=["Bucket", alt.Tooltip("Sales:Q", format=",.2f"), "Invoices"]), use_container_width=True)
+                st.markdown("**Tax**")
+                taxes = frame.melt(id_vars="Bucket", value_vars=["CGST", "SGST", "IGST"], var_name="Tax", value_name="Amount")
+                st.altair_chart(alt.Chart(taxes).mark_bar().encode(
+                    x=alt.X("Bucket:O", title=None), y=alt.Y("Amount:Q", title="₹", stack=True), color="Tax:N",
+                    tooltip=["Bucket", "Tax", alt.Tooltip("Amount:Q", format=",.2f")]), use_container_width=True)
+            with g2:
+                st.markdown("**Payment Mode**")
+                modes = rollups.modes(uid, period, since=frame["Bucket"].iloc[0]).groupby("Mode", as_index=False)[["Sales", "Invoices"]].sum()
+                st.altair_chart(alt.Chart(modes).mark_arc(innerRadius=50).encode(
+                    theta="Sales:Q", color="Mode:N", tooltip=["Mode", alt.Tooltip("Sales:Q", format=",.2f"), "Invoices"]), use_container_width=True)
+        if st.button("🔄 Rebuild Figures", help="Recalculate the dashboard from all saved invoices"):
+            rollups.rebuild(uid, fetch_user_data("Invoices")); st.rerun()
+
+        if st.toggle("Show recent invoices", key="dash_recent"):
+            st.dataframe(fetch_user_data("Invoices").tail(5), use_container_width=True)
+        if st.toggle("Show item reports", key="dash_items"):
+            df_lines = fetch_user_data("InvoiceLines")
+            r1, r2 = st.columns(2)
+            with r1:
+                st.markdown("**Top Sellers**")
+                st.dataframe(top_sellers(df_lines), use_container_width=True, hide_index=True)
+            with r2:
+                st.markdown("**HSN-wise Turnover**")
+                st.dataframe(hsn_turnover(df_lines), use_container_width=True, hide_index=True)
+            l1, l2, l3 = st.columns(3)
+            if l1.button("Import lines from older invoices", help="Split the items of invoices saved before line storage into rows"):
+                result = migrate_invoice_lines(get_storage(), uid)
+                st.success(f"Imported {result['lines']:,} lines from {result['invoices']:,} invoices"); st.rerun()
+            storage, outbox = get_storage(), get_outbox()
+            for col, fmt in ((l2, "parquet"), (l3, "arrow")):
+                mime, ext = LINE_FORMATS[fmt]
+                build = lambda fmt=fmt: export_lines(storage, uid, fmt, extra_chunks=[outbox.pending_frame("InvoiceLines", uid)]).read()
+                col.download_button(f"⬇️ Lines ({ext.title()})", data=build, file_name=f"InvoiceLines.{ext}", mime=mime, use_container_width=True)
+        e1, e2, _ = st.columns([1, 1, 2])
+        with e1: export_download_button("⬇️ Invoices (Excel)", "Invoices", "MyInvoices")
+        with e2: export_download_button("⬇️ Invoices (CSV)", "Invoices", "MyInvoices", fmt="csv")
+
+        with st.expander("🖨️ Bulk Invoice PDFs"):
+            b1, b2 = st.columns(2)
+            bulk_from = b1.date_input("From", value=date.today().replace(day=1), format="DD/MM/YYYY", key="bulk_from")
+            bulk_to = b2.date_input("To", value=date.today(), format="DD/MM/YYYY", key="bulk_to")
+            df_cust = fetch_user_data("Customers")
+            buyer_names = sorted(df_cust["Name"].dropna().astype(str).unique()) if not df_cust.empty else []
+            bulk_buyers = st.multiselect("Customers (leave empty for all)", buyer_names, key="bulk_buyers")
+            bulk_fmt = st.radio("Output", ["ZIP of PDFs", "Single merged PDF"], horizontal=True, key="bulk_fmt")
+            if st.button("Prepare PDFs", disabled=monthly.empty):
+                # The rollups say how many invoices fall in the range, and the
+                # Invoices rows are streamed and filtered chunk by chunk.
+                days = rollups.totals(uid, "day")
+                expected = int(days.loc[days["Bucket"].between(bulk_from.isoformat(), bulk_to.isoformat()), "Invoices"].sum())
+                if not expected: st.warning("No invoices match these filters.")
+                else:
+                    fmt = "zip" if bulk_fmt == "ZIP of PDFs" else "pdf"
+                    bar = st.progress(0.0, text="Rendering invoices...")
+                    chunks = itertools.chain(get_storage().iter_user("Invoices", uid), [get_outbox().pending_frame("Invoices", uid)])
+                    # PDFs go straight to a temp file; only its path is kept in session_state.
+                    path = bulk_output_path(st.session_state.user_id, fmt)
+                    stats = bulk_generate_file(iter_invoice_jobs(profile, chunks, df_cust, bulk_from, bulk_to, bulk_buyers), path, fmt,
+                                               cache_dir=PDF_CACHE_DIR, total=expected,
+                                               progress=lambda done, total: bar.progress(min(done / total, 1.0), text=f"Rendering invoices... {done}"))
+                    if stats["invoices"]: st.session_state.bulk_pdf = {"path": path, "fmt": fmt, "stats": stats}
+                    else: st.warning("No invoices match these filters.")
+            bulk = st.session_state.get("bulk_pdf")
+            if bulk and os.path.exists(bulk["path"]):
+                s = bulk["stats"]
+                st.caption(f"{s['invoices']} invoices, {s['pages']} pages in {s['seconds']:.1f}s ({s['pages_per_sec']:.1f} pages/s)")
+                mime, ext = BULK_FORMATS[bulk["fmt"]]
+                def read_bulk(path=bulk["path"]):
+                    with open(path, "rb") as f: return f.read()
+                st.download_button("⬇️ Download", data=read_bulk, file_name=f"Invoices_{bulk_from:%Y%m%d}_{bulk_to:%Y%m%d}.{ext}", mime=mime)
+
+        with st.expander("🧾 GST Returns"):
+            # Months with sales come from the rollups; invoices, lines and
+            # customers are only read when a return is prepared.
+            months = monthly["Bucket"].iloc[::-1].tolist()
+            gst_month = st.selectbox("Tax period", months, format_func=lambda m: datetime.strptime(m, "%Y-%m").strftime("%B %Y"), key="gst_month")
+            if st.button("Prepare Returns", disabled=not months):
+                year, month = map(int, gst_month.split("-"))
+                fp = return_period(year, month)
+                report = build_returns(profile, fetch_user_data("Invoices"), fetch_user_data("Customers"), year, month, fetch_user_data("InvoiceLines"))
+                st.session_state.gst_returns = {"fp": fp, "summary": summary(report), "warnings": report["warnings"],
+                                                "gstr1": json.dumps(gstr1_json(profile, fp, report), indent=1), "gstr1_xlsx": gstr1_excel(report),
+                                                "gstr3b": json.dumps(gstr3b_json(profile, fp, report), indent=1)}
+            ret = st.session_state.get("gst_returns")
+            if ret:
+                st.dataframe(ret["summary"], use_container_width=True, hide_index=True)
+                for warning in ret["warnings"]: st.warning(warning)
+                stem = f"{profile.get('GSTIN') or st.session_state.user_id}_{ret['fp']}"
+                g1, g2, g3 = st.columns(3)
+                g1.download_button("⬇️ GSTR-1 (JSON)", data=ret["gstr1"], file_name=f"{stem}_GSTR1.json", mime="application/json", use_container_width=True)
+                g2.download_button("⬇️ GSTR-1 (Excel)", data=ret["gstr1_xlsx"], file_name=f"{stem}_GSTR1.xlsx", mime=EXPORT_MIME["xlsx"], use_container_width=True)
+                g3.download_button("⬇️ GSTR-3B (JSON)", data=ret["gstr3b"], file_name=f"{stem}_GSTR3B.json", mime="application/json", use_container_width=True)
 
     elif choice == "Customer Master":
         st.header("👥 Customers")
@@ -718,23 +698,24 @@ def main_app():
             c_downloads, c_upload = st.columns([1, 2])
             cust_cols = ["Name", "GSTIN", "Address 1", "Address 2", "Address 3", "State", "Mobile", "Email"]
             with c_downloads:
-                cust_df = fetch_user_data("Customers")
-                if not cust_df.empty and all(col in cust_df.columns for col in cust_cols): final_export = cust_df[cust_cols]
-                else: final_export = pd.DataFrame(columns=cust_cols)
-                excel_data = to_excel_bytes(final_export)
-                st.download_button("⬇️ Download Data (Excel)", data=excel_data, file_name="MyCustomers.xlsx", mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", use_container_width=True)
+                export_download_button("⬇️ Download Data (Excel)", "Customers", "MyCustomers")
                 st.write("")
-                template_df = pd.DataFrame(columns=cust_cols)
-                template_bytes = to_excel_bytes(template_df)
-                st.download_button("📄 Download Import Template", data=template_bytes, file_name="Import_Template.xlsx", mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", use_container_width=True)
+                st.download_button("📄 Download Import Template", data=lambda: to_excel_bytes(pd.DataFrame(columns=cust_cols)), file_name="Import_Template.xlsx", mime=EXPORT_MIME["xlsx"], use_container_width=True)
             with c_upload:
                 uploaded_file = st.file_uploader("⬆️ Upload Excel", type=["xlsx", "xls"])
                 if uploaded_file is not None:
-                    try:
-                        imp_df = pd.read_excel(uploaded_file)
-                        if st.button("Confirm Import", type="primary"):
-                            if save_bulk_data("Customers", imp_df): st.success("Customers Imported Successfully!"); time.sleep(1); st.rerun()
-                    except Exception as e: st.error(f"Error reading file: {e}")
+                    if st.button("Confirm Import", type="primary"):
+                        bar = st.progress(0.0, text="Importing customers...")
+                        def show_progress(done, total): bar.progress(min(done / total, 1.0) if total else 1.0, text=f"Imported {done:,} of {total:,} rows")
+                        try:
+                            result = import_customers(get_storage(), uploaded_file, st.session_state.user_id, progress=show_progress, file_name=uploaded_file.name)
+                            bar.progress(1.0, text="Import complete")
+                            if result["resumed_from"]: st.info(f"Resumed an earlier import after row {result['resumed_from']:,}.")
+                            st.success(f"Customers Imported: {result['imported']:,} | Rejected: {result['rejected']:,}")
+                            if not result["errors"].empty:
+                                st.dataframe(result["errors"].head(100), use_container_width=True)
+                                st.download_button("⬇️ Download Error Report", data=result["errors"].to_csv(index=False), file_name="Import_Errors.csv", mime="text/csv")
+                        except Exception as e: st.error(f"Import stopped: {e}. Upload the same file again to resume.")
 
         with st.expander("➕ Add New Customer", expanded=True):
             st.markdown("### Basic Details")
@@ -756,10 +737,13 @@ def main_app():
             email = c2.text_input("Email")
             st.write("")
             if st.button("Save Customer Data", type="primary"):
+                c_gst = c_gst.strip().upper()
+                cust_errors = validate_columns(pd.DataFrame([{"GSTIN": c_gst, "Mobile": mob, "Email": email}]), CUSTOMER_RULES).iloc[0]
                 if not c_name: st.error("Customer Name is required.")
+                elif cust_errors: st.error(cust_errors)
                 else:
                     if save_row_to_sheet("Customers", {
-                        "Name": c_name, "GSTIN": c_gst, "Address 1": addr1, "Address 2": addr2, "Address 3": addr3, "State": state_val, "Mobile": mob, "Email": email
+                        "Name": c_name, "GSTIN": c_gst, "Address 1": addr1, "Address 2": addr2, "Address 3": addr3, "State": state_val or gstin_state(c_gst), "Mobile": mob, "Email": email
                     }):
                         st.success("Customer Saved Successfully!"); time.sleep(1); st.rerun()
 
@@ -770,6 +754,17 @@ def main_app():
 
     elif choice == "Item Master":
         st.header("📦 Item Master")
+
+        # Edit buttons fill the form through a callback, before its widgets exist.
+        def load_item_for_edit(row):
+            clean = lambda v: '' if str(v) == 'nan' else str(v)
+            st.session_state.im_name_input = row['Item Name']
+            st.session_state.im_price_input = float(row['Price']) if clean(row['Price']) else 0.0
+            st.session_state.im_hsn_input = clean(row.get('HSN', ''))
+            st.session_state.im_barcode_input = clean(row.get('Barcode', ''))
+            st.session_state.im_weight_input = clean(row.get('Weight', ''))
+            st.session_state.im_edit_name = row['Item Name']
+            st.session_state.im_edit_key = item_key(fetch_user_data("Items"), row)
         
         # --- ADD ITEM SECTION ---
         with st.expander("➕ Add New Item", expanded=True):
@@ -787,21 +782,35 @@ def main_app():
                 item_hsn = ic4.text_input("HSN/SAC Code", key="im_hsn_input")
                 item_bar = ic5.text_input("Barcode (Opt)", key="im_barcode_input")
                 
+            if st.session_state.im_edit_name:
+                st.caption(f"✏️ Editing **{st.session_state.im_edit_name}** — saving updates this item in place.")
             if st.button("Save Item", type="primary"):
                 if not item_name: st.error("Item Name is required")
                 else:
-                    img_str = image_to_base64(item_img) if item_img else ""
-                    if save_row_to_sheet("Items", {
+                    img_str = get_thumb_store().put(item_img) if item_img else ""
+                    item_row = {
                         "Item Name": item_name, "Price": item_price, "UOM": item_uom, 
                         "HSN": item_hsn, "Image": img_str, "Barcode": item_bar, "Weight": item_weight
-                    }):
+                    }
+                    if st.session_state.im_edit_name:
+                        if not item_img: del item_row["Image"]
+                        if st.session_state.im_edit_key is None:
+                            st.error(f"More than one item is named {st.session_state.im_edit_name} with the same barcode, so it cannot be edited in place.")
+                            saved = False
+                        else: saved = update_rows("Items", st.session_state.im_edit_key, item_row)
+                    else: saved = save_row_to_sheet("Items", item_row)
+                    if saved:
                         st.success("Item Saved!")
                         keys_to_clear = ["im_name_input", "im_price_input", "im_hsn_input", "im_barcode_input", "im_weight_input"]
                         for k in keys_to_clear:
                              if k in st.session_state: del st.session_state[k]
+                        st.session_state.im_edit_name = None
+                        st.session_state.im_edit_key = None
                         time.sleep(1); st.rerun()
         
         st.divider()
+        _, c_export = st.columns([3, 1])
+        with c_export: export_download_button("⬇️ Download Items (Excel)", "Items", "MyItems")
         tab_list, tab_bar = st.tabs(["📋 Item List", "🆔 Barcode List"])
         
         df_items = fetch_user_data("Items")
@@ -819,8 +828,9 @@ def main_app():
                         with st.container(border=True):
                             c_img, c_det, c_act = st.columns([1, 3, 1])
                             with c_img:
-                                if row.get("Image"):
-                                    try: st.image(base64_to_image(row["Image"]), width=60)
+                                thumb = get_thumb_store().get(row.get("Image"))
+                                if thumb:
+                                    try: st.image(thumb, width=60)
                                     except: st.write("No Img")
                                 else: st.write("No Img")
                             
@@ -829,18 +839,10 @@ def main_app():
                                 st.caption(f"Price: ₹{row['Price']} | HSN: {row.get('HSN','')} | UOM: {row['UOM']}")
                             
                             with c_act:
-                                if st.button("✏️ Edit", key=f"edit_list_{i}"):
-                                    st.session_state.im_name_input = row['Item Name']
-                                    st.session_state.im_price_input = float(row['Price'])
-                                    st.session_state.im_hsn_input = row.get('HSN', '')
-                                    st.session_state.im_barcode_input = row.get('Barcode', '')
-                                    st.session_state.im_weight_input = row.get('Weight', '')
+                                if st.button("✏️ Edit", key=f"edit_list_{i}", on_click=load_item_for_edit, args=(row,)):
                                     st.toast("Loaded above.", icon="✏️")
-                                    st.rerun()
                                 if st.button("🗑️ Delete", key=f"del_list_{i}"):
-                                    new_df = df_items.drop(index=i)
-                                    save_bulk_data("Items", new_df)
-                                    st.rerun()
+                                    delete_item(df_items, row)
                 else:
                     st.info("No General Items found.")
 
@@ -856,16 +858,10 @@ def main_app():
                             c1, c2, c3 = st.columns([3, 1, 1])
                             c1.markdown(f"**{row['Item Name']}** (Code: {row['Barcode']})")
                             c1.caption(f"Price: {row['Price']} | Wt: {row.get('Weight','')}")
-                            if c2.button("✏️", key=f"b_edit_{i}"):
-                                st.session_state.im_name_input = row['Item Name']
-                                st.session_state.im_price_input = float(row['Price'])
-                                st.session_state.im_barcode_input = row['Barcode']
+                            if c2.button("✏️", key=f"b_edit_{i}", on_click=load_item_for_edit, args=(row,)):
                                 st.toast("Loaded above.", icon="✏️")
-                                st.rerun()
                             if c3.button("🗑️", key=f"b_del_{i}"):
-                                new_df = df_items.drop(index=i)
-                                save_bulk_data("Items", new_df)
-                                st.rerun()
+                                delete_item(df_items, row)
                 else:
                     st.info("No Barcode Items found.")
 
@@ -876,6 +872,7 @@ def main_app():
              st.markdown(f"<div class='bill-header'>🧾 Retail POS</div>", unsafe_allow_html=True)
              df_cust = fetch_user_data("Customers")
              df_items = fetch_user_data("Items")
+             stock_level = partial(stock_store().level, str(st.session_state.user_id))
              
              # TOP SECTION (Identical to Customized)
              c1, c2, c3 = st.columns([0.60, 0.15, 0.25], vertical_alignment="bottom")
@@ -906,14 +903,15 @@ def main_app():
              st.divider()
 
              c_scan_btn, c_scan_res = st.columns([0.2, 0.8], vertical_alignment="bottom")
-             if c_scan_btn.toggle("📷 Camera", key="open_cam_ret"):
+             live_scan = c_scan_res.toggle("⚡ Live Scan", key="live_scan_ret", help="Keep the camera open and add every scanned item to the cart")
+             if live_scan: render_live_scanner(df_items)
+             if c_scan_btn.toggle("📷 Camera", key="open_cam_ret") and not live_scan:
                  if zxingcpp is None:
                      st.error("Barcode library (zxing-cpp) not found. Please add to requirements.txt")
                  else:
                      img_file = st.camera_input("Scan Barcode")
                      if img_file:
-                         img_pil = Image.open(img_file)
-                         detected_code = robust_barcode_decode(img_pil)
+                         detected_code = robust_barcode_decode(img_file)
                          
                          if detected_code:
                              st.session_state.retail_scanner = detected_code
@@ -927,19 +925,16 @@ def main_app():
                  # Clean Input
                  clean_scan = str(scan_code).strip()
                  
-                 # Ensure DB Barcode column is string for comparison
-                 df_items['Barcode'] = df_items['Barcode'].fillna('').astype(str).str.strip()
-                 
-                 found_item = df_items[df_items['Barcode'] == clean_scan]
+                 item_data = barcode_index(df_items).lookup(clean_scan)
                  
-                 if not found_item.empty:
+                 if item_data is not None:
                      # Item Found
-                     item_data = found_item.iloc[0]
                      
                      # UI for Found Item
                      with st.container(border=True):
                          col_f_1, col_f_2 = st.columns([3, 1])
                          col_f_1.success(f"**{item_data['Item Name']}** found! Price: ₹{item_data['Price']}")
+                         with col_f_1: stock_caption(stock_level(item_data['Item Name']))
                          
                          # Add Button logic
                          if col_f_2.button("Add to Cart", type="primary", key="add_scanned_item"):
@@ -966,10 +961,13 @@ def main_app():
                              if st.form_submit_button("Save & Add to Cart"):
                                  if new_name:
                                      # Save to DB
-                                     save_row_to_sheet("Items", {
+                                     new_item = {
                                          "Item Name": new_name, "Price": new_price, "UOM": "PCS", 
                                          "HSN": new_hsn, "Image": "", "Barcode": clean_scan, "Weight": new_weight
-                                     })
+                                     }
+                                     if save_row_to_sheet("Items", new_item):
+                                         uid = str(st.session_state["user_id"])
+                                         get_barcode_registry().add(uid, get_storage().version("Items", uid), new_item)
                                      # Add to Cart
                                      st.session_state.pos_cart.append({
                                         "Description": new_name, "HSN": new_hsn, "Qty": 1.0, "UOM": "PCS",
@@ -986,49 +984,7 @@ def main_app():
              with col_menu:
                 st.subheader("📦 Select Items")
                 if not df_items.empty:
-                    cols = st.columns(3)
-                    for i, row in df_items.iterrows():
-                        with cols[i % 3]:
-                            with st.container(border=True):
-                                if row.get("Image"):
-                                    try: st.image(base64_to_image(row["Image"]), use_container_width=True)
-                                    except: pass
-                                st.markdown(f"**{row['Item Name']}**")
-                                st.markdown(f"<span class='product-price'>₹ {row['Price']}</span>", unsafe_allow_html=True)
-                                
-                                cart_item = next((item for item in st.session_state.pos_cart if item['Description'] == row['Item Name']), None)
-                                
-                                if cart_item:
-                                    b_minus, b_qty, b_plus = st.columns([1, 1, 1], vertical_alignment="center")
-                                    if b_minus.button("➖", key=f"ret_minus_{i}", use_container_width=True):
-                                        idx = st.session_state.pos_cart.index(cart_item)
-                                        if st.session_state.pos_cart[idx]['Qty'] > 1:
-                                            st.session_state.pos_cart[idx]['Qty'] -= 1
-                                        else:
-                                            st.session_state.pos_cart.pop(idx)
-                                        
-                                        if idx < len(st.session_state.pos_cart):
-                                             st.session_state[f"ret_qty_{idx}"] = st.session_state.pos_cart[idx]['Qty']
-                                        st.rerun()
-                                    
-                                    b_qty.markdown(f"<div style='text-align:center; font-weight:bold;'>{int(cart_item['Qty'])}</div>", unsafe_allow_html=True)
-                                    
-                                    if b_plus.button("➕", key=f"ret_plus_{i}", use_container_width=True):
-                                        idx = st.session_state.pos_cart.index(cart_item)
-                                        st.session_state.pos_cart[idx]['Qty'] += 1
-                                        st.session_state[f"ret_qty_{idx}"] = st.session_state.pos_cart[idx]['Qty']
-                                        st.rerun()
-                                else:
-                                    if st.button("Add", key=f"ret_add_{i}", use_container_width=True):
-                                        st.session_state.pos_cart.append({
-                                            "Description": row['Item Name'],
-                                            "HSN": row.get('HSN', ''),
-                                            "Qty": 1.0,
-                                            "UOM": row.get('UOM', 'PCS'),
-                                            "Rate": float(row['Price']),
-                                            "GST Rate": 0.0
-                                        })
-                                        st.rerun()
+                    render_product_grid(df_items, "ret_", "ret_qty_", stock=stock_level)
                 else:
                     st.info("No items found.")
 
@@ -1057,6 +1013,8 @@ def main_app():
                             
                             st.session_state.pos_cart[idx]['Qty'] = new_qty
                             st.session_state.pos_cart[idx]['Rate'] = new_rate
+                            on_hand = stock_level(item['Description'])
+                            if on_hand is not None and new_qty > on_hand: st.caption(f":orange[Only {max(on_hand, 0):g} in stock]")
                             
                             total_taxable += (new_qty * new_rate)
                     
@@ -1084,11 +1042,10 @@ def main_app():
                                 "CGST": 0, "SGST": 0, "IGST": 0
                             }
                              
-                             if save_row_to_sheet("Invoices", db_row):
+                             if queue_invoice(db_row):
                                  firm_name = profile.get('Business Name', 'Our Firm')
                                  msg_body = f"""Hi {sel_cust_name}, Invoice {inv_no} from {firm_name} generated."""
                                  
-                                 pdf_buffer = io.BytesIO()
                                  buyer_data = df_cust[df_cust["Name"] == sel_cust_name].iloc[0].to_dict()
                                  buyer_data['Date'] = inv_date_str
                                  buyer_data['POS Code'] = '24'
@@ -1096,8 +1053,7 @@ def main_app():
                                  
                                  totals = {'taxable': total_taxable, 'cgst': 0, 'sgst': 0, 'igst': 0, 'total': grand_total, 'is_intra': True}
                                  
-                                 generate_pdf(profile, buyer_data, st.session_state.pos_cart, inv_no, pdf_buffer, totals)
-                                 pdf_buffer.seek(0)
+                                 pdf_buffer = io.BytesIO(render_pdf_bytes(profile, buyer_data, st.session_state.pos_cart, inv_no, totals, cache=get_pdf_cache()))
                                  
                                  st.session_state.last_generated_invoice = {
                                     "no": inv_no, "pdf_bytes": pdf_buffer,
@@ -1105,6 +1061,7 @@ def main_app():
                                     "mail_link": None
                                 }
                                  st.session_state.pos_cart = []
+                                 st.session_state.bm_invoice_no = ""; st.session_state.pop("bm_inv_val_pos_ret", None)
                                  st.rerun()
                  else:
                      st.caption("Cart is Empty")
@@ -1153,50 +1110,7 @@ def main_app():
             with col_menu:
                 st.subheader("📦 Select Items")
                 if not df_items.empty:
-                    cols = st.columns(3)
-                    for i, row in df_items.iterrows():
-                        with cols[i % 3]:
-                            with st.container(border=True):
-                                if row.get("Image"):
-                                    try: st.image(base64_to_image(row["Image"]), use_container_width=True)
-                                    except: pass
-                                st.markdown(f"**{row['Item Name']}**")
-                                st.markdown(f"<span class='product-price'>₹ {row['Price']}</span>", unsafe_allow_html=True)
-                                
-                                cart_item = next((item for item in st.session_state.pos_cart if item['Description'] == row['Item Name']), None)
-                                
-                                if cart_item:
-                                    b_minus, b_qty, b_plus = st.columns([1, 1, 1], vertical_alignment="center")
-                                    if b_minus.button("➖", key=f"minus_{i}", use_container_width=True):
-                                        idx = st.session_state.pos_cart.index(cart_item)
-                                        if st.session_state.pos_cart[idx]['Qty'] > 1:
-                                            st.session_state.pos_cart[idx]['Qty'] -= 1
-                                        else:
-                                            st.session_state.pos_cart.pop(idx)
-                                        
-                                        # Force Update Checkout Input
-                                        if idx < len(st.session_state.pos_cart):
-                                             st.session_state[f"cart_qty_{idx}"] = st.session_state.pos_cart[idx]['Qty']
-                                        st.rerun()
-                                    
-                                    b_qty.markdown(f"<div style='text-align:center; font-weight:bold;'>{int(cart_item['Qty'])}</div>", unsafe_allow_html=True)
-                                    
-                                    if b_plus.button("➕", key=f"plus_{i}", use_container_width=True):
-                                        idx = st.session_state.pos_cart.index(cart_item)
-                                        st.session_state.pos_cart[idx]['Qty'] += 1
-                                        st.session_state[f"cart_qty_{idx}"] = st.session_state.pos_cart[idx]['Qty']
-                                        st.rerun()
-                                else:
-                                    if st.button("Add", key=f"add_{i}", use_container_width=True):
-                                        st.session_state.pos_cart.append({
-                                            "Description": row['Item Name'],
-                                            "HSN": row.get('HSN', ''),
-                                            "Qty": 1.0,
-                                            "UOM": row.get('UOM', 'PCS'),
-                                            "Rate": float(row['Price']),
-                                            "GST Rate": 0.0
-                                        })
-                                        st.rerun()
+                    render_product_grid(df_items, "", "cart_qty_")
                 else:
                     st.info("No items found. Go to Item Master to add products.")
 
@@ -1257,11 +1171,10 @@ def main_app():
                                 "CGST": 0, "SGST": 0, "IGST": 0
                             }
                              
-                             if save_row_to_sheet("Invoices", db_row):
+                             if queue_invoice(db_row):
                                  firm_name = profile.get('Business Name', 'Our Firm')
                                  msg_body = f"""Hi {sel_cust_name}, Invoice {inv_no} from {firm_name} generated."""
                                  
-                                 pdf_buffer = io.BytesIO()
                                  buyer_data = df_cust[df_cust["Name"] == sel_cust_name].iloc[0].to_dict()
                                  buyer_data['Date'] = inv_date_str
                                  buyer_data['POS Code'] = '24'
@@ -1269,8 +1182,7 @@ def main_app():
                                  
                                  totals = {'taxable': total_taxable, 'cgst': 0, 'sgst': 0, 'igst': 0, 'total': grand_total, 'is_intra': True}
                                  
-                                 generate_pdf(profile, buyer_data, st.session_state.pos_cart, inv_no, pdf_buffer, totals)
-                                 pdf_buffer.seek(0)
+                                 pdf_buffer = io.BytesIO(render_pdf_bytes(profile, buyer_data, st.session_state.pos_cart, inv_no, totals, cache=get_pdf_cache()))
                                  
                                  st.session_state.last_generated_invoice = {
                                     "no": inv_no, "pdf_bytes": pdf_buffer,
@@ -1278,6 +1190,7 @@ def main_app():
                                     "mail_link": None
                                 }
                                  st.session_state.pos_cart = []
+                                 st.session_state.bm_invoice_no = ""; st.session_state.pop("bm_inv_val_pos", None)
                                  st.rerun()
                 else:
                     st.caption("Cart is Empty")
@@ -1375,16 +1288,6 @@ def main_app():
             )
 
             valid_items = edited_items[edited_items["Description"] != ""].copy()
-            valid_items["Qty"] = pd.to_numeric(valid_items["Qty"], errors='coerce').fillna(0)
-            valid_items["Rate"] = pd.to_numeric(valid_items["Rate"], errors='coerce').fillna(0)
-            valid_items["GST Rate"] = pd.to_numeric(valid_items["GST Rate"], errors='coerce').fillna(0)
-            
-            valid_items["Base Amount"] = valid_items["Qty"] * valid_items["Rate"]
-            valid_items["Tax Amount"] = valid_items["Base Amount"] * (valid_items["GST Rate"] / 100)
-            
-            total_taxable = valid_items["Base Amount"].sum()
-            total_tax_val = valid_items["Tax Amount"].sum()
-            grand_total = total_taxable + total_tax_val
             
             user_state = profile.get("State", "").strip().lower()
             cust_state_clean = cust_state.strip().lower()
@@ -1395,13 +1298,16 @@ def main_app():
                 if user_gstin[:2] != cust_gstin[:2]: is_inter_state = True
             elif user_state and cust_state_clean:
                 if user_state != cust_state_clean: is_inter_state = True
-                
-            cgst_val = 0.0; sgst_val = 0.0; igst_val = 0.0
-            if is_inter_state: igst_val = total_tax_val
-            else: cgst_val = total_tax_val / 2; sgst_val = total_tax_val / 2
+
+            valid_items, hsn_summary, tax_totals = compute_invoice_tax(valid_items, is_intra=not is_inter_state)
+            total_taxable = tax_totals["taxable"]; grand_total = tax_totals["total"]
+            cgst_val = tax_totals["cgst"]; sgst_val = tax_totals["sgst"]; igst_val = tax_totals["igst"]
 
             st.write("")
             c_spacer, c_totals = st.columns([1.5, 1])
+            if profile.get("Is GST") == "Yes" and not valid_items.empty:
+                c_spacer.caption("HSN/SAC Summary")
+                c_spacer.dataframe(hsn_summary, hide_index=True, use_container_width=True)
             
             with c_totals:
                 gst_label = "IGST" if is_inter_state else "CGST+SGST"
@@ -1446,7 +1352,7 @@ def main_app():
                             "Ship Addr1": ship_data.get("Addr1",""), "Ship Addr2": ship_data.get("Addr2",""), "Ship Addr3": ship_data.get("Addr3","")
                         }
                         
-                        if save_row_to_sheet("Invoices", db_row):
+                        if queue_invoice(db_row):
                             firm_name = profile.get('Business Name', 'Our Firm')
                             contact = f"{profile.get('Mobile','')}"
                             msg_body = f"""Hi *{sel_cust_name}*,
@@ -1463,16 +1369,8 @@ This mail is autogenerated through the *HisaabKeeper! Billing Software*.
 
 To get demo or Free trial connect us on hello.hisaabkeeper@gmail.com or whatsapp us on +91 6353953790"""
                             
-                            pdf_buffer = io.BytesIO()
                             
-                            totals_for_pdf = {
-                                'taxable': total_taxable, 
-                                'cgst': cgst_val, 
-                                'sgst': sgst_val, 
-                                'igst': igst_val, 
-                                'total': grand_total,
-                                'is_intra': not is_inter_state 
-                            }
+                            totals_for_pdf = tax_totals
                             
                             profile['Template'] = profile.get('Template', 'Simple')
                             buyer_data_for_pdf = df_cust[df_cust["Name"] == sel_cust_name].iloc[0].to_dict()
@@ -1481,11 +1379,10 @@ To get demo or Free trial connect us on hello.hisaabkeeper@gmail.com or whatsapp
                             else: buyer_data_for_pdf['POS Code'] = "24" 
                             buyer_data_for_pdf['Shipping'] = ship_data 
 
-                            generate_pdf(profile, buyer_data_for_pdf, 
-                                         valid_items.to_dict('records'), inv_no, pdf_buffer, 
-                                         totals_for_pdf, is_letterhead=False) 
+                            pdf_buffer = io.BytesIO(render_pdf_bytes(profile, buyer_data_for_pdf, 
+                                         valid_items.to_dict('records'), inv_no, 
+                                         totals_for_pdf, is_letterhead=False, cache=get_pdf_cache()))
                             
-                            pdf_buffer.seek(0)
                             
                             st.session_state.last_generated_invoice = {
                                 "no": inv_no, 
@@ -1518,5 +1415,121 @@ To get demo or Free trial connect us on hello.hisaabkeeper@gmail.com or whatsapp
                     st.session_state.last_generated_invoice = None
                     st.rerun()
 
+    elif choice == "Ledger":
+        st.header("📒 Customer Ledger")
+        # The outstanding list comes from the balance cache; invoice and
+        # receipt history is read only for a statement or the ageing report.
+        uid = str(st.session_state.user_id)
+        ledger = get_ledger()
+        if not ledger.is_built(uid): ledger.rebuild(uid, fetch_user_data("Invoices"), fetch_user_data("Receipts"))
+        balances = ledger.balances(uid)
+        due, advances = balances[balances["Balance"] > 0], balances[balances["Balance"] < 0]
+        m1, m2, m3 = st.columns(3)
+        m1.metric("Total Outstanding", format_indian_currency(due["Balance"].sum()))
+        m2.metric("Parties with Balance", f"{len(due):,}")
+        m3.metric("Advances Held", format_indian_currency(abs(advances["Balance"].sum())))
+
+        with st.expander("💰 Record Receipt", expanded=False):
+            df_cust = fetch_user_data("Customers")
+            parties = sorted(set(df_cust["Name"].dropna().astype(str)) | set(balances["Party"])) if not df_cust.empty else balances["Party"].tolist()
+            with st.form("receipt_form", clear_on_submit=True):
+                r1, r2 = st.columns(2)
+                rec_party = r1.selectbox("Party", parties, index=None, placeholder="Select customer")
+                rec_date = r2.date_input("Date", value=date.today(), format="DD/MM/YYYY")
+                r3, r4 = st.columns(2)
+                rec_amount = r3.number_input("Amount", min_value=0.0, step=100.0)
+                rec_mode = r4.radio("Mode", RECEIPT_MODES, horizontal=True)
+                rec_note = st.text_input("Note (cheque no., UTR, ...)")
+                if st.form_submit_button("Save Receipt", type="primary"):
+                    if not rec_party: st.error("Please select a party.")
+                    elif rec_amount <= 0: st.error("Amount must be greater than zero.")
+                    elif queue_receipt({"UserID": uid, "Date": rec_date.strftime("%d/%m/%Y"), "Party Name": rec_party, "Amount": rec_amount,
+                                        "Note": rec_note, "Receipt No": datetime.now().strftime("RCT-%y%m%d%H%M%S%f")[:-3], "Mode": rec_mode}):
+                        st.success(f"Receipt of {format_indian_currency(rec_amount)} from {rec_party} saved."); time.sleep(1); st.rerun()
+
+        show_all = st.toggle("Include settled parties", key="ledger_all")
+        view = balances if show_all else balances[balances["Balance"] != 0]
+        if view.empty: st.info("No outstanding balances. Invoices saved with Payment Mode \"Credit\" appear here.")
+        else: st.dataframe(view, use_container_width=True, hide_index=True, column_config={c: st.column_config.NumberColumn(format="%.2f") for c in ("Invoiced", "Received", "Balance")})
+
+        stmt_party = st.selectbox("Party Statement", balances["Party"].tolist(), index=None, placeholder="Select a party to see its statement", key="ledger_party")
+        show_ageing = st.toggle("Show ageing", key="ledger_ageing")
+        if stmt_party or show_ageing:
+            entries = ledger_entries(fetch_user_data("Invoices"), fetch_user_data("Receipts"))
+            if stmt_party:
+                stmt = party_statement(entries, stmt_party)
+                st.markdown(f"**{stmt_party}** — closing balance {format_indian_currency(stmt['Balance'].iloc[-1] if not stmt.empty else 0)}")
+                st.dataframe(stmt, use_container_width=True, hide_index=True)
+                st.download_button("⬇️ Statement (CSV)", data=lambda: stmt.to_csv(index=False).encode("utf-8"), file_name=f"Statement_{stmt_party}.csv", mime=EXPORT_MIME["csv"])
+            if show_ageing:
+                st.markdown("**Ageing (days since invoice)**")
+                st.dataframe(ageing(entries), use_container_width=True, hide_index=True)
+        if st.button("🔄 Rebuild Balances", help="Recalculate balances from all saved invoices and receipts"):
+            ledger.rebuild(uid, fetch_user_data("Invoices"), fetch_user_data("Receipts")); st.rerun()
+
+    elif choice == "Inward":
+        st.header("📥 Inward (Purchases)")
+        uid = str(st.session_state.user_id)
+        df_items = fetch_user_data("Items")
+        stock = stock_store()
+        item_names = df_items["Item Name"].dropna().astype(str).tolist() if not df_items.empty else []
+        uoms = dict(zip(item_names, df_items["UOM"].fillna("").astype(str))) if item_names else {}
+
+        with st.expander("➕ New Purchase Entry", expanded=True):
+            h1, h2, h3 = st.columns([2, 1, 1])
+            df_inward = fetch_user_data("Inward")
+            suppliers = sorted(df_inward["Supplier Name"].dropna().astype(str).unique()) if not df_inward.empty else []
+            supplier = h1.selectbox("Supplier", suppliers, index=None, accept_new_options=True, placeholder="Select or type a supplier", key="inw_supplier")
+            inw_date = h2.date_input("Date", value=date.today(), format="DD/MM/YYYY", key="inw_date")
+            supplier_bill = h3.text_input("Supplier Bill No", key="inw_bill")
+
+            l1, l2, l3, l4 = st.columns([3, 1, 1, 1], vertical_alignment="bottom")
+            line_item = l1.selectbox("Item", item_names, index=None, placeholder="Select item", key="inw_item")
+            line_qty = l2.number_input("Qty", min_value=0.0, value=1.0, key="inw_qty")
+            line_rate = l3.number_input("Rate", min_value=0.0, key="inw_rate")
+            if l4.button("Add Line", use_container_width=True, disabled=not line_item):
+                st.session_state.inward_items.append({"Item Name": line_item, "Qty": line_qty, "UOM": uoms.get(line_item, ""), "Rate": line_rate})
+                st.rerun()
+
+            lines = st.session_state.inward_items
+            if lines:
+                for idx, line in enumerate(lines):
+                    c_name, c_qty, c_amt, c_del = st.columns([3, 1, 1, 1], vertical_alignment="center")
+                    c_name.write(f"**{line['Item Name']}**")
+                    c_qty.write(f"{line['Qty']:g} {line['UOM']} × ₹{line['Rate']:g}")
+                    c_amt.write(format_indian_currency(line['Qty'] * line['Rate']))
+                    if c_del.button("🗑️", key=f"inw_del_{idx}"):
+                        lines.pop(idx); st.rerun()
+                total_value = sum(line['Qty'] * line['Rate'] for line in lines)
+                st.markdown(f"### Total: {format_indian_currency(total_value)}")
+                if st.button("💾 Save Purchase", type="primary"):
+                    if not supplier: st.error("Select or enter a supplier.")
+                    else:
+                        header = {"UserID": uid, "Date": inw_date.strftime("%d/%m/%Y"), "Supplier Name": supplier, "Total Value": round(total_value, 2),
+                                  "Inward No": datetime.now().strftime("INW-%y%m%d%H%M%S%f")[:-3], "Supplier Bill No": supplier_bill}
+                        if queue_inward(header, lines):
+                            st.session_state.inward_items = []
+                            st.success(f"Purchase from {supplier} saved."); time.sleep(1); st.rerun()
+            else: st.info("Add the items received to record a purchase.")
+
+        st.subheader("📦 Stock on Hand")
+        # Levels come from the stock cache, which every invoice and purchase
+        # updates as it is saved.
+        df_stock = stock.on_hand(uid, df_items)
+        s1, s2, s3 = st.columns(3)
+        s1.metric("Items in Stock", f"{int((df_stock['On Hand'] > 0).sum()):,}")
+        s2.metric("Low Stock", f"{int(((df_stock['On Hand'] > 0) & (df_stock['On Hand'] <= LOW_STOCK)).sum()):,}")
+        s3.metric("Out of Stock", f"{int((df_stock['On Hand'] <= 0).sum()):,}")
+        stock_search = st.text_input("🔍 Search Stock", key="stock_search", placeholder="Item name")
+        if stock_search: df_stock = df_stock[df_stock["Item"].str.contains(stock_search, case=False, regex=False)]
+        st.dataframe(df_stock, use_container_width=True, hide_index=True)
+
+        if st.toggle("Show purchase register", key="inw_register"):
+            df_inward = fetch_user_data("Inward")
+            if df_inward.empty: st.info("No purchases recorded yet.")
+            else: st.dataframe(df_inward[["Date", "Inward No", "Supplier Name", "Supplier Bill No", "Total Value"]].iloc[::-1], use_container_width=True, hide_index=True)
+        if st.button("🔄 Rebuild Stock", help="Recalculate stock from all saved purchases and invoices"):
+            stock.rebuild(uid, fetch_user_data("Invoices"), fetch_user_data("InvoiceLines"), fetch_user_data("InwardLines")); st.rerun()
+
 if st.session_state.user_id: main_app()
 else: login_page()
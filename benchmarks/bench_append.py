@@ -0,0 +1,98 @@
+"""Save latency vs. sheet size: legacy read-modify-write against append_rows.
+
+The fake connection serialises every payload to JSON the way the Sheets API
+does, so timings and byte counts scale with the data actually sent.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from hk_storage import SCHEMA, append_rows, forget_sheet_header, rows_to_values  # noqa: E402
+
+
+class FakeWorksheet:
+    def __init__(self, conn, name):
+        self.conn = conn; self.name = name
+
+    def row_values(self, n):
+        return list(self.conn.sheets.get(self.name, [[]])[n - 1])
+
+    def update(self, range_name, values=None, **kwargs):
+        self.conn.wire(values)
+
+    def append_rows(self, values, **kwargs):
+        self.conn.sheets[self.name].extend(self.conn.wire(values))
+
+
+class FakeClient:
+    def __init__(self, conn): self.conn = conn
+    def _select_worksheet(self, worksheet=None): return FakeWorksheet(self.conn, worksheet)
+
+
+class FakeSheetsConnection:
+    def __init__(self):
+        self.sheets = {}; self.bytes_moved = 0; self.client = FakeClient(self)
+
+    def wire(self, values):
+        payload = json.dumps(values, default=str)
+        self.bytes_moved += len(payload)
+        return json.loads(payload)
+
+    def read(self, worksheet=None, ttl=0):
+        values = self.wire(self.sheets[worksheet])
+        return pd.DataFrame(values[1:], columns=values[0])
+
+    def update(self, worksheet=None, data=None):
+        self.sheets[worksheet] = self.wire([list(data.columns)] + data.values.tolist())
+
+    def create(self, worksheet=None, data=None): self.update(worksheet=worksheet, data=data)
+
+
+def invoice_row(i):
+    items = [{"Description": f"Item {j}", "HSN": "1006", "Qty": 2.0, "UOM": "PCS", "Rate": 45.5, "GST Rate": 5.0} for j in range(5)]
+    return {"UserID": f"U{i % 50:04d}", "Bill No": f"INV-{i}", "Date": "01/04/2025", "Buyer Name": f"Customer {i % 300}",
+            "Items": json.dumps(items), "Total Taxable": 455.0, "CGST": 11.38, "SGST": 11.38, "IGST": 0, "Grand Total": 477.76,
+            "Ship Name": "", "Ship GSTIN": "", "Ship Addr1": "", "Ship Addr2": "", "Ship Addr3": "", "Payment Mode": "Cash"}
+
+
+def seed(conn, n_rows):
+    header = SCHEMA["Invoices"]
+    conn.sheets["Invoices"] = [header] + rows_to_values([invoice_row(i) for i in range(n_rows)], header)
+    forget_sheet_header("Invoices")
+
+
+def legacy_save(conn, row):
+    df = conn.read(worksheet="Invoices", ttl=0)
+    conn.update(worksheet="Invoices", data=pd.concat([df, pd.DataFrame([row])], ignore_index=True))
+
+
+def measure(save, n_rows, repeats):
+    conn = FakeSheetsConnection(); seed(conn, n_rows)
+    save(conn, invoice_row(n_rows))  # warm-up (header lookup for append)
+    conn.bytes_moved = 0
+    start = time.perf_counter()
+    for r in range(repeats): save(conn, invoice_row(n_rows + 1 + r))
+    elapsed = (time.perf_counter() - start) / repeats
+    return elapsed * 1000, conn.bytes_moved / repeats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="1000,5000,20000,50000")
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'rows':>8} | {'legacy ms':>10} {'legacy KB':>10} | {'append ms':>10} {'append KB':>10}")
+    for n in [int(x) for x in args.sizes.split(",")]:
+        l_ms, l_bytes = measure(legacy_save, n, args.repeats)
+        a_ms, a_bytes = measure(lambda conn, row: append_rows(conn, "Invoices", [row]), n, args.repeats)
+        print(f"{n:>8} | {l_ms:>10.2f} {l_bytes / 1024:>10.1f} | {a_ms:>10.2f} {a_bytes / 1024:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
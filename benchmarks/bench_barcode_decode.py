@@ -0,0 +1,109 @@
+"""Barcode decode rate and latency over a corpus of camera-like frames.
+
+Without --corpus, frames are synthesised: EAN-13, EAN-8, UPC-A and Code 128
+labels pasted on noisy 1280x720 or 1920x1080 backgrounds. They are blurred,
+dimmed, shifted off-centre, rotated, and written as JPEG, the way
+st.camera_input delivers them. With --corpus DIR, every image in DIR is used
+and the expected text is the file name up to the first "_".
+
+Reports the decode rate and median/p90 latency for the legacy three-pass
+decode and for BarcodeDecoder, sequential and on a thread pool.
+"""
+import argparse
+import io
+import os
+import random
+import statistics
+import sys
+import time
+
+import cv2
+import numpy as np
+import zxingcpp
+from PIL import Image, ImageEnhance
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from hk_catalog import barcode_keys, gtin_check_digit  # noqa: E402
+from hk_scan import BarcodeDecoder, rotate  # noqa: E402
+
+VARIANTS = ["plain", "blur", "dim", "offcentre", "rot90", "rot30", "small"]
+
+
+def legacy_decode(pil_image):
+    img_np = np.array(pil_image.convert('RGB'))
+    results = zxingcpp.read_barcodes(img_np)
+    if results: return results[0].text
+    results = zxingcpp.read_barcodes(cv2.cvtColor(img_np, cv2.COLOR_RGB2GRAY))
+    if results: return results[0].text
+    results = zxingcpp.read_barcodes(np.array(ImageEnhance.Contrast(pil_image).enhance(2.0).convert('RGB')))
+    if results: return results[0].text
+    return None
+
+
+def make_code(rng, i):
+    kind = ["EAN13", "EAN8", "UPCA", "Code128"][i % 4]
+    if kind == "Code128": return kind, f"HK-{rng.randrange(10**6):06d}"
+    body = "".join(rng.choice("0123456789") for _ in range({"EAN13": 12, "EAN8": 7, "UPCA": 11}[kind]))
+    return kind, body + gtin_check_digit(body)
+
+
+def make_frame(rng, i):
+    kind, text = make_code(rng, i)
+    variant = VARIANTS[i % len(VARIANTS)]
+    label = np.array(zxingcpp.write_barcode_to_image(zxingcpp.create_barcode(text, getattr(zxingcpp.BarcodeFormat, kind)), scale=2 if variant == "small" else 4))
+    w, h = (1920, 1080) if i % 2 else (1280, 720)
+    frame = np.clip(rng.randrange(90, 200) + np.random.default_rng(i).normal(0, 12, (h, w)), 0, 255).astype(np.uint8)
+    if variant == "rot90": label = np.ascontiguousarray(np.rot90(label))
+    if variant == "rot30": label = rotate(label, 30)
+    lh, lw = label.shape
+    cx, cy = (w // 4, h // 4) if variant == "offcentre" else (w // 2, h // 2)
+    y, x = max(cy - lh // 2, 0), max(cx - lw // 2, 0)
+    frame[y:y + lh, x:x + lw] = label[:h - y, :w - x]
+    if variant == "blur": frame = cv2.GaussianBlur(frame, (5, 5), 1.5)
+    if variant == "dim": frame = (frame * 0.35 + 60).astype(np.uint8)
+    buf = io.BytesIO(); Image.fromarray(frame).convert("RGB").save(buf, format="JPEG", quality=85)
+    return text, variant, buf.getvalue()
+
+
+def load_corpus(path):
+    for name in sorted(os.listdir(path)):
+        if name.lower().endswith((".jpg", ".jpeg", ".png")):
+            with open(os.path.join(path, name), "rb") as f: yield name.split("_")[0].rsplit(".", 1)[0], "file", f.read()
+
+
+def matches(text, expected):
+    return bool(text) and barcode_keys(text)[0] == barcode_keys(expected)[0]
+
+
+def run(name, decode, corpus):
+    samples, hits, missed = [], 0, {}
+    for expected, variant, data in corpus:
+        start = time.perf_counter(); text = decode(data); samples.append((time.perf_counter() - start) * 1000)
+        if matches(text, expected): hits += 1
+        else: missed[variant] = missed.get(variant, 0) + 1
+    samples.sort()
+    print(f"{name:<14} {hits / len(corpus):>7.1%} {statistics.median(samples):>10.1f} {samples[int(len(samples) * 0.9) - 1]:>8.1f}  {missed or ''}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--frames", type=int, default=70)
+    parser.add_argument("--corpus", help="directory of images named <expected text>_*.jpg")
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    corpus = list(load_corpus(args.corpus)) if args.corpus else [make_frame(rng, i) for i in range(args.frames)]
+    print(f"{len(corpus)} frames, {os.cpu_count()} CPUs")
+    print(f"{'decoder':<14} {'rate':>7} {'median ms':>10} {'p90 ms':>8}  misses")
+    run("legacy", lambda data: legacy_decode(Image.open(io.BytesIO(data))), corpus)
+    sequential = BarcodeDecoder(workers=0)
+    run("sequential", lambda data: sequential.decode(io.BytesIO(data))[0], corpus)
+    print(f"{'':<14} hits by strategy: {sequential.stats()['by_strategy']}")
+    pooled = BarcodeDecoder(workers=args.workers)
+    run(f"pool x{args.workers}", lambda data: pooled.decode(io.BytesIO(data))[0], corpus)
+    pooled.close()
+
+
+if __name__ == "__main__":
+    main()
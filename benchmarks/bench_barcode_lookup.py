@@ -0,0 +1,56 @@
+"""Scan lookup latency against catalogue size.
+
+Times the old per-scan filter (normalise the Barcode column, compare, take the
+first row) against BarcodeIndex.lookup on catalogues of 1,000 to 100,000
+items, and reports the one-off index build time.
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from hk_catalog import BarcodeIndex, gtin_check_digit  # noqa: E402
+
+
+def make_items(n):
+    codes = [f"890{i:09d}" for i in range(n)]
+    return pd.DataFrame({"Item Name": [f"Item {i}" for i in range(n)], "Price": 10.0,
+                         "Barcode": [c + gtin_check_digit(c) for c in codes]})
+
+
+def mask_lookup(df, code):
+    df['Barcode'] = df['Barcode'].fillna('').astype(str).str.strip()
+    found = df[df['Barcode'] == code]
+    return None if found.empty else found.iloc[0]
+
+
+def timed(fn, codes):
+    samples = []
+    for code in codes:
+        start = time.perf_counter(); fn(code); samples.append((time.perf_counter() - start) * 1e6)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--scans", type=int, default=50)
+    args = parser.parse_args()
+
+    print(f"{'items':>8} {'build ms':>9} {'filter us':>11} {'index us':>9}")
+    for n in args.items:
+        df = make_items(n)
+        codes = random.Random(n).sample(df["Barcode"].tolist(), min(args.scans, n))
+        start = time.perf_counter(); index = BarcodeIndex(df); build_ms = (time.perf_counter() - start) * 1000
+        filter_us = timed(lambda c: mask_lookup(df, c), codes)
+        index_us = timed(index.lookup, codes)
+        print(f"{n:>8} {build_ms:>9.1f} {filter_us:>11.0f} {index_us:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
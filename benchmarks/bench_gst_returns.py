@@ -0,0 +1,95 @@
+"""GSTR-1/GSTR-3B build time for a year of a busy shop.
+
+Generates a year of invoices (default 100 a day, about four lines each) for a
+Gujarat seller with a mix of registered, intra-state and inter-state buyers,
+then times build_returns for every month twice: once reading lines from the
+InvoiceLines table and once exploding each invoice's Items JSON. The JSON and
+Excel renderings of the busiest month are timed separately.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from datetime import date, timedelta
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from hk_gst import build_returns, gstr1_excel, gstr1_json, gstr3b_json, return_period  # noqa: E402
+from hk_lines import explode_invoices  # noqa: E402
+from hk_validation import gstin_check_digit  # noqa: E402
+
+SELLER = {"GSTIN": "24AAAAA0000A1Z" + gstin_check_digit("24AAAAA0000A1Z"), "State": "Gujarat"}
+STATES = {"24": "Gujarat", "27": "Maharashtra", "08": "Rajasthan", "29": "Karnataka"}
+PRODUCTS = [(f"Item {i}", f"{8500 + i % 40:04d}", [0, 5, 12, 18, 28][i % 5], ["PCS", "KG", "LTR", "BOX"][i % 4], 20.0 + i * 7.5) for i in range(200)]
+
+
+def make_customers(n, rng):
+    rows = []
+    for i in range(n):
+        code = rng.choice(list(STATES))
+        gstin = ""
+        if i % 3 == 0:
+            body = f"{code}BBBBB{i:04d}B1Z"
+            gstin = body + gstin_check_digit(body)
+        rows.append({"UserID": "U1", "Name": f"Customer {i}", "GSTIN": gstin, "State": STATES[code]})
+    return pd.DataFrame(rows)
+
+
+def make_invoices(per_day, days, customers, rng):
+    rows, start = [], date(2025, 4, 1)
+    names, states = customers["Name"].tolist(), dict(zip(customers["Name"], customers["State"]))
+    for d in range(days):
+        day = (start + timedelta(days=d)).strftime("%d/%m/%Y")
+        for k in range(per_day):
+            buyer = rng.choice(names) if rng.random() < 0.4 else "Cash"
+            intra = states.get(buyer, "Gujarat") == "Gujarat"
+            items = []
+            for name, hsn, rate, uom, price in rng.sample(PRODUCTS, rng.randint(2, 6)):
+                items.append({"Description": name, "HSN": hsn, "Qty": rng.randint(1, 20), "UOM": uom, "Rate": price * rng.choice([1, 20, 200]), "GST Rate": rate})
+            for item in items: item["Base Amount"] = round(item["Qty"] * item["Rate"], 2)
+            taxable = round(sum(item["Base Amount"] for item in items), 2)
+            tax = round(sum(item["Base Amount"] * item["GST Rate"] / 100 for item in items), 2)
+            cgst = sgst = round(tax / 2, 2) if intra else 0.0
+            igst = 0.0 if intra else tax
+            rows.append({"UserID": "U1", "Bill No": f"INV-{d:03d}-{k:03d}", "Date": day, "Buyer Name": buyer, "Items": json.dumps(items),
+                         "Total Taxable": taxable, "CGST": cgst, "SGST": sgst, "IGST": igst, "Grand Total": round(taxable + cgst + sgst + igst)})
+    return pd.DataFrame(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--per-day", type=int, default=100)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--customers", type=int, default=300)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    customers = make_customers(args.customers, rng)
+    start = time.perf_counter(); invoices = make_invoices(args.per_day, args.days, customers, rng)
+    lines = explode_invoices(invoices)
+    print(f"{len(invoices)} invoices, {len(lines)} lines (generated in {time.perf_counter() - start:.1f} s)")
+
+    months = pd.to_datetime(invoices["Date"], format="%d/%m/%Y").dt.to_period("M").unique()
+    print(f"{'period':>7} {'invoices':>9} {'b2b':>6} {'b2cl':>5} {'b2cs':>5} {'hsn':>5} {'lines ms':>9} {'json ms':>8}")
+    total_lines = total_json = 0.0
+    for m in months:
+        start = time.perf_counter(); report = build_returns(SELLER, invoices, customers, m.year, m.month, lines); t_lines = time.perf_counter() - start
+        start = time.perf_counter(); build_returns(SELLER, invoices, customers, m.year, m.month); t_json = time.perf_counter() - start
+        total_lines += t_lines; total_json += t_json
+        print(f"{return_period(m.year, m.month):>7} {len(report['invoices']):>9} {report['b2b']['Bill No'].nunique():>6} {report['b2cl']['Bill No'].nunique():>5} "
+              f"{len(report['b2cs']):>5} {len(report['hsn']):>5} {t_lines * 1000:>9.0f} {t_json * 1000:>8.0f}")
+    print(f"{'year':>7} {len(invoices):>9} {'':>6} {'':>5} {'':>5} {'':>5} {total_lines * 1000:>9.0f} {total_json * 1000:>8.0f}")
+
+    fp = return_period(months[0].year, months[0].month)
+    report = build_returns(SELLER, invoices, customers, months[0].year, months[0].month, lines)
+    start = time.perf_counter(); doc = json.dumps(gstr1_json(SELLER, fp, report)); t_doc = time.perf_counter() - start
+    start = time.perf_counter(); xlsx = gstr1_excel(report); t_xlsx = time.perf_counter() - start
+    json.dumps(gstr3b_json(SELLER, fp, report))
+    print(f"GSTR-1 JSON {len(doc) / 1024:.0f} KiB in {t_doc * 1000:.0f} ms, Excel {len(xlsx) / 1024:.0f} KiB in {t_xlsx * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
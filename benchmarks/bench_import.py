@@ -0,0 +1,75 @@
+"""Customer import throughput on a large workbook.
+
+Builds an .xlsx with --rows customers (about 2% deliberately invalid) and
+imports it into a throwaway SQLite store through hk_import.import_customers.
+With --interrupt-after N the first run fails after N batches and a second run
+resumes from the checkpoint.
+"""
+import argparse
+import os
+import resource
+import sys
+import tempfile
+import time
+
+import xlsxwriter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from hk_import import CUSTOMER_IMPORT_COLS, import_customers  # noqa: E402
+from hk_storage import SQLiteBackend  # noqa: E402
+
+
+def build_workbook(path, n_rows):
+    wb = xlsxwriter.Workbook(path, {"constant_memory": True})
+    ws = wb.add_worksheet()
+    ws.write_row(0, 0, CUSTOMER_IMPORT_COLS)
+    for i in range(n_rows):
+        bad = i % 50 == 0
+        ws.write_row(i + 1, 0, [f"Customer {i}", "24ABCDE1234F1Z6" if i % 3 else "", f"Shop {i}", "Main Road", "", "Gujarat",
+                                9000000000 + i if not bad else 12345, f"c{i}@example.com" if not bad else "broken@"])
+    wb.close()
+
+
+class FlakyStorage:
+    def __init__(self, inner, fail_after):
+        self.inner = inner; self.fail_after = fail_after; self.calls = 0
+
+    def append(self, worksheet_name, rows):
+        self.calls += 1
+        if self.fail_after and self.calls > self.fail_after: raise RuntimeError("simulated network failure")
+        return self.inner.append(worksheet_name, rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--interrupt-after", type=int, default=0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        xlsx = os.path.join(tmp, "customers.xlsx")
+        t0 = time.perf_counter(); build_workbook(xlsx, args.rows)
+        print(f"built {args.rows:,}-row workbook in {time.perf_counter() - t0:.1f}s")
+
+        backend = SQLiteBackend(os.path.join(tmp, "bench.db"))
+        state = os.path.join(tmp, "imports.json")
+        if args.interrupt_after:
+            try: import_customers(FlakyStorage(backend, args.interrupt_after), xlsx, "U1", args.batch_size, state_path=state)
+            except RuntimeError as e: print(f"first run stopped: {e}")
+
+        t0 = time.perf_counter()
+        result = import_customers(backend, xlsx, "U1", args.batch_size, state_path=state)
+        elapsed = time.perf_counter() - t0
+        stored = len(backend.read_user("Customers", "U1"))
+        backend.close()
+
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"resumed from row    : {result['resumed_from']:,}")
+    print(f"imported / rejected : {result['imported']:,} / {result['rejected']:,} (stored {stored:,})")
+    print(f"elapsed             : {elapsed:.2f}s ({args.rows / elapsed:,.0f} rows/s)")
+    print(f"peak RSS            : {peak_mb:.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
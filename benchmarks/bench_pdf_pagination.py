@@ -0,0 +1,97 @@
+"""Invoice pagination cost at 10, 100 and 1,000 lines.
+
+Times the legacy loop (wrap the whole remaining table, split it, repeat, then
+wrap the last part and every part again to draw) against measure_rows +
+paginate_rows + table_slice on the same item table, and reports the full
+generate_pdf render time for each size.
+"""
+import argparse
+import io
+import os
+import statistics
+import sys
+import time
+
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.units import inch
+from reportlab.platypus import Table, TableStyle
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from hk_pdf import generate_pdf, measure_rows, paginate_rows, table_slice  # noqa: E402
+
+W, H = A4
+USABLE = (H - 300) - 230
+COL_WIDTHS = [0.5*inch, 2.6*inch, 1.0*inch, 0.8*inch, 0.6*inch, 1.0*inch, 1.2*inch]
+
+
+def make_items(n):
+    return [{"Description": f"Item {i}" + (" with a longer description that wraps" if i % 9 == 0 else ""), "HSN": str(1000 + i % 13),
+             "Qty": 1.0 + i % 3, "UOM": "PCS", "Rate": 10.0 + i, "GST Rate": [5, 12, 18][i % 3]} for i in range(n)]
+
+
+def item_table(items):
+    data = [["Sr.\nNo.", "Description", "HSN/SAC", "Qty", "UOM", "Rate", "Amount"]]
+    for i, item in enumerate(items, 1):
+        data.append([str(i), item["Description"], item["HSN"], f"{item['Qty']:.2f}", item["UOM"], f"{item['Rate']:.2f}", f"{item['Qty'] * item['Rate']:.2f}"])
+    summary_start = len(data)
+    data.append(['Grand Total', '', '', '', '', '', "0.00"])
+    style = [('FONTNAME', (0, 0), (-1, -1), "Helvetica"), ('FONTSIZE', (0, 0), (-1, -1), 9), ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+             ('ALIGN', (1, 1), (1, summary_start - 1), 'LEFT'), ('TOPPADDING', (0, 0), (-1, -1), 6), ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+             ('GRID', (0, 0), (-1, -1), 0.5, colors.black), ('SPAN', (0, summary_start), (5, summary_start))]
+    return data, style
+
+
+def legacy(data, style):
+    table = Table(data, colWidths=COL_WIDTHS); table.setStyle(TableStyle(style))
+    parts, current = [], table
+    while True:
+        _, h_t = current.wrap(W, H)
+        if h_t <= USABLE:
+            parts.append(current); break
+        result = current.split(W, USABLE)
+        if len(result) == 2: parts.append(result[0]); current = result[1]
+        else: parts.append(current); break
+    parts[-1].wrap(W, H)
+    for part in parts: part.wrap(W, H)
+    return len(parts)
+
+
+def two_pass(data, style):
+    table = Table(data, colWidths=COL_WIDTHS); table.setStyle(TableStyle(style))
+    heights = measure_rows(table, W, H)
+    pages, _ = paginate_rows(heights, USABLE)
+    for start, end in pages: table_slice(data, COL_WIDTHS, heights, style, start, end).wrap(W, H)
+    return len(pages)
+
+
+def timed(fn, repeat):
+    samples, result = [], None
+    for _ in range(repeat):
+        start = time.perf_counter(); result = fn(); samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lines", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    seller = {"Business Name": "Bench Traders", "Is GST": "Yes", "Template": "Simple"}
+    buyer = {"Name": "Customer", "Date": "01/04/2025", "POS Code": "24", "Shipping": {}}
+    print(f"{'lines':>6} {'pages':>6} {'legacy ms':>10} {'two-pass ms':>12} {'speed-up':>9} {'full render ms':>15}")
+    for n in args.lines:
+        items = make_items(n)
+        data, style = item_table(items)
+        legacy_ms, legacy_pages = timed(lambda: legacy(data, style), args.repeat)
+        new_ms, new_pages = timed(lambda: two_pass(data, style), args.repeat)
+        assert legacy_pages == new_pages, (legacy_pages, new_pages)
+        taxable = sum(i["Qty"] * i["Rate"] for i in items)
+        totals = {"taxable": taxable, "cgst": 0.0, "sgst": 0.0, "igst": 0.0, "total": taxable, "is_intra": True}
+        render_ms, _ = timed(lambda: generate_pdf(seller, buyer, items, "BENCH-1", io.BytesIO(), totals), args.repeat)
+        print(f"{n:>6} {new_pages:>6} {legacy_ms:>10.1f} {new_ms:>12.1f} {legacy_ms / new_ms:>8.1f}x {render_ms:>15.1f}")
+
+
+if __name__ == "__main__":
+    main()
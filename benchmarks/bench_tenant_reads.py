@@ -0,0 +1,60 @@
+"""Per-tenant read cost with 1,000 synthetic tenants.
+
+Compares the legacy path (read the whole Invoices table, filter UserID in
+pandas) against SQLiteBackend.read_user, which uses the UserID index.
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from hk_storage import SQLiteBackend  # noqa: E402
+
+
+def seed(backend, tenants, invoices_per_tenant):
+    rows = []
+    for t in range(tenants):
+        for i in range(invoices_per_tenant):
+            rows.append({"UserID": f"T{t:05d}", "Bill No": f"INV-{i}", "Date": "01/04/2025", "Buyer Name": f"Customer {i % 40}",
+                         "Items": '[{"Description": "Rice", "Qty": 2.0, "Rate": 45.5}]', "Total Taxable": 91.0, "Grand Total": 95.55, "Payment Mode": "Cash"})
+    backend.append("Invoices", rows)
+
+
+def timed(fn, user_ids):
+    start = time.perf_counter()
+    for uid in user_ids: fn(uid)
+    return (time.perf_counter() - start) / len(user_ids) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tenants", type=int, default=1000)
+    parser.add_argument("--invoices-per-tenant", type=int, default=100)
+    parser.add_argument("--samples", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        backend = SQLiteBackend(os.path.join(tmp, "bench.db"))
+        seed(backend, args.tenants, args.invoices_per_tenant)
+        user_ids = [f"T{random.randrange(args.tenants):05d}" for _ in range(args.samples)]
+
+        def legacy(uid):
+            df = backend.read("Invoices")
+            return df[df["UserID"] == uid]
+
+        legacy_ms = timed(legacy, user_ids)
+        indexed_ms = timed(lambda uid: backend.read_user("Invoices", uid), user_ids)
+        backend.close()
+
+    total = args.tenants * args.invoices_per_tenant
+    print(f"{args.tenants} tenants, {total} invoices, {args.invoices_per_tenant} per tenant")
+    print(f"legacy full read + filter : {legacy_ms:8.2f} ms/request")
+    print(f"indexed read_user         : {indexed_ms:8.2f} ms/request")
+    print(f"speed-up                  : {legacy_ms / indexed_ms:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
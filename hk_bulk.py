@@ -0,0 +1,271 @@
+import argparse
+import io
+import itertools
+import json
+import multiprocessing
+import os
+import re
+import tempfile
+import time
+import zipfile
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+
+import pandas as pd
+from pypdf import PdfReader
+from pypdf.generic import IndirectObject, NameObject, TextStringObject
+
+from hk_pdf import PdfCache, pdf_page_count, render_pdf_bytes, seller_for_pdf
+from hk_storage import STORAGE_BACKEND, open_backend
+
+# --- CONFIGURATION ---
+BULK_WORKERS = int(os.environ.get("HK_BULK_WORKERS", "0")) or os.cpu_count() or 1
+BULK_FORMATS = {"zip": ("application/zip", "zip"), "pdf": ("application/pdf", "pdf")}
+BULK_DIR = os.environ.get("HK_BULK_DIR", tempfile.gettempdir())
+
+def _clean(record):
+    return {k: (v if str(v) != 'nan' else '') for k, v in record.items()}
+
+def _num(value):
+    try:
+        value = float(value)
+        return 0.0 if value != value else value
+    except (TypeError, ValueError): return 0.0
+
+# --- INVOICE REBUILD ---
+# Each Invoices row carries its line items as JSON plus the stored totals, so a
+# PDF can be rebuilt without the billing screen. Buyer details come from the
+# customer master by name, the same way the billing flows look them up.
+def invoice_job(seller, invoice, customers):
+    invoice = _clean(invoice)
+    try: items = json.loads(invoice.get("Items") or "[]")
+    except ValueError: items = []
+    for item in items:
+        item["Qty"] = _num(item.get("Qty")); item["Rate"] = _num(item.get("Rate"))
+    igst = _num(invoice.get("IGST"))
+    buyer = dict(customers.get(invoice.get("Buyer Name"), {"Name": invoice.get("Buyer Name", "")}))
+    buyer["Date"] = invoice.get("Date", "")
+    buyer["POS Code"] = "Inter" if igst else "24"
+    buyer["Shipping"] = {"IsShipping": True, "Name": invoice["Ship Name"], "GSTIN": invoice.get("Ship GSTIN", ""), "Addr1": invoice.get("Ship Addr1", ""),
+                         "Addr2": invoice.get("Ship Addr2", ""), "Addr3": invoice.get("Ship Addr3", "")} if invoice.get("Ship Name") else {}
+    totals = {"taxable": _num(invoice.get("Total Taxable")), "cgst": _num(invoice.get("CGST")), "sgst": _num(invoice.get("SGST")),
+              "igst": igst, "total": _num(invoice.get("Grand Total")), "is_intra": not igst}
+    return {"seller": seller, "buyer": buyer, "items": items, "inv_no": str(invoice.get("Bill No", "")), "totals": totals}
+
+def _customer_index(df_customers):
+    customers = {}
+    if df_customers is not None and not df_customers.empty:
+        for record in df_customers.to_dict('records'): customers.setdefault(record.get("Name"), _clean(record))
+    return customers
+
+# Invoice dates are stored as dd/mm/YYYY text; the bounds are inclusive.
+def select_invoices(df_invoices, date_from=None, date_to=None, buyers=None):
+    mask = pd.Series(True, index=df_invoices.index)
+    if date_from or date_to:
+        dates = pd.to_datetime(df_invoices["Date"], format="%d/%m/%Y", errors="coerce")
+        if date_from: mask &= dates >= pd.Timestamp(date_from)
+        if date_to: mask &= dates <= pd.Timestamp(date_to)
+    if buyers: mask &= df_invoices["Buyer Name"].astype(str).isin([str(b) for b in buyers])
+    return df_invoices[mask]
+
+# Jobs are produced one invoice chunk at a time, so a long date range never
+# holds more than one chunk of Invoices rows. Jobs are pickled to the workers,
+# so the seller goes without its password.
+def iter_invoice_jobs(seller, invoice_chunks, df_customers, date_from=None, date_to=None, buyers=None):
+    seller, customers = _clean(seller_for_pdf(seller)), _customer_index(df_customers)
+    for chunk in invoice_chunks:
+        for invoice in select_invoices(chunk, date_from, date_to, buyers).to_dict('records'):
+            yield invoice_job(seller, invoice, customers)
+
+def build_invoice_jobs(seller, df_invoices, df_customers):
+    return list(iter_invoice_jobs(seller, [df_invoices], df_customers))
+
+# --- WORKER POOL ---
+# Workers are spawned rather than forked: the Streamlit server is threaded and
+# forking it can deadlock on locks held by other threads. Each worker opens
+# the shared on-disk PdfCache once, so re-running a batch skips ReportLab.
+_worker_cache = None
+
+def _init_worker(cache_dir):
+    global _worker_cache
+    _worker_cache = PdfCache(cache_dir) if cache_dir else None
+
+def _render_job(job):
+    data = render_pdf_bytes(job["seller"], job["buyer"], job["items"], job["inv_no"], job["totals"], cache=_worker_cache)
+    return job["inv_no"], data, pdf_page_count(data)
+
+# At most two renders per worker are in flight; results are yielded in job
+# order and the next job is only submitted once one has been handed on.
+def render_invoices(jobs, workers=BULK_WORKERS, cache_dir=None):
+    if workers <= 1:
+        _init_worker(cache_dir)
+        yield from map(_render_job, jobs)
+        return
+    jobs = iter(jobs)
+    with ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("spawn"), initializer=_init_worker, initargs=(cache_dir,)) as pool:
+        pending = deque(pool.submit(_render_job, job) for job in itertools.islice(jobs, workers * 2))
+        while pending:
+            result = pending.popleft().result()
+            pending.extend(pool.submit(_render_job, job) for job in itertools.islice(jobs, 1))
+            yield result
+
+# --- OUTPUT ---
+def _pdf_name(inv_no, used):
+    stem = "Invoice_" + (re.sub(r"[^A-Za-z0-9._-]+", "_", inv_no).strip("_") or "blank")
+    name, n = f"{stem}.pdf", 1
+    while name in used:
+        n += 1; name = f"{stem}_{n}.pdf"
+    used.add(name)
+    return name
+
+def write_zip(results, out):
+    used = set()
+    with zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED) as zf:
+        for inv_no, data, pages in results:
+            zf.writestr(_pdf_name(inv_no, used), data)
+            yield inv_no, data, pages
+
+# Streams a merged PDF: each invoice's objects are renumbered and written out
+# as soon as it is added, so only object offsets, page ids and bookmark titles
+# stay in memory. Objects 1-3 are the catalog, page tree and outline root,
+# written last once every page is known.
+class PdfConcatenator:
+    def __init__(self, out):
+        self.out = out
+        self.pos = 0
+        self.offsets = array("q", [0, 0, 0])
+        self.kids = array("q")
+        self.bookmarks = []
+        self._write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+
+    def _write(self, data):
+        self.out.write(data); self.pos += len(data)
+
+    def _reserve(self):
+        self.offsets.append(0)
+        return len(self.offsets)
+
+    def _object(self, obj_id, obj):
+        self.offsets[obj_id - 1] = self.pos
+        buf = io.BytesIO()
+        buf.write(f"{obj_id} 0 obj\n".encode())
+        if isinstance(obj, bytes): buf.write(obj)
+        else: obj.write_to_stream(buf)
+        buf.write(b"\nendobj\n")
+        self._write(buf.getvalue())
+
+    def _remap(self, obj, ids, queue):
+        if isinstance(obj, IndirectObject):
+            if obj.idnum not in ids:
+                ids[obj.idnum] = self._reserve(); queue.append(obj.idnum)
+            return IndirectObject(ids[obj.idnum], 0, None)
+        if isinstance(obj, dict):
+            for key, value in obj.items(): obj[key] = self._remap(value, ids, queue)
+        elif isinstance(obj, list):
+            for i, value in enumerate(obj): obj[i] = self._remap(value, ids, queue)
+        return obj
+
+    def add(self, data, title=None):
+        reader = PdfReader(io.BytesIO(data))
+        pages = list(reader.pages)
+        ids, queue = {page.indirect_reference.idnum: self._reserve() for page in pages}, deque()
+        for page in pages:
+            page_id = ids[page.indirect_reference.idnum]
+            page.pop("/Parent", None)
+            self._remap(page, ids, queue)
+            page[NameObject("/Parent")] = IndirectObject(2, 0, None)
+            self._object(page_id, page)
+            self.kids.append(page_id)
+        while queue:
+            src_id = queue.popleft()
+            self._object(ids[src_id], self._remap(reader.get_object(src_id), ids, queue))
+        if title and pages: self.bookmarks.append((title, ids[pages[0].indirect_reference.idnum]))
+
+    def close(self):
+        first_item = len(self.offsets) + 1
+        for i, (title, page_id) in enumerate(self.bookmarks):
+            item_id = first_item + i
+            self.offsets.append(0)
+            buf = io.BytesIO(); TextStringObject(title).write_to_stream(buf)
+            links = (f" /Prev {item_id - 1} 0 R" if i else "") + (f" /Next {item_id + 1} 0 R" if i < len(self.bookmarks) - 1 else "")
+            self._object(item_id, b"<< /Title " + buf.getvalue() + f" /Parent 3 0 R{links} /Dest [{page_id} 0 R /Fit] >>".encode())
+        outline = f"/First {first_item} 0 R /Last {first_item + len(self.bookmarks) - 1} 0 R " if self.bookmarks else ""
+        self._object(3, f"<< /Type /Outlines {outline}/Count {len(self.bookmarks)} >>".encode())
+        kids = " ".join(f"{k} 0 R" for k in self.kids)
+        self._object(2, f"<< /Type /Pages /Kids [{kids}] /Count {len(self.kids)} >>".encode())
+        self._object(1, b"<< /Type /Catalog /Pages 2 0 R /Outlines 3 0 R" + (b" /PageMode /UseOutlines" if self.bookmarks else b"") + b" >>")
+        xref_at = self.pos
+        size = len(self.offsets) + 1
+        self._write(f"xref\n0 {size}\n0000000000 65535 f \n".encode())
+        for offset in self.offsets: self._write(f"{offset:010d} 00000 n \n".encode())
+        self._write(f"trailer\n<< /Size {size} /Root 1 0 R >>\nstartxref\n{xref_at}\n%%EOF\n".encode())
+
+def write_merged(results, out):
+    merged = PdfConcatenator(out)
+    for inv_no, data, pages in results:
+        merged.add(data, f"Invoice {inv_no}")
+        yield inv_no, data, pages
+    merged.close()
+
+# Renders every job into one ZIP or merged PDF written to `out` and returns
+# throughput figures; progress(done, total) is called after each invoice.
+# Output is written as it is produced, so memory does not grow with the
+# number of invoices when `out` is a file.
+def bulk_generate(jobs, out, fmt="zip", workers=BULK_WORKERS, cache_dir=None, progress=None, total=None):
+    if fmt not in BULK_FORMATS: raise ValueError(f"Unknown bulk format: {fmt}")
+    writer = write_zip if fmt == "zip" else write_merged
+    start = time.perf_counter()
+    done = pages = size = 0
+    for _, data, n_pages in writer(render_invoices(jobs, workers, cache_dir), out):
+        done += 1; pages += n_pages; size += len(data)
+        if progress: progress(done, total)
+    elapsed = time.perf_counter() - start
+    return {"invoices": done, "pages": pages, "seconds": round(elapsed, 3),
+            "pages_per_sec": round(pages / elapsed, 1) if elapsed else 0.0, "pdf_bytes": size}
+
+# Writes next to the final path and renames, so a download in progress never
+# sees a half-written file.
+def bulk_generate_file(jobs, path, fmt="zip", **kwargs):
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as out: stats = bulk_generate(jobs, out, fmt, **kwargs)
+    os.replace(tmp, path)
+    return stats
+
+def bulk_output_path(user_id, fmt):
+    return os.path.join(BULK_DIR, f"hk_bulk_{re.sub(r'[^A-Za-z0-9_-]+', '_', str(user_id))}.{BULK_FORMATS[fmt][1]}")
+
+# --- CLI ---
+def main():
+    parser = argparse.ArgumentParser(description="Render one user's invoices into a ZIP or a merged PDF.")
+    parser.add_argument("--user-id", required=True)
+    parser.add_argument("--out", required=True, help="output path; .pdf writes one merged PDF, anything else a ZIP")
+    parser.add_argument("--from", dest="date_from", type=date.fromisoformat, help="first invoice date, YYYY-MM-DD")
+    parser.add_argument("--to", dest="date_to", type=date.fromisoformat, help="last invoice date, YYYY-MM-DD")
+    parser.add_argument("--customer", action="append", default=[], help="Buyer Name to include; repeatable (default: all)")
+    parser.add_argument("--backend", default=STORAGE_BACKEND, choices=["gsheets", "sqlite"])
+    parser.add_argument("--workers", type=int, default=BULK_WORKERS)
+    parser.add_argument("--cache-dir", default=None, help="reuse renders from this PdfCache directory")
+    args = parser.parse_args()
+
+    conn = None
+    if args.backend == "gsheets":
+        import streamlit as st
+        from streamlit_gsheets import GSheetsConnection
+        conn = st.connection("gsheets", type=GSheetsConnection)
+    storage = open_backend(args.backend, gsheets_conn=conn)
+    users = storage.read_where("Users", {"UserID": args.user_id})
+    if users.empty: parser.error(f"no user with UserID {args.user_id}")
+    jobs = iter_invoice_jobs(users.iloc[0].to_dict(), storage.iter_where("Invoices", {"UserID": args.user_id}),
+                             storage.read_user("Customers", args.user_id), args.date_from, args.date_to, args.customer)
+
+    fmt = "pdf" if args.out.lower().endswith(".pdf") else "zip"
+    stats = bulk_generate_file(jobs, args.out, fmt, workers=args.workers, cache_dir=args.cache_dir,
+                               progress=lambda done, total: print(f"\r{done} invoices", end="", flush=True))
+    if not stats["invoices"]: parser.error("no matching invoices")
+    print(f"\n{stats['invoices']} invoices, {stats['pages']} pages in {stats['seconds']:.2f}s "
+          f"({stats['pages_per_sec']:.1f} pages/s) -> {args.out}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+import math
+import threading
+import time
+
+import pandas as pd
+
+from hk_storage import CACHE_TTL
+
+# --- CONFIGURATION ---
+GRID_PAGE_SIZE = 12
+SEARCH_COLUMNS = ["Item Name", "HSN", "Barcode"]
+
+# --- PRODUCT GRID ---
+# The POS grids render one page of the (filtered) catalogue per rerun, so the
+# cost of a click depends on the page size rather than the number of SKUs.
+def filter_items(df_items, query):
+    query = str(query or "").strip()
+    if df_items.empty or not query: return df_items
+    mask = pd.Series(False, index=df_items.index)
+    for col in SEARCH_COLUMNS:
+        if col in df_items.columns: mask |= df_items[col].fillna("").astype(str).str.contains(query, case=False, regex=False)
+    return df_items[mask]
+
+def page_count(n_items, page_size=GRID_PAGE_SIZE):
+    return max(1, math.ceil(n_items / page_size))
+
+def page_slice(df_items, page, page_size=GRID_PAGE_SIZE):
+    page = min(max(int(page), 1), page_count(len(df_items), page_size))
+    return df_items.iloc[(page - 1) * page_size:page * page_size]
+
+# Description -> position of its first line in the cart.
+def cart_index(cart):
+    index = {}
+    for idx, item in enumerate(cart): index.setdefault(item['Description'], idx)
+    return index
+
+# --- BARCODE INDEX ---
+# Barcodes are keyed so that the forms a scanner may send for the same
+# product meet: numeric codes drop leading zeros (UPC-A, EAN-13 and GTIN-14
+# of one product collapse to one key), UPC-E also answers to its UPC-A
+# expansion, and a GTIN read without its check digit finds the full code.
+def gtin_check_digit(body):
+    total = sum(int(d) * (3 if i % 2 == 0 else 1) for i, d in enumerate(reversed(body)))
+    return str((10 - total % 10) % 10)
+
+def has_valid_check_digit(code):
+    return len(code) in (8, 12, 13, 14) and gtin_check_digit(code[:-1]) == code[-1]
+
+def upc_e_to_upc_a(code):
+    d = code[1:7]
+    if d[5] in "012": body = d[:2] + d[5] + "0000" + d[2:5]
+    elif d[5] == "3": body = d[:3] + "00000" + d[3:5]
+    elif d[5] == "4": body = d[:4] + "00000" + d[4]
+    else: body = d[:5] + "0000" + d[5]
+    return code[0] + body + code[7]
+
+# Returns (primary key, alias keys); ("", []) for an empty barcode.
+def barcode_keys(code):
+    code = str(code if code is not None else "").strip().upper()
+    if code in ("", "NAN"): return "", []
+    if not code.isdigit(): return code, []
+    primary, aliases = code.lstrip("0") or "0", []
+    if len(code) == 8 and code[0] in "01" and has_valid_check_digit(upc_e_to_upc_a(code)):
+        aliases.append(upc_e_to_upc_a(code).lstrip("0"))
+    elif not has_valid_check_digit(code) and len(code) in (7, 11, 12, 13):
+        aliases.append((code + gtin_check_digit(code)).lstrip("0"))
+    return primary, aliases
+
+class BarcodeIndex:
+    def __init__(self, df_items=None):
+        self.primary = {}
+        self.alias = {}
+        if df_items is not None and not df_items.empty and "Barcode" in df_items.columns:
+            for item in df_items.to_dict('records'): self.add(item)
+
+    def add(self, item):
+        primary, aliases = barcode_keys(item.get("Barcode"))
+        if not primary: return
+        self.primary.setdefault(primary, item)
+        for key in aliases: self.alias.setdefault(key, item)
+
+    def lookup(self, code):
+        primary, aliases = barcode_keys(code)
+        if not primary: return None
+        keys = [primary] + aliases
+        for table in (self.primary, self.alias):
+            for key in keys:
+                if key in table: return table[key]
+        return None
+
+    def __len__(self): return len(self.primary)
+
+# One index per tenant, rebuilt only when that tenant's Items version changes
+# (or after CACHE_TTL, when other processes may have written). Items saved
+# from the scanner are added in place instead.
+class BarcodeRegistry:
+    def __init__(self, ttl=CACHE_TTL):
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.entries = {}
+        self.builds = 0
+
+    def get(self, user_id, version, load_items):
+        user_id = str(user_id)
+        with self.lock:
+            entry = self.entries.get(user_id)
+            if entry and entry[0] == version and not (self.ttl and time.monotonic() - entry[1] > self.ttl): return entry[2]
+        index = BarcodeIndex(load_items())
+        with self.lock:
+            self.entries[user_id] = (version, time.monotonic(), index); self.builds += 1
+        return index
+
+    def add(self, user_id, version, item):
+        user_id = str(user_id)
+        with self.lock:
+            entry = self.entries.get(user_id)
+            if entry:
+                entry[2].add(item); self.entries[user_id] = (version, entry[1], entry[2])
@@ -0,0 +1,53 @@
+import csv
+import io
+import itertools
+import tempfile
+
+import xlsxwriter
+
+from hk_storage import SCHEMA, to_cell
+
+# --- CONFIGURATION ---
+EXPORT_COLUMNS = {
+    "Customers": ["Name", "GSTIN", "Address 1", "Address 2", "Address 3", "State", "Mobile", "Email"],
+    "Items": ["Item Name", "Price", "UOM", "HSN", "Barcode", "Weight"],
+    "Invoices": [c for c in SCHEMA["Invoices"] if c != "UserID"],
+}
+EXPORT_MIME = {"xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", "csv": "text/csv"}
+SPOOL_LIMIT = 8 * 1024 * 1024  # exports larger than this spill to a temp file
+
+# --- STREAMING WRITERS ---
+# Chunks are written row by row: xlsxwriter's constant_memory mode flushes each
+# row to disk, and the output itself is a spooled temp file.
+def write_xlsx(chunks, columns, out):
+    wb = xlsxwriter.Workbook(out, {"constant_memory": True, "strings_to_numbers": False, "strings_to_formulas": False, "strings_to_urls": False})
+    ws = wb.add_worksheet("Sheet1")
+    ws.write_row(0, 0, columns, wb.add_format({"bold": True}))
+    r = 1
+    for chunk in chunks:
+        for values in chunk.reindex(columns=columns).itertuples(index=False, name=None):
+            ws.write_row(r, 0, [to_cell(v) for v in values]); r += 1
+    wb.close()
+    return r - 1
+
+def write_csv(chunks, columns, out):
+    text = io.TextIOWrapper(out, encoding="utf-8-sig", newline="")
+    writer = csv.writer(text)
+    writer.writerow(columns)
+    n = 0
+    for chunk in chunks:
+        rows = [[to_cell(v) for v in values] for values in chunk.reindex(columns=columns).itertuples(index=False, name=None)]
+        writer.writerows(rows); n += len(rows)
+    text.flush(); text.detach()
+    return n
+
+def export_file(chunks, columns, fmt="xlsx"):
+    out = tempfile.SpooledTemporaryFile(max_size=SPOOL_LIMIT)
+    if fmt == "csv": write_csv(chunks, columns, out)
+    else: write_xlsx(chunks, columns, out)
+    out.seek(0)
+    return out
+
+def export_worksheet(storage, worksheet_name, user_id, fmt="xlsx", extra_chunks=(), chunk_size=5000):
+    chunks = itertools.chain(storage.iter_user(worksheet_name, user_id, chunk_size), extra_chunks)
+    return export_file(chunks, EXPORT_COLUMNS[worksheet_name], fmt)
@@ -0,0 +1,268 @@
+import argparse
+import io
+import json
+import os
+from itertools import groupby
+
+import numpy as np
+import pandas as pd
+
+from hk_lines import LINE_COLUMNS, explode_invoices, typed_lines, unique_lines
+from hk_storage import STORAGE_BACKEND, open_backend
+from hk_tax import gst_paise, to_paise
+from hk_validation import STATE_CODES, gstin_state_code, valid_mask
+
+# --- CONFIGURATION ---
+# Unregistered inter-state invoices above this value are reported one by one
+# (B2CL); everything else to unregistered buyers is summarised (B2CS).
+B2CL_LIMIT = float(os.environ.get("HK_B2CL_LIMIT", "100000"))
+GSTR1_VERSION = "GST3.2.2"
+GST_RATES = [0, 0.1, 0.25, 1, 1.5, 3, 5, 6, 7.5, 12, 18, 28]
+UQC = {"PCS": "PCS", "NOS": "NOS", "KG": "KGS", "KGS": "KGS", "GM": "GMS", "GMS": "GMS", "LTR": "LTR", "ML": "MLT",
+       "MTR": "MTR", "BOX": "BOX", "SET": "SET", "DOZ": "DOZ", "PAC": "PAC", "BAG": "BAG", "UNT": "UNT"}
+UQC_NAMES = {"PCS": "PIECES", "NOS": "NUMBERS", "KGS": "KILOGRAMS", "GMS": "GRAMMES", "LTR": "LITRES", "MLT": "MILILITRE", "MTR": "METERS",
+             "BOX": "BOX", "SET": "SETS", "DOZ": "DOZENS", "PAC": "PACKS", "BAG": "BAGS", "UNT": "UNITS", "OTH": "OTHERS"}
+STATE_BY_NAME = {name.casefold(): code for code, name in STATE_CODES.items()}
+AMOUNT_COLUMNS = ["Total Taxable", "CGST", "SGST", "IGST", "Grand Total"]
+EXCEL_SHEETS = {
+    "b2b": ["GSTIN/UIN of Recipient", "Receiver Name", "Invoice Number", "Invoice date", "Invoice Value", "Place Of Supply", "Reverse Charge",
+            "Applicable % of Tax Rate", "Invoice Type", "E-Commerce GSTIN", "Rate", "Taxable Value", "Cess Amount"],
+    "b2cl": ["Invoice Number", "Invoice date", "Invoice Value", "Place Of Supply", "Applicable % of Tax Rate", "Rate", "Taxable Value", "Cess Amount", "E-Commerce GSTIN"],
+    "b2cs": ["Type", "Place Of Supply", "Applicable % of Tax Rate", "Rate", "Taxable Value", "Cess Amount", "E-Commerce GSTIN"],
+    "hsn": ["HSN", "Description", "UQC", "Total Quantity", "Total Value", "Rate", "Taxable Value", "Integrated Tax Amount", "Central Tax Amount", "State/UT Tax Amount", "Cess Amount"],
+}
+
+def return_period(year, month): return f"{int(month):02d}{int(year)}"
+
+def seller_state(seller):
+    return gstin_state_code(seller.get("GSTIN", "")) or STATE_BY_NAME.get(str(seller.get("State", "")).strip().casefold(), "")
+
+def _pos_label(codes): return codes.map(lambda c: f"{c}-{STATE_CODES[c]}" if c in STATE_CODES else "")
+
+# Membership by hashing the keys once; Series.isin on string columns walks the
+# values in Python, which dominates on a year of lines.
+def _isin(values, keys): return pd.Index(keys).get_indexer(values) >= 0
+
+def _rupees(paise): return np.round(np.asarray(paise, dtype=float) / 100, 2)
+
+# --- CLASSIFICATION ---
+# One row per invoice in the period with the buyer's GSTIN (from Customers),
+# place of supply and section. Registered buyers are B2B. Place of supply is
+# the GSTIN state, else the customer's State, else (for intra-state invoices)
+# the seller's own state. Whether a sale is inter-state is taken from the
+# saved taxes: IGST charged means inter-state.
+def classify_invoices(seller, df_invoices, df_customers, year, month):
+    dates = pd.to_datetime(df_invoices["Date"].astype(str).str.strip(), format="%d/%m/%Y", errors="coerce")
+    inv = df_invoices[(dates.dt.year == int(year)) & (dates.dt.month == int(month))].assign(**{"Invoice Date": dates})
+    inv = inv.astype({"Bill No": str}).drop_duplicates(subset=["Bill No"], keep="last").reset_index(drop=True)
+    for col in AMOUNT_COLUMNS: inv[col] = pd.to_numeric(inv[col], errors='coerce').fillna(0.0).astype(float) if col in inv.columns else 0.0
+    names = inv["Buyer Name"].astype(str)
+    if df_customers is not None and not df_customers.empty:
+        customers = df_customers.astype({"Name": str}).drop_duplicates(subset=["Name"]).set_index("Name")
+        gstin, state = names.map(customers["GSTIN"]), names.map(customers["State"])
+    else: gstin = state = pd.Series("", index=inv.index)
+    gstin = gstin.fillna("").astype(str).str.strip().str.upper()
+    registered = valid_mask(gstin, "gstin")
+    inter = inv["IGST"] > 0
+    pos = gstin.str[:2].where(registered, state.fillna("").astype(str).str.strip().str.casefold().map(STATE_BY_NAME).fillna(""))
+    pos = pos.where((pos != "") | inter, seller_state(seller))
+    inv["GSTIN"] = gstin.where(registered, "")
+    inv["POS"] = pos
+    inv["Inter"] = inter
+    inv["Section"] = np.select([registered, inter & (inv["Grand Total"] > B2CL_LIMIT)], ["B2B", "B2CL"], "B2CS")
+    return inv
+
+# Lines of the classified invoices: InvoiceLines rows where they exist (each
+# (Bill No, Line) once, as the outbox may deliver a row twice), the invoice's
+# Items JSON otherwise, and a single line implied from the totals (taxable
+# value at the nearest GST rate) for invoices with neither.
+def period_lines(inv, df_lines=None):
+    lines = df_lines if df_lines is not None and not df_lines.empty else pd.DataFrame(columns=LINE_COLUMNS)
+    lines = unique_lines(lines[_isin(lines["Bill No"].astype(str), inv["Bill No"])])
+    missing = inv[~_isin(inv["Bill No"], lines["Bill No"].unique())]
+    if not missing.empty: lines = pd.concat([lines, typed_lines(explode_invoices(missing))], ignore_index=True)
+    bare = inv[~_isin(inv["Bill No"], lines["Bill No"].unique())]
+    if not bare.empty:
+        tax = bare[["CGST", "SGST", "IGST"]].sum(axis=1)
+        implied = np.where(bare["Total Taxable"] > 0, tax / bare["Total Taxable"].where(bare["Total Taxable"] > 0, 1) * 100, 0)
+        rates = np.asarray(GST_RATES)[np.abs(np.subtract.outer(implied, GST_RATES)).argmin(axis=1)]
+        lines = pd.concat([lines, pd.DataFrame({"Bill No": bare["Bill No"].to_numpy(), "Line": 1, "Description": "", "HSN": "", "Qty": 0.0,
+                                                "UOM": "", "Rate": 0.0, "GST Rate": rates, "Amount": bare["Total Taxable"].to_numpy()})], ignore_index=True)
+    return lines.reset_index(drop=True)
+
+# --- TAX PER LINE ---
+# A return has to carry the tax that was charged, so each invoice's saved
+# IGST/CGST/SGST is spread over its (HSN, rate) groups in proportion to the
+# tax compute_invoice_tax puts on each group (an invoice saved by the billing
+# flow gets exactly its own rounding back), then over each group's lines by
+# taxable value. Shares are whole paise: floors first, then the paise left
+# over go to the largest remainders, so every group adds up exactly.
+def _apportion(total, weight, gid):
+    if len(gid) == 0: return np.zeros(0, dtype=np.int64)
+    total, weight = np.asarray(total, dtype=float), np.asarray(weight, dtype=float)
+    wsum, n = np.bincount(gid, weights=weight)[gid], np.bincount(gid)[gid]
+    share = np.where(wsum > 0, total * weight / np.where(wsum > 0, wsum, 1), total / n)
+    base = np.floor(share + 1e-9)
+    left = np.rint(total - np.bincount(gid, weights=base)[gid])
+    order = np.lexsort((base - share, gid))
+    starts = np.flatnonzero(np.r_[True, np.diff(gid[order]) != 0])
+    rank = np.empty(len(gid), dtype=np.int64)
+    rank[order] = np.arange(len(gid)) - np.repeat(starts, np.diff(np.r_[starts, len(gid)]))
+    return (base + (rank < left)).astype(np.int64)
+
+def _line_tax(lines, inv):
+    lines = lines.reset_index(drop=True)
+    group = lines.groupby(["Bill No", lines["HSN"].fillna(""), "rt"], sort=False).ngroup().to_numpy()
+    groups = pd.DataFrame({"Bill No": lines["Bill No"], "rt": lines["rt"], "txval": lines["txval"]}).groupby(group).agg(
+        bill=("Bill No", "first"), rt=("rt", "first"), txval=("txval", "sum"))
+    bill = groups.groupby("bill", sort=False).ngroup().to_numpy()
+    saved = inv.set_index("Bill No")
+    for head, col, divisor in (("iamt", "IGST", 100), ("camt", "CGST", 200), ("samt", "SGST", 200)):
+        charged = gst_paise(groups["txval"], groups["rt"], divisor)
+        weight = np.where(np.bincount(bill, weights=charged)[bill] > 0, charged, groups["txval"])
+        per_group = _apportion(to_paise(groups["bill"].map(saved[col])), weight, bill)
+        lines[head] = _apportion(per_group[group], lines["txval"], group)
+    return lines
+
+# --- RETURNS ---
+# Returns {"invoices", "b2b", "b2cl", "b2cs", "hsn", "gstr3b", "warnings"}.
+# Rate rows carry amounts in paise (txval/iamt/camt/samt), with the tax saved
+# on each invoice spread over its lines. GSTR-1, the HSN summary and GSTR-3B
+# are all summed from those lines, so they agree with each other and with the
+# tax charged on the invoices.
+def build_returns(seller, df_invoices, df_customers, year, month, df_lines=None):
+    inv = classify_invoices(seller, df_invoices, df_customers, year, month)
+    lines = period_lines(inv, df_lines).merge(inv[["Bill No", "Inter", "Section", "POS"]], on="Bill No")
+    lines["txval"] = to_paise(lines["Amount"])
+    lines = _line_tax(lines.rename(columns={"GST Rate": "rt"}), inv)
+    amounts = ["txval", "iamt", "camt", "samt"]
+
+    rates = lines.groupby(["Bill No", "rt", "Inter"], as_index=False)[amounts].sum()
+    header = inv[["Bill No", "Invoice Date", "Buyer Name", "GSTIN", "POS", "Grand Total", "Section"]]
+    rates = rates.merge(header, on="Bill No").sort_values(["Invoice Date", "Bill No", "rt"], kind="stable")
+    b2b = rates[rates["Section"] == "B2B"].reset_index(drop=True)
+    b2cl = rates[rates["Section"] == "B2CL"].reset_index(drop=True)
+    b2cs = rates[rates["Section"] == "B2CS"].groupby(["Inter", "POS", "rt"], as_index=False)[amounts].sum()
+
+    lines["UQC"] = lines["UOM"].str.strip().str.upper().map(UQC).fillna("OTH")
+    hsn = lines.groupby(["HSN", "UQC", "rt"], as_index=False).agg(desc=("Description", "first"), qty=("Qty", "sum"), txval=("txval", "sum"),
+                                                                   iamt=("iamt", "sum"), camt=("camt", "sum"), samt=("samt", "sum"))
+    hsn["val"] = hsn["txval"] + hsn["iamt"] + hsn["camt"] + hsn["samt"]
+
+    taxed = rates["rt"] > 0
+    tax = rates[["iamt", "camt", "samt"]].sum()
+    unreg_inter = rates[(rates["Section"] != "B2B") & rates["Inter"]].groupby("POS", as_index=False)[["txval", "iamt"]].sum()
+    gstr3b = {
+        "osup_det": {"txval": float(_rupees(rates.loc[taxed, "txval"].sum())), **{k: float(_rupees(tax[k])) for k in ("iamt", "camt", "samt")}, "csamt": 0.0},
+        "osup_nil_exmp": {"txval": float(_rupees(rates.loc[~taxed, "txval"].sum()))},
+        "unreg_details": [{"pos": pos, "txval": float(_rupees(t)), "iamt": float(_rupees(i))} for pos, t, i in unreg_inter.itertuples(index=False)],
+    }
+    warnings = [f"Invoice {b}: place of supply unknown (set the customer's State)" for b in inv.loc[inv["POS"] == "", "Bill No"]]
+    return {"invoices": inv, "b2b": b2b, "b2cl": b2cl, "b2cs": b2cs, "hsn": hsn, "gstr3b": gstr3b, "warnings": warnings}
+
+def summary(report):
+    inv = report["invoices"]
+    rows = inv.groupby("Section").agg(Invoices=("Bill No", "size"), Taxable=("Total Taxable", "sum"), IGST=("IGST", "sum"),
+                                      CGST=("CGST", "sum"), SGST=("SGST", "sum"), Value=("Grand Total", "sum"))
+    return rows.reindex(["B2B", "B2CL", "B2CS"]).fillna(0).astype({"Invoices": int}).reset_index()
+
+# --- GSTR-1 JSON ---
+# B2B items carry all three taxes; B2CL invoices are inter-state by definition
+# and carry IGST only.
+def _itm(num, row, b2b):
+    det = {"txval": float(_rupees(row["txval"])), "rt": float(row["rt"]), "iamt": float(_rupees(row["iamt"]))}
+    if b2b: det.update(camt=float(_rupees(row["camt"])), samt=float(_rupees(row["samt"])))
+    det["csamt"] = 0.0
+    return {"num": num, "itm_det": det}
+
+def _invoices(records, b2b):
+    out = []
+    for bill_no, rows in groupby(records, key=lambda r: r["Bill No"]):
+        rows = list(rows); first = rows[0]
+        entry = {"inum": bill_no, "idt": first["Invoice Date"].strftime("%d-%m-%Y"), "val": round(float(first["Grand Total"]), 2)}
+        if b2b: entry.update(pos=first["POS"], rchrg="N", inv_typ="R")
+        entry["itms"] = [_itm(n, r, b2b) for n, r in enumerate(rows, 1)]
+        out.append(entry)
+    return out
+
+def gstr1_json(seller, fp, report):
+    b2b = report["b2b"].sort_values(["GSTIN", "Invoice Date", "Bill No"], kind="stable").to_dict('records')
+    b2cl = report["b2cl"].sort_values(["POS", "Invoice Date", "Bill No"], kind="stable").to_dict('records')
+    doc = {"gstin": seller.get("GSTIN", ""), "fp": fp, "version": GSTR1_VERSION, "hash": "hash"}
+    doc["b2b"] = [{"ctin": ctin, "inv": _invoices(rows, True)} for ctin, rows in groupby(b2b, key=lambda r: r["GSTIN"])]
+    doc["b2cl"] = [{"pos": pos, "inv": _invoices(rows, False)} for pos, rows in groupby(b2cl, key=lambda r: r["POS"])]
+    doc["b2cs"] = [{"sply_ty": "INTER" if r["Inter"] else "INTRA", "pos": r["POS"], "typ": "OE", "rt": float(r["rt"]), "txval": float(_rupees(r["txval"])),
+                    "iamt": float(_rupees(r["iamt"])), "camt": float(_rupees(r["camt"])), "samt": float(_rupees(r["samt"])), "csamt": 0.0}
+                   for r in report["b2cs"].to_dict('records')]
+    doc["hsn"] = {"data": [{"num": n, "hsn_sc": r["HSN"], "desc": r["desc"], "uqc": r["UQC"], "qty": round(float(r["qty"]), 3), "rt": float(r["rt"]),
+                            "val": float(_rupees(r["val"])), "txval": float(_rupees(r["txval"])), "iamt": float(_rupees(r["iamt"])),
+                            "camt": float(_rupees(r["camt"])), "samt": float(_rupees(r["samt"])), "csamt": 0.0}
+                           for n, r in enumerate(report["hsn"].to_dict('records'), 1)]}
+    for key in ("b2b", "b2cl", "b2cs"):
+        if not doc[key]: del doc[key]
+    return doc
+
+def gstr3b_json(seller, fp, report):
+    t = report["gstr3b"]
+    return {"gstin": seller.get("GSTIN", ""), "ret_period": fp,
+            "sup_details": {"osup_det": t["osup_det"], "osup_zero": {"txval": 0.0, "iamt": 0.0, "csamt": 0.0},
+                            "osup_nil_exmp": t["osup_nil_exmp"], "isup_rev": {"txval": 0.0, "iamt": 0.0, "camt": 0.0, "samt": 0.0, "csamt": 0.0},
+                            "osup_nongst": {"txval": 0.0}},
+            "inter_sup": {"unreg_details": t["unreg_details"], "comp_details": [], "uin_details": []}}
+
+# --- GSTR-1 EXCEL ---
+# Same sheets and headers as the GST offline tool's Excel template.
+def gstr1_frames(report):
+    b2b, b2cl, b2cs, hsn = report["b2b"], report["b2cl"], report["b2cs"], report["hsn"]
+    idt = lambda df: df["Invoice Date"].dt.strftime("%d-%b-%y")
+    frames = {
+        "b2b": pd.DataFrame({"GSTIN/UIN of Recipient": b2b["GSTIN"], "Receiver Name": b2b["Buyer Name"], "Invoice Number": b2b["Bill No"],
+                             "Invoice date": idt(b2b), "Invoice Value": b2b["Grand Total"].round(2), "Place Of Supply": _pos_label(b2b["POS"]),
+                             "Reverse Charge": "N", "Applicable % of Tax Rate": "", "Invoice Type": "Regular B2B", "E-Commerce GSTIN": "",
+                             "Rate": b2b["rt"], "Taxable Value": _rupees(b2b["txval"]), "Cess Amount": 0.0}),
+        "b2cl": pd.DataFrame({"Invoice Number": b2cl["Bill No"], "Invoice date": idt(b2cl), "Invoice Value": b2cl["Grand Total"].round(2),
+                              "Place Of Supply": _pos_label(b2cl["POS"]), "Applicable % of Tax Rate": "", "Rate": b2cl["rt"],
+                              "Taxable Value": _rupees(b2cl["txval"]), "Cess Amount": 0.0, "E-Commerce GSTIN": ""}),
+        "b2cs": pd.DataFrame({"Type": "OE", "Place Of Supply": _pos_label(b2cs["POS"]), "Applicable % of Tax Rate": "", "Rate": b2cs["rt"],
+                              "Taxable Value": _rupees(b2cs["txval"]), "Cess Amount": 0.0, "E-Commerce GSTIN": ""}),
+        "hsn": pd.DataFrame({"HSN": hsn["HSN"], "Description": hsn["desc"], "UQC": hsn["UQC"].map(lambda u: f"{u}-{UQC_NAMES[u]}"),
+                             "Total Quantity": hsn["qty"].round(3), "Total Value": _rupees(hsn["val"]), "Rate": hsn["rt"], "Taxable Value": _rupees(hsn["txval"]),
+                             "Integrated Tax Amount": _rupees(hsn["iamt"]), "Central Tax Amount": _rupees(hsn["camt"]),
+                             "State/UT Tax Amount": _rupees(hsn["samt"]), "Cess Amount": 0.0}),
+    }
+    return {name: df.reindex(columns=EXCEL_SHEETS[name]) for name, df in frames.items()}
+
+def gstr1_excel(report):
+    out = io.BytesIO()
+    with pd.ExcelWriter(out, engine="xlsxwriter") as writer:
+        for name, df in gstr1_frames(report).items(): df.to_excel(writer, sheet_name=name, index=False)
+    return out.getvalue()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build GSTR-1 (JSON and Excel) and GSTR-3B for one tenant and month.")
+    parser.add_argument("--user-id", required=True)
+    parser.add_argument("--period", required=True, help="MMYYYY, e.g. 042025")
+    parser.add_argument("--out", default=".", help="directory for the output files")
+    parser.add_argument("--backend", default=STORAGE_BACKEND, choices=["gsheets", "sqlite"])
+    args = parser.parse_args()
+    conn = None
+    if args.backend == "gsheets":
+        import streamlit as st
+        from streamlit_gsheets import GSheetsConnection
+        conn = st.connection("gsheets", type=GSheetsConnection)
+    storage = open_backend(args.backend, gsheets_conn=conn)
+    seller = storage.read_user("Users", args.user_id).iloc[0].to_dict()
+    month, year = int(args.period[:2]), int(args.period[2:])
+    report = build_returns(seller, storage.read_user("Invoices", args.user_id), storage.read_user("Customers", args.user_id), year, month,
+                           storage.read_user("InvoiceLines", args.user_id))
+    stem = os.path.join(args.out, f"{seller.get('GSTIN') or args.user_id}_{args.period}")
+    with open(f"{stem}_GSTR1.json", "w") as f: json.dump(gstr1_json(seller, args.period, report), f, indent=1)
+    with open(f"{stem}_GSTR1.xlsx", "wb") as f: f.write(gstr1_excel(report))
+    with open(f"{stem}_GSTR3B.json", "w") as f: json.dump(gstr3b_json(seller, args.period, report), f, indent=1)
+    print(summary(report).to_string(index=False))
+    for warning in report["warnings"]: print("warning:", warning)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+import hashlib
+import io
+import json
+import os
+
+import pandas as pd
+from openpyxl import load_workbook
+
+from hk_validation import error_report, gstin_columns, validate_columns
+
+# --- CONFIGURATION ---
+IMPORT_STATE_FILE = os.environ.get("HK_IMPORT_STATE", "hisaabkeeper_imports.json")
+CUSTOMER_IMPORT_COLS = ["Name", "GSTIN", "Address 1", "Address 2", "Address 3", "State", "Mobile", "Email"]
+CUSTOMER_RULES = {"GSTIN": "gstin", "Mobile": "mobile", "Email": "email"}
+
+def _text(value):
+    if value is None: return ""
+    if isinstance(value, float):
+        if value != value: return ""
+        if value.is_integer(): value = int(value)  # mobiles typed as numbers in Excel
+    return str(value).strip()
+
+# --- CHUNKED READER ---
+# .xlsx is streamed row by row through openpyxl's read-only mode; each chunk
+# carries the source row number in "_row" for the error report.
+def iter_workbook_chunks(file, chunk_size=1000, file_name=""):
+    if str(file_name or getattr(file, "name", "")).lower().endswith(".xls"):
+        df = pd.read_excel(file, dtype=object)
+        df.insert(0, "_row", range(2, len(df) + 2))
+        for start in range(0, len(df), chunk_size): yield df.iloc[start:start + chunk_size].reset_index(drop=True)
+        return
+    wb = load_workbook(file, read_only=True, data_only=True)
+    try:
+        rows = wb.worksheets[0].iter_rows(values_only=True)
+        header = ["_row"] + [_text(h) for h in next(rows, ())]
+        chunk = []
+        for row_no, values in enumerate(rows, start=2):
+            if all(v is None for v in values): continue
+            chunk.append((row_no,) + tuple(values[:len(header) - 1]) + (None,) * (len(header) - 1 - len(values)))
+            if len(chunk) >= chunk_size:
+                yield pd.DataFrame(chunk, columns=header); chunk = []
+        if chunk: yield pd.DataFrame(chunk, columns=header)
+    finally: wb.close()
+
+def count_workbook_rows(file):
+    try:
+        wb = load_workbook(file, read_only=True)
+        n = (wb.worksheets[0].max_row or 1) - 1
+        wb.close()
+        return max(n, 0)
+    except Exception: return 0
+    finally:
+        if hasattr(file, "seek"): file.seek(0)
+
+# --- VALIDATION ---
+def validate_customer_chunk(chunk):
+    df = pd.DataFrame({"_row": chunk["_row"]})
+    for col in CUSTOMER_IMPORT_COLS: df[col] = chunk[col].map(_text) if col in chunk.columns else ""
+    df["GSTIN"] = df["GSTIN"].str.upper()
+    errors = validate_columns(df, CUSTOMER_RULES, required=["Name"])
+    df["State"] = df["State"].where(df["State"] != "", gstin_columns(df["GSTIN"])["State"])
+    return df.loc[errors == "", CUSTOMER_IMPORT_COLS], error_report(df, errors)
+
+# --- CHECKPOINTS ---
+def import_job_id(user_id, data):
+    return hashlib.sha1(str(user_id).encode() + b"\0" + data).hexdigest()
+
+def _load_state(path):
+    try:
+        with open(path) as f: return json.load(f)
+    except (OSError, ValueError): return {}
+
+def _save_state(path, state):
+    tmp = path + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump(state, f); f.flush(); os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+def import_progress(job_id, path=IMPORT_STATE_FILE):
+    return _load_state(path).get(job_id, {"done": 0, "imported": 0, "rejected": 0})
+
+# A batch is marked pending before it is appended. If the import stopped
+# between the append and the checkpoint, the resumed run drops the rows of
+# that batch that are already saved (same Name and GSTIN) instead of
+# appending them twice.
+def _already_saved(storage, user_id, rows):
+    existing = storage.read_user("Customers", user_id)
+    key = lambda df: df["Name"].fillna("").astype(str).str.strip() + "\0" + df["GSTIN"].fillna("").astype(str).str.strip().str.upper()
+    return key(rows).isin(set(key(existing))) if not existing.empty else pd.Series(False, index=rows.index)
+
+# --- PIPELINE ---
+# Rows are validated and appended one bounded batch at a time, and the number
+# of source rows consumed is checkpointed after every batch, so re-running the
+# same file for the same user resumes after the last committed batch.
+def import_customers(storage, file, user_id, batch_size=1000, progress=None, state_path=IMPORT_STATE_FILE, file_name=""):
+    if hasattr(file, "getvalue"): data = file.getvalue()
+    else:
+        with open(file, "rb") as f: data = f.read()
+    job_id = import_job_id(user_id, data)
+    state = _load_state(state_path)
+    job = state.get(job_id, {"done": 0, "imported": 0, "rejected": 0})
+    resumed_from = job["done"]
+    total = count_workbook_rows(io.BytesIO(data)) if not str(file_name).lower().endswith(".xls") else 0
+    reports = []
+    seen = 0
+    for chunk in iter_workbook_chunks(io.BytesIO(data), batch_size, file_name):
+        start = seen; seen += len(chunk)
+        if seen <= job["done"]: continue
+        if job["done"] > start: chunk = chunk.iloc[job["done"] - start:]
+        valid, report = validate_customer_chunk(chunk)
+        n_valid = len(valid)
+        if job.get("pending", 0) > start and not valid.empty: valid = valid[~_already_saved(storage, user_id, valid)]
+        state[job_id] = {**job, "pending": seen}
+        _save_state(state_path, state)
+        if not valid.empty: storage.append("Customers", valid.assign(UserID=str(user_id)).to_dict('records'))
+        reports.append(report)
+        job = {"done": seen, "imported": job["imported"] + n_valid, "rejected": job["rejected"] + len(report)}
+        state[job_id] = job
+        _save_state(state_path, state)
+        if progress: progress(job["done"], max(total, job["done"]))
+    state.pop(job_id, None)
+    _save_state(state_path, state)
+    errors = pd.concat(reports, ignore_index=True) if reports else pd.DataFrame(columns=["Row", "Name", "Errors"])
+    return {"job_id": job_id, "imported": job["imported"], "rejected": job["rejected"], "resumed_from": resumed_from, "errors": errors}
@@ -0,0 +1,191 @@
+import argparse
+import os
+import sqlite3
+import threading
+import time
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from hk_storage import STORAGE_BACKEND, open_backend
+from hk_tax import to_paise
+
+# --- CONFIGURATION ---
+LEDGER_FILE = os.environ.get("HK_LEDGER_DB", "hisaabkeeper_ledger.db")
+# Invoices that go on the customer's account. The standard billing flow saves
+# no payment mode, and its invoices are billed on account as well.
+CREDIT_MODES = ["Credit", ""]
+RECEIPT_MODES = ["Cash", "Online", "Cheque"]
+AGEING_BUCKETS = [(0, 30, "0-30"), (31, 60, "31-60"), (61, 90, "61-90"), (91, None, "90+")]
+ENTRY_COLUMNS = ["Party", "Date", "Type", "Ref", "Debit", "Credit", "Note"]
+TYPE_ORDER = {"Invoice": 0, "Receipt": 1}  # same-day invoices first, so a receipt never shows as an advance
+
+def _paise(values): return to_paise(pd.to_numeric(values, errors='coerce').fillna(0.0))
+
+def _dates(values): return pd.to_datetime(values.astype(str).str.strip(), format="%d/%m/%Y", errors="coerce")
+
+def _text(df, col): return df[col].fillna("").astype(str).str.strip() if col in df.columns else pd.Series("", index=df.index)
+
+# --- ENTRIES ---
+# Invoices on account are debits and receipts are credits, one row each,
+# amounts in paise. A Bill No or Receipt No seen twice counts once (the outbox
+# delivers at least once); receipts saved without a number are all kept. Both
+# numbers are unique per tenant: the app rejects a reused Bill No before
+# saving and stamps each receipt with its own number.
+def invoice_entries(df_invoices):
+    if df_invoices.empty: return pd.DataFrame(columns=ENTRY_COLUMNS)
+    df = df_invoices.drop_duplicates(subset=["Bill No"], keep="last") if "Bill No" in df_invoices.columns else df_invoices
+    df = df[_text(df, "Payment Mode").isin(CREDIT_MODES)]
+    return pd.DataFrame({"Party": _text(df, "Buyer Name"), "Date": _dates(_text(df, "Date")), "Type": "Invoice", "Ref": _text(df, "Bill No"),
+                         "Debit": _paise(df["Grand Total"]), "Credit": 0, "Note": _text(df, "Payment Mode")}, columns=ENTRY_COLUMNS).reset_index(drop=True)
+
+def receipt_entries(df_receipts):
+    if df_receipts.empty: return pd.DataFrame(columns=ENTRY_COLUMNS)
+    ref = _text(df_receipts, "Receipt No")
+    df = df_receipts[(ref == "") | ~ref.duplicated(keep="last")]
+    return pd.DataFrame({"Party": _text(df, "Party Name"), "Date": _dates(_text(df, "Date")), "Type": "Receipt", "Ref": _text(df, "Receipt No"),
+                         "Debit": 0, "Credit": _paise(df["Amount"]), "Note": (_text(df, "Mode") + " " + _text(df, "Note")).str.strip()},
+                        columns=ENTRY_COLUMNS).reset_index(drop=True)
+
+def ledger_entries(df_invoices, df_receipts):
+    entries = pd.concat([invoice_entries(df_invoices), receipt_entries(df_receipts)], ignore_index=True)
+    entries = entries.astype({"Debit": "int64", "Credit": "int64", "Date": "datetime64[ns]"})
+    order = entries["Type"].map(TYPE_ORDER)
+    return entries.assign(_order=order).sort_values(["Party", "Date", "_order"], kind="stable", na_position="last").drop(columns="_order").reset_index(drop=True)
+
+# One party's entries with a running balance, amounts in rupees. A negative
+# balance is an advance.
+def party_statement(entries, party):
+    df = entries[entries["Party"] == party].copy()
+    df["Balance"] = (df["Debit"] - df["Credit"]).cumsum() / 100
+    df[["Debit", "Credit"]] = df[["Debit", "Credit"]] / 100
+    df["Date"] = df["Date"].dt.strftime("%d/%m/%Y")
+    return df[["Date", "Type", "Ref", "Note", "Debit", "Credit", "Balance"]].reset_index(drop=True)
+
+# --- AGEING ---
+# Receipts settle a party's invoices oldest first, so an invoice is open for
+# whatever its cumulative debit exceeds the party's total receipts. Open
+# amounts are bucketed by days since the invoice; undated invoices go to the
+# oldest bucket. Credit beyond all invoices is reported as an advance.
+def ageing(entries, as_of=None):
+    as_of = pd.Timestamp(as_of or date.today())
+    labels = [label for _, _, label in AGEING_BUCKETS]
+    columns = ["Party", "Balance", *labels, "Advance"]
+    if entries.empty: return pd.DataFrame(columns=columns)
+    received = entries.groupby("Party")["Credit"].sum()
+    inv = entries[entries["Type"] == "Invoice"].sort_values(["Party", "Date"], kind="stable", na_position="first")
+    open_paise = (inv.groupby("Party")["Debit"].cumsum() - inv["Party"].map(received).fillna(0)).clip(lower=0).clip(upper=inv["Debit"])
+    days = (as_of - inv["Date"]).dt.days.fillna(np.iinfo(np.int32).max)
+    edges = [lo for lo, _, _ in AGEING_BUCKETS][1:]
+    bucket = np.asarray(labels)[np.searchsorted(edges, days.to_numpy(), side="right")]
+    table = pd.DataFrame({"Party": inv["Party"], "Bucket": bucket, "Open": open_paise}).pivot_table(index="Party", columns="Bucket", values="Open", aggfunc="sum")
+    table = table.reindex(index=received.index, columns=labels).fillna(0)
+    table["Advance"] = (received - entries.groupby("Party")["Debit"].sum()).clip(lower=0)
+    table["Balance"] = table[labels].sum(axis=1) - table["Advance"]
+    table = table[(table[labels].sum(axis=1) > 0) | (table["Advance"] > 0)]
+    table = (table / 100).rename_axis(columns=None).reset_index()
+    return table[columns].sort_values("Balance", ascending=False, kind="stable").reset_index(drop=True)
+
+# --- BALANCE CACHE ---
+# Per-party totals per tenant in a local SQLite file, like the dashboard
+# rollups. Saving an invoice or receipt adds it to the party's row (amounts
+# in paise); the applied-entry table, keyed on the unique Bill No or Receipt
+# No, makes that idempotent. The file can be rebuilt from Invoices and
+# Receipts at any time.
+class LedgerStore:
+    def __init__(self, path=LEDGER_FILE):
+        self.path = path
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        with self.db:
+            self.db.execute("""CREATE TABLE IF NOT EXISTS ledger_balances (
+                user_id TEXT NOT NULL, party TEXT NOT NULL, debit INTEGER NOT NULL DEFAULT 0, credit INTEGER NOT NULL DEFAULT 0,
+                invoices INTEGER NOT NULL DEFAULT 0, receipts INTEGER NOT NULL DEFAULT 0, last_date TEXT NOT NULL DEFAULT '',
+                PRIMARY KEY (user_id, party))""")
+            self.db.execute("CREATE TABLE IF NOT EXISTS ledger_applied (user_id TEXT NOT NULL, kind TEXT NOT NULL, ref TEXT NOT NULL, PRIMARY KEY (user_id, kind, ref))")
+            self.db.execute("CREATE TABLE IF NOT EXISTS ledger_meta (user_id TEXT PRIMARY KEY, built REAL NOT NULL)")
+
+    def _apply(self, user_id, entries):
+        df = entries.assign(Day=entries["Date"].dt.strftime("%Y-%m-%d").fillna(""), IsInvoice=entries["Type"] == "Invoice")
+        totals = df.groupby("Party").agg(debit=("Debit", "sum"), credit=("Credit", "sum"), invoices=("IsInvoice", "sum"),
+                                        receipts=("IsInvoice", lambda s: int((~s).sum())), last=("Day", "max"))
+        self.db.executemany("""INSERT INTO ledger_balances (user_id, party, debit, credit, invoices, receipts, last_date) VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (user_id, party) DO UPDATE SET debit = debit + excluded.debit, credit = credit + excluded.credit,
+            invoices = invoices + excluded.invoices, receipts = receipts + excluded.receipts, last_date = MAX(last_date, excluded.last_date)""",
+            [(user_id, party, int(d), int(c), int(i), int(r), last) for party, d, c, i, r, last in totals.itertuples()])
+
+    def _add(self, user_id, entries):
+        if entries.empty: return False
+        user_id = str(user_id)
+        kind, ref = entries["Type"][0], entries["Ref"][0]
+        with self.lock, self.db:
+            if ref and self.db.execute("INSERT OR IGNORE INTO ledger_applied (user_id, kind, ref) VALUES (?, ?, ?)", (user_id, kind, ref)).rowcount == 0: return False
+            self._apply(user_id, entries)
+        return True
+
+    # Both return False when the row was already counted or is not on account.
+    def add_invoice(self, row): return self._add(row.get("UserID", ""), invoice_entries(pd.DataFrame([row])))
+    def add_receipt(self, row): return self._add(row.get("UserID", ""), receipt_entries(pd.DataFrame([row])))
+
+    def rebuild(self, user_id, df_invoices, df_receipts):
+        user_id = str(user_id)
+        entries = ledger_entries(df_invoices, df_receipts)
+        with self.lock, self.db:
+            for table in ("ledger_balances", "ledger_applied"): self.db.execute(f"DELETE FROM {table} WHERE user_id = ?", (user_id,))
+            keyed = entries[entries["Ref"] != ""]
+            self.db.executemany("INSERT OR IGNORE INTO ledger_applied (user_id, kind, ref) VALUES (?, ?, ?)", [(user_id, k, r) for k, r in zip(keyed["Type"], keyed["Ref"])])
+            if not entries.empty: self._apply(user_id, entries)
+            self.db.execute("INSERT OR REPLACE INTO ledger_meta (user_id, built) VALUES (?, ?)", (user_id, time.time()))
+        return len(entries)
+
+    def is_built(self, user_id):
+        with self.lock: return self.db.execute("SELECT 1 FROM ledger_meta WHERE user_id = ?", (str(user_id),)).fetchone() is not None
+
+    # Forces a rebuild on next use, e.g. after an add that failed half-way.
+    def invalidate(self, user_id):
+        with self.lock, self.db: self.db.execute("DELETE FROM ledger_meta WHERE user_id = ?", (str(user_id),))
+
+    # Parties with their totals in rupees, largest balance first.
+    def balances(self, user_id):
+        with self.lock:
+            rows = self.db.execute("""SELECT party, debit, credit, debit - credit, invoices, receipts, last_date FROM ledger_balances
+                                      WHERE user_id = ? ORDER BY debit - credit DESC, party""", (str(user_id),)).fetchall()
+        df = pd.DataFrame(rows, columns=["Party", "Invoiced", "Received", "Balance", "Invoices", "Receipts", "Last Entry"])
+        df[["Invoiced", "Received", "Balance"]] = df[["Invoiced", "Received", "Balance"]].astype(float) / 100
+        return df
+
+    def balance(self, user_id, party):
+        with self.lock:
+            row = self.db.execute("SELECT debit - credit FROM ledger_balances WHERE user_id = ? AND party = ?", (str(user_id), str(party))).fetchone()
+        return row[0] / 100 if row else 0.0
+
+    def stats(self):
+        with self.lock:
+            return {"tenants": self.db.execute("SELECT COUNT(*) FROM ledger_meta").fetchone()[0],
+                    "parties": self.db.execute("SELECT COUNT(*) FROM ledger_balances").fetchone()[0],
+                    "entries": self.db.execute("SELECT COUNT(*) FROM ledger_applied").fetchone()[0]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild the customer balance cache from the Invoices and Receipts tables.")
+    parser.add_argument("--user-id", action="append", help="tenant to rebuild (repeatable; default all)")
+    parser.add_argument("--backend", default=STORAGE_BACKEND, choices=["gsheets", "sqlite"])
+    parser.add_argument("--db", default=LEDGER_FILE)
+    args = parser.parse_args()
+    conn = None
+    if args.backend == "gsheets":
+        import streamlit as st
+        from streamlit_gsheets import GSheetsConnection
+        conn = st.connection("gsheets", type=GSheetsConnection)
+    storage = open_backend(args.backend, gsheets_conn=conn)
+    invoices, receipts = storage.read("Invoices"), storage.read("Receipts")
+    for df in (invoices, receipts): df["UserID"] = df["UserID"].astype(str)
+    store = LedgerStore(args.db)
+    for user_id in args.user_id or sorted(set(invoices["UserID"]) | set(receipts["UserID"])):
+        print(f"{user_id}: {store.rebuild(user_id, invoices[invoices['UserID'] == str(user_id)], receipts[receipts['UserID'] == str(user_id)])} entries")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+import argparse
+import itertools
+import json
+import tempfile
+
+import pandas as pd
+
+from hk_export import SPOOL_LIMIT
+from hk_storage import SCHEMA, STORAGE_BACKEND, open_backend
+from hk_tax import line_amounts
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+# --- CONFIGURATION ---
+LINE_COLUMNS = SCHEMA["InvoiceLines"]
+ITEM_FIELDS = ["Description", "HSN", "Qty", "UOM", "Rate", "GST Rate"]
+TEXT_COLUMNS = ["UserID", "Bill No", "Description", "HSN", "UOM"]
+NUMBER_COLUMNS = ["Qty", "Rate", "GST Rate", "Amount"]
+LINE_FORMATS = {"parquet": ("application/vnd.apache.parquet", "parquet"), "arrow": ("application/vnd.apache.arrow.file", "arrow")}
+
+def arrow_schema():
+    return pa.schema([("UserID", pa.string()), ("Bill No", pa.string()), ("Line", pa.int32()), ("Date", pa.date32()),
+                      ("Description", pa.string()), ("HSN", pa.string()), ("Qty", pa.float64()), ("UOM", pa.string()),
+                      ("Rate", pa.float64()), ("GST Rate", pa.float64()), ("Amount", pa.float64())])
+
+# --- EXPLODING INVOICES ---
+# Invoice rows carry their lines as JSON text in "Items". These helpers turn
+# them into one row per line keyed by (UserID, Bill No, Line). Amount is the
+# line's taxable value: the saved "Base Amount" where the billing flow stored
+# one, otherwise Qty x Rate.
+def _parse_items(text):
+    try: items = json.loads(text) if isinstance(text, str) and text.strip() else []
+    except ValueError: return []
+    return [item for item in items if isinstance(item, dict)] if isinstance(items, list) else []
+
+def explode_invoices(df_invoices):
+    if df_invoices.empty or "Items" not in df_invoices.columns: return pd.DataFrame(columns=LINE_COLUMNS)
+    base = df_invoices.reindex(columns=["UserID", "Bill No", "Date", "Items"]).astype({"UserID": str, "Bill No": str})
+    base = base.drop_duplicates(subset=["UserID", "Bill No"], keep="last")
+    base = base.assign(Items=base["Items"].map(_parse_items)).explode("Items", ignore_index=True).dropna(subset=["Items"])
+    if base.empty: return pd.DataFrame(columns=LINE_COLUMNS)
+    items = pd.DataFrame(base["Items"].tolist(), index=base.index)
+    lines = base[["UserID", "Bill No", "Date"]].join(items.reindex(columns=ITEM_FIELDS + ["Base Amount"]))
+    lines["Line"] = lines.groupby(["UserID", "Bill No"]).cumcount() + 1
+    for col in ("Qty", "Rate", "GST Rate"): lines[col] = pd.to_numeric(lines[col], errors='coerce').fillna(0.0)
+    saved = pd.to_numeric(lines["Base Amount"], errors='coerce')
+    lines["Amount"] = saved.fillna(pd.Series(line_amounts(lines["Qty"], lines["Rate"]), index=lines.index))
+    for col in ("Description", "HSN", "UOM"): lines[col] = lines[col].fillna("").astype(str)
+    return lines[LINE_COLUMNS].reset_index(drop=True)
+
+def invoice_lines(invoice_row):
+    return explode_invoices(pd.DataFrame([invoice_row])).to_dict('records')
+
+# Lines as read back from a backend (sheet cells are text, SQLite keeps what
+# was saved) with numeric columns as floats and Date as a datetime.
+def typed_lines(df_lines):
+    df = df_lines.reindex(columns=LINE_COLUMNS).copy()
+    for col in TEXT_COLUMNS: df[col] = df[col].fillna("").astype(str)
+    for col in NUMBER_COLUMNS: df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0.0).astype(float)
+    df["Line"] = pd.to_numeric(df["Line"], errors='coerce').fillna(0).astype("int32")
+    df["Date"] = pd.to_datetime(df["Date"].astype(str).str.strip(), format="%d/%m/%Y", errors="coerce")
+    return df
+
+# typed_lines with one row per (UserID, Bill No, Line). The outbox delivers at
+# least once and saved rows are read back together with pending ones, so a
+# line can appear twice; the last copy wins, as for invoices.
+def unique_lines(df_lines):
+    return typed_lines(df_lines).drop_duplicates(subset=["UserID", "Bill No", "Line"], keep="last")
+
+# --- MIGRATION ---
+# Explodes the JSON of every invoice that has no lines yet, so it can be run
+# again after a partial run or to pick up invoices saved without lines.
+def migrate_invoice_lines(storage, user_id=None, chunk_size=500):
+    invoices = storage.read("Invoices") if user_id is None else storage.read_user("Invoices", user_id)
+    done = storage.read("InvoiceLines") if user_id is None else storage.read_user("InvoiceLines", user_id)
+    if not invoices.empty and not done.empty:
+        key = pd.MultiIndex.from_arrays([invoices["UserID"].astype(str), invoices["Bill No"].astype(str)])
+        have = pd.MultiIndex.from_arrays([done["UserID"].astype(str), done["Bill No"].astype(str)])
+        invoices = invoices[~key.isin(have)]
+    lines = explode_invoices(invoices)
+    for start in range(0, len(lines), chunk_size):
+        storage.append("InvoiceLines", lines.iloc[start:start + chunk_size].to_dict('records'))
+    return {"invoices": int(lines["Bill No"].nunique()) if not lines.empty else 0, "lines": len(lines)}
+
+# --- COLUMNAR EXPORT ---
+def write_lines(chunks, out, fmt="parquet"):
+    if pa is None: raise RuntimeError("pyarrow is required for Parquet/Arrow export")
+    schema = arrow_schema()
+    sink = pa.PythonFile(out, mode="w")
+    writer = pq.ParquetWriter(sink, schema, compression="zstd") if fmt == "parquet" else pa.ipc.new_file(sink, schema)
+    n = 0
+    try:
+        for chunk in chunks:
+            if chunk.empty: continue
+            df = typed_lines(chunk)
+            df["Date"] = df["Date"].dt.date
+            writer.write_table(pa.Table.from_pandas(df, schema=schema, preserve_index=False)); n += len(df)
+    finally: writer.close()
+    return n
+
+def export_lines(storage, user_id, fmt="parquet", extra_chunks=(), chunk_size=5000):
+    out = tempfile.SpooledTemporaryFile(max_size=SPOOL_LIMIT)
+    write_lines(itertools.chain(storage.iter_user("InvoiceLines", user_id, chunk_size), extra_chunks), out, fmt)
+    out.seek(0)
+    return out
+
+# --- ITEM REPORTS ---
+def top_sellers(df_lines, n=10):
+    df = unique_lines(df_lines)
+    if df.empty: return pd.DataFrame(columns=["Description", "Qty", "Amount", "Invoices"])
+    report = df.groupby("Description", as_index=False).agg(Qty=("Qty", "sum"), Amount=("Amount", "sum"), Invoices=("Bill No", "nunique"))
+    return report.nlargest(n, "Amount").reset_index(drop=True)
+
+def hsn_turnover(df_lines):
+    df = unique_lines(df_lines)
+    if df.empty: return pd.DataFrame(columns=["HSN", "GST Rate", "Qty", "Taxable", "Lines"])
+    report = df.groupby(["HSN", "GST Rate"], as_index=False).agg(Qty=("Qty", "sum"), Taxable=("Amount", "sum"), Lines=("Line", "size"))
+    return report.sort_values("Taxable", ascending=False).reset_index(drop=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Explode invoice JSON into InvoiceLines, or export a tenant's lines as Parquet/Arrow.")
+    parser.add_argument("--backend", default=STORAGE_BACKEND, choices=["gsheets", "sqlite"])
+    parser.add_argument("--user-id", help="limit to one tenant (required for --export)")
+    parser.add_argument("--export", help="write the tenant's lines to this file instead of migrating")
+    parser.add_argument("--format", default="parquet", choices=list(LINE_FORMATS))
+    args = parser.parse_args()
+    conn = None
+    if args.backend == "gsheets":
+        import streamlit as st
+        from streamlit_gsheets import GSheetsConnection
+        conn = st.connection("gsheets", type=GSheetsConnection)
+    storage = open_backend(args.backend, gsheets_conn=conn)
+    if args.export:
+        if not args.user_id: parser.error("--export needs --user-id")
+        with open(args.export, "wb") as f:
+            print(f"wrote {write_lines(storage.iter_where('InvoiceLines', {'UserID': args.user_id}), f, args.format)} lines to {args.export}")
+    else:
+        result = migrate_invoice_lines(storage, args.user_id)
+        print(f"migrated {result['lines']} lines from {result['invoices']} invoices")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+import itertools
+import json
+import os
+import random
+import sqlite3
+import threading
+import time
+
+import pandas as pd
+
+from hk_storage import SCHEMA, rows_to_values, to_cell
+
+# --- CONFIGURATION ---
+OUTBOX_FILE = os.environ.get("HK_OUTBOX_DB", "hisaabkeeper_outbox.db")
+
+def _json_default(value):
+    return to_cell(value) if hasattr(value, "item") else str(value)
+
+
+# --- WRITE-BEHIND QUEUE ---
+# Rows are committed to a local SQLite journal (synchronous=FULL, so the commit
+# is fsynced) and a background thread appends them to the real store in
+# batches. Failed batches back off exponentially; rows left in the journal are
+# picked up again when the process restarts. Delivery is at-least-once: a crash
+# between a successful append and the journal delete resends that batch.
+# Each tenant's rows are delivered in order: a batch is sent as runs of
+# consecutive rows for the same worksheet, and once a row fails that tenant's
+# later rows wait until it has gone through, so lines never land before their
+# invoice. A row stays in the journal (and in pending_frame) until its append
+# has succeeded and the store's cache shows it.
+class WriteBehindQueue:
+    def __init__(self, storage, path=OUTBOX_FILE, batch_size=50, base_delay=1.0, max_delay=300.0, poll_interval=2.0):
+        self.storage = storage
+        self.path = path
+        self.batch_size = batch_size
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.poll_interval = poll_interval
+        self.lock = threading.Lock()
+        self.flush_lock = threading.Lock()
+        self.wake = threading.Event()
+        self.stopping = threading.Event()
+        self.thread = None
+        self.flushed = 0
+        self.failures = 0
+        self.last_error = None
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=FULL")
+        with self.db:
+            self.db.execute("""CREATE TABLE IF NOT EXISTS outbox (
+                id INTEGER PRIMARY KEY AUTOINCREMENT, worksheet TEXT NOT NULL, user_id TEXT, payload TEXT NOT NULL,
+                created REAL NOT NULL, attempts INTEGER NOT NULL DEFAULT 0, next_attempt REAL NOT NULL DEFAULT 0, last_error TEXT)""")
+
+    def enqueue(self, worksheet_name, row):
+        payload = json.dumps(row, default=_json_default)
+        with self.lock, self.db:
+            cur = self.db.execute("INSERT INTO outbox (worksheet, user_id, payload, created) VALUES (?, ?, ?, ?)",
+                                  (worksheet_name, str(row.get("UserID", "")), payload, time.time()))
+        self.wake.set()
+        return cur.lastrowid
+
+    # Several rows in one commit, e.g. the lines of one invoice.
+    def enqueue_many(self, worksheet_name, rows):
+        if not rows: return 0
+        values = [(worksheet_name, str(row.get("UserID", "")), json.dumps(row, default=_json_default), time.time()) for row in rows]
+        with self.lock, self.db:
+            self.db.executemany("INSERT INTO outbox (worksheet, user_id, payload, created) VALUES (?, ?, ?, ?)", values)
+        self.wake.set()
+        return len(values)
+
+    def pending_rows(self, worksheet_name, user_id=None):
+        sql = "SELECT payload FROM outbox WHERE worksheet = ?" + (" AND user_id = ?" if user_id is not None else "") + " ORDER BY id"
+        params = (worksheet_name, str(user_id)) if user_id is not None else (worksheet_name,)
+        with self.lock: rows = self.db.execute(sql, params).fetchall()
+        return [json.loads(r[0]) for r in rows]
+
+    def pending_frame(self, worksheet_name, user_id=None):
+        rows = self.pending_rows(worksheet_name, user_id)
+        header = SCHEMA.get(worksheet_name, list(rows[0].keys()) if rows else [])
+        return pd.DataFrame(rows_to_values(rows, header), columns=header)
+
+    def flush_once(self):
+        with self.flush_lock: return self._flush_due()
+
+    def _flush_due(self):
+        now = time.time()
+        # A row waits while an earlier row of the same tenant is backing off.
+        with self.lock:
+            due = self.db.execute("""SELECT id, worksheet, user_id, payload, attempts FROM outbox AS o WHERE next_attempt <= ?
+                AND NOT EXISTS (SELECT 1 FROM outbox AS e WHERE e.user_id = o.user_id AND e.id < o.id AND e.next_attempt > ?)
+                ORDER BY id LIMIT ?""", (now, now, self.batch_size)).fetchall()
+        sent = 0
+        blocked = set()  # tenants with a failed run in this batch
+        for worksheet_name, run in itertools.groupby(due, key=lambda r: r[1]):
+            entries = [(row_id, user_id, json.loads(payload), attempts) for row_id, _, user_id, payload, attempts in run if user_id not in blocked]
+            if not entries: continue
+            ids = [e[0] for e in entries]
+            marks = ",".join("?" * len(ids))
+            try:
+                self.storage.append(worksheet_name, [e[2] for e in entries])
+            except Exception as e:
+                attempts = max(e_[3] for e_ in entries) + 1
+                delay = min(self.max_delay, self.base_delay * 2 ** (attempts - 1)) * random.uniform(0.8, 1.2)
+                with self.lock, self.db:
+                    self.db.execute(f"UPDATE outbox SET attempts = ?, next_attempt = ?, last_error = ? WHERE id IN ({marks})",
+                                    (attempts, now + delay, str(e)[:500], *ids))
+                blocked.update(e_[1] for e_ in entries)
+                self.failures += 1; self.last_error = str(e)
+                continue
+            with self.lock, self.db:
+                self.db.execute(f"DELETE FROM outbox WHERE id IN ({marks})", ids)
+            sent += len(ids); self.flushed += len(ids)
+        return sent
+
+    def _next_due_in(self):
+        with self.lock: row = self.db.execute("SELECT MIN(next_attempt) FROM outbox").fetchone()
+        if row[0] is None: return self.poll_interval
+        return max(0.0, min(self.poll_interval, row[0] - time.time()))
+
+    def _run(self):
+        while not self.stopping.is_set():
+            self.wake.clear()
+            try:
+                if self.flush_once(): continue
+            except Exception as e: self.last_error = str(e)
+            self.wake.wait(self._next_due_in())
+
+    def start(self):
+        if self.thread is None or not self.thread.is_alive():
+            self.stopping.clear()
+            self.thread = threading.Thread(target=self._run, name="hk-outbox-flusher", daemon=True)
+            self.thread.start()
+        return self
+
+    def stop(self, timeout=5.0):
+        self.stopping.set(); self.wake.set()
+        if self.thread: self.thread.join(timeout)
+
+    def drain(self, timeout=30.0):
+        deadline = time.time() + timeout
+        while self.pending_count() and time.time() < deadline:
+            if not self.flush_once(): time.sleep(min(0.1, max(0.0, deadline - time.time())))
+        return self.pending_count() == 0
+
+    def pending_count(self):
+        with self.lock: return self.db.execute("SELECT COUNT(*) FROM outbox").fetchone()[0]
+
+    def stats(self):
+        return {"pending": self.pending_count(), "flushed": self.flushed, "failed_batches": self.failures, "last_error": self.last_error}
@@ -0,0 +1,478 @@
+import hashlib
+import io
+import json
+import os
+import re
+import threading
+from collections import OrderedDict
+from reportlab.pdfgen import canvas
+from reportlab.lib.pagesizes import A4
+from reportlab.lib import colors
+from reportlab.lib.colors import HexColor
+from reportlab.lib.utils import ImageReader
+from reportlab.platypus import Table, TableStyle
+from reportlab.lib.units import inch
+
+from hk_tax import compute_invoice_tax
+from hk_validation import STATE_CODES
+
+# --- CONFIGURATION ---
+LOGO_FILE = "logo.png" 
+SIGNATURE_FILE = "signature.png"
+ASSET_DIR = os.environ.get("HK_ASSET_DIR", "assets")  # per-tenant overrides: assets/<UserID>/logo.png
+PDF_CACHE_DIR = os.environ.get("HK_PDF_CACHE_DIR", "pdf_cache")
+PDF_CACHE_MAX_BYTES = int(os.environ.get("HK_PDF_CACHE_MAX_MB", "256")) * 1024 * 1024
+PDF_LAYOUT_VERSION = "3"  # bump whenever generate_pdf output changes, so stale renders are not served
+
+# --- ASSET REGISTRY ---
+# Logo and signature images are decoded once per process and shared by every
+# page and invoice. Entries are keyed by tenant and file path, and a changed
+# mtime or size invalidates the entry.
+ASSET_BOXES = {"logo": (LOGO_FILE, 2.0*inch, 1.0*inch), "signature": (SIGNATURE_FILE, 1.4*inch, 0.7*inch)}
+
+def tenant_asset_path(user_id, kind):
+    file_name = ASSET_BOXES[kind][0]
+    if user_id:
+        path = os.path.join(ASSET_DIR, str(user_id), file_name)
+        if os.path.exists(path): return path
+    return file_name
+
+class AssetRegistry:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.images = {}
+        self.loads = 0
+
+    def get(self, user_id, kind):
+        path = tenant_asset_path(user_id, kind)
+        try: st = os.stat(path)
+        except OSError: return None
+        key = (str(user_id or ""), kind, os.path.abspath(path))
+        with self.lock:
+            entry = self.images.get(key)
+            if entry and entry[0] == (st.st_mtime_ns, st.st_size): return entry[1]
+            try:
+                reader = ImageReader(path)
+                reader.getRGBData()  # decode now, under the lock, so threads share one decode
+            except Exception: reader = None
+            self.images[key] = ((st.st_mtime_ns, st.st_size), reader)
+            self.loads += 1
+            return reader
+
+ASSETS = AssetRegistry()
+
+# Each image becomes one Form XObject per document; pages only reference it.
+def embed_invoice_assets(c, seller):
+    forms = {}
+    for kind, (_, box_w, box_h) in ASSET_BOXES.items():
+        reader = ASSETS.get(seller.get("UserID"), kind)
+        if reader is None: continue
+        name = f"hk_{kind}"
+        c.beginForm(name, lowerx=0, lowery=0, upperx=box_w, uppery=box_h)
+        c.drawImage(reader, 0, 0, width=box_w, height=box_h, mask='auto', preserveAspectRatio=True)
+        c.endForm()
+        forms[kind] = name
+    return forms
+
+def draw_asset(c, assets, kind, x, y):
+    if not assets or kind not in assets: return
+    c.saveState(); c.translate(x, y); c.doForm(assets[kind]); c.restoreState()
+
+# --- PDF ---
+def draw_header_on_canvas(c, w, h, seller, buyer, inv_no, is_letterhead, theme, font_header, font_body, assets=None):
+    if not is_letterhead:
+        if theme == 'Formal':
+            c.setLineWidth(3); c.rect(20, h-160, w-40, 140); c.setLineWidth(1)
+
+        draw_asset(c, assets, "logo", 30, h-100)
+
+        center_x = (w / 2) + 20 
+        c.setFont(font_header, 18)
+        c.drawCentredString(center_x, h-50, seller.get('Business Name', 'Unknown Firm'))
+        
+        if seller.get('Tagline'):
+            c.setFont(font_body, 10)
+            c.drawCentredString(center_x, h-65, seller.get('Tagline'))
+
+        c.setFont(font_body, 9)
+        y_contact = h-80
+        
+        if seller.get('Is GST', 'No') == 'Yes':
+            if seller.get('GSTIN'):
+                c.drawCentredString(center_x, y_contact, f"GSTIN: {seller.get('GSTIN', '')}")
+                y_contact -= 12
+        else:
+            if seller.get('PAN'):
+                c.drawCentredString(center_x, y_contact, f"PAN: {seller.get('PAN', '')}")
+                y_contact -= 12
+        
+        c.drawCentredString(center_x, y_contact, seller.get('Addr1', ''))
+        y_contact -= 12
+        c.drawCentredString(center_x, y_contact, seller.get('Addr2', ''))
+        y_contact -= 12
+        full_addr_3 = f"{seller.get('District', '')}, {seller.get('State', '')} - {seller.get('Pincode', '')}"
+        c.drawCentredString(center_x, y_contact, full_addr_3)
+        y_contact -= 12
+        
+        c.drawCentredString(center_x, y_contact, f"M: {seller.get('Mobile', '')} | E: {seller.get('Email', '')}")
+    
+    title_text = "TAX INVOICE" if seller.get('Is GST', 'No') == 'Yes' else "INVOICE"
+    c.setFont(font_header, 14)
+    c.drawCentredString(w/2, h-160, title_text)
+    
+    if theme != 'Modern' and not is_letterhead:
+        c.line(30, h-165, w-30, h-165)
+    
+    y = h-190
+    ship_data = buyer.get('Shipping', {})
+    
+    c.setFont(font_header, 10); c.drawString(40, y, "Bill To:")
+    c.setFont(font_body, 10)
+    c.drawString(40, y-15, str(buyer.get('Name', '')))
+    
+    if seller.get('Is GST', 'No') == 'Yes':
+        c.drawString(40, y-30, f"GSTIN: {buyer.get('GSTIN', 'URP')}")
+        addr_start_y = y-45
+    else:
+        addr_start_y = y-30
+
+    c.drawString(40, addr_start_y, f"{buyer.get('Address 1', '')}")
+    if buyer.get('Address 2'):
+        addr_start_y -= 12
+        c.drawString(40, addr_start_y, f"{buyer.get('Address 2', '')}")
+    if buyer.get('Address 3'):
+        addr_start_y -= 12
+        c.drawString(40, addr_start_y, f"{buyer.get('Address 3', '')}")
+    
+    addr_start_y -= 12
+    c.drawString(40, addr_start_y, f"M: {buyer.get('Mobile', '')}  E: {buyer.get('Email', '')}")
+
+    if ship_data:
+        x_ship = 250
+        c.setFont(font_header, 10); c.drawString(x_ship, y, "Ship To:")
+        c.setFont(font_body, 10)
+        c.drawString(x_ship, y-15, ship_data.get('Name', ''))
+        
+        if seller.get('Is GST', 'No') == 'Yes':
+            c.drawString(x_ship, y-30, f"GSTIN: {ship_data.get('GSTIN', '')}")
+            s_addr_y = y-45
+        else:
+            s_addr_y = y-30
+        
+        c.drawString(x_ship, s_addr_y, f"{ship_data.get('Addr1', '')}")
+        if ship_data.get('Addr2'):
+            s_addr_y -= 12
+            c.drawString(x_ship, s_addr_y, f"{ship_data.get('Addr2', '')}")
+        if ship_data.get('Addr3'):
+            s_addr_y -= 12
+            c.drawString(x_ship, s_addr_y, f"{ship_data.get('Addr3', '')}")
+
+    x_inv = 400
+    c.setFont(font_header, 10); c.drawString(x_inv, y, "Invoice Details:")
+    c.setFont(font_body, 10)
+    c.drawString(x_inv, y-15, f"Inv No: {inv_no}")
+    c.drawString(x_inv, y-30, f"Date: {buyer.get('Date','')}")
+    if seller.get('Is GST', 'No') == 'Yes':
+        pos_code = buyer.get('POS Code', '24')
+        c.drawString(x_inv, y-45, f"POS: {pos_code}-{STATE_CODES.get(pos_code, '')}")
+
+    return h - 300 
+
+def draw_footer_on_canvas(c, w, h, seller, font_header, font_body, assets=None):
+    foot_y = 130 
+    c.line(30, foot_y + 90, w-30, foot_y + 90)
+    
+    c.setFont(font_header, 10); c.drawString(40, foot_y+75, "Bank Details:")
+    c.setFont(font_body, 9)
+    c.drawString(40, foot_y+60, f"Bank: {seller.get('Bank Name','')}")
+    c.drawString(40, foot_y+48, f"Branch: {seller.get('Branch','')}")
+    c.drawString(40, foot_y+36, f"A/c: {seller.get('Account No','')}")
+    c.drawString(40, foot_y+24, f"IFSC: {seller.get('IFSC','')}")
+    
+    sign_y = foot_y + 50 
+    c.drawRightString(w-40, sign_y, f"For, {seller.get('Business Name', '')}")
+    
+    draw_asset(c, assets, "signature", w-160, sign_y-55)
+
+    c.drawRightString(w-40, sign_y-60, "Authorized Signatory")
+    
+    term_y = 50
+    c.setFont(font_body, 7)
+    terms = ["(1) We declare that this invoice shows the actual price of the goods/services described.", "(2) Subject to Local Jurisdiction.", "(3) Our responsibility ceases as soon as goods are delivered."]
+    for term in terms: c.drawString(40, term_y, term); term_y -= 10
+    
+    c.setFillColor(colors.grey)
+    c.setFont(font_body, 7)
+    footer_msg = "This document is generated using HisaabKeeper to get demo or Free trial connect us on hello.hisaabkeeper@gmail.com or whats app us on +91 6353953790"
+    c.drawCentredString(w/2, 15, footer_msg)
+    c.setFillColor(colors.black)
+
+# --- PAGINATION ---
+# The item table is measured once and its rows are assigned to pages in a
+# single pass; each page then gets its own Table with fixed row heights and
+# the style commands clipped to its rows, so nothing is re-wrapped.
+def measure_rows(table, avail_w, avail_h):
+    table.wrap(avail_w, avail_h)
+    return list(table._rowHeights)
+
+def paginate_rows(row_heights, usable_height):
+    pages, start, used = [], 0, 0.0
+    for i, row_h in enumerate(row_heights):
+        if used + row_h > usable_height and i > start:
+            pages.append((start, i)); start, used = i, 0.0
+        used += row_h
+    pages.append((start, len(row_heights)))
+    return pages, used
+
+def clip_style(style_cmds, n_rows, start, end):
+    clipped = []
+    for name, (c0, r0), (c1, r1), *args in style_cmds:
+        r0 = r0 + n_rows if r0 < 0 else r0
+        r1 = r1 + n_rows if r1 < 0 else r1
+        lo, hi = max(r0, start), min(r1, end - 1)
+        if lo <= hi: clipped.append((name, (c0, lo - start), (c1, hi - start), *args))
+    return clipped
+
+def table_slice(data, col_widths, row_heights, style_cmds, start, end):
+    part = Table(data[start:end], colWidths=col_widths, rowHeights=row_heights[start:end])
+    part.setStyle(TableStyle(clip_style(style_cmds, len(data), start, end)))
+    return part
+
+def generate_pdf(seller, buyer, items, inv_no, path, totals, is_letterhead=False):
+    c = canvas.Canvas(path, pagesize=A4)
+    w, h = A4 
+    assets = embed_invoice_assets(c, seller)
+    
+    theme = seller.get('Template', 'Simple')
+    if theme == "Simple": theme = "Basic"
+    
+    if theme == 'Modern': 
+        font_header = "Helvetica-Bold"; font_body = "Helvetica"
+        accent_color = HexColor('#2C3E50'); text_color_head = colors.white; grid_color = colors.lightgrey
+    elif theme == 'Formal':
+        font_header = "Times-Bold"; font_body = "Times-Roman"
+        accent_color = colors.white; text_color_head = colors.black; grid_color = colors.black
+    else: 
+        font_header = "Helvetica-Bold"; font_body = "Helvetica"
+        accent_color = colors.grey; text_color_head = colors.whitesmoke; grid_color = colors.black
+
+    is_gst_bill = seller.get('Is GST', 'No') == 'Yes'
+    if is_gst_bill:
+        header = ["Sr.\nNo.", "Description", "HSN/SAC", "Qty", "UOM", "Rate", "Amount"]
+        col_widths = [0.5*inch, 2.6*inch, 1.0*inch, 0.8*inch, 0.6*inch, 1.0*inch, 1.2*inch]
+        span_cols = 5
+    else:
+        header = ["Sr.\nNo.", "Description", "Qty", "UOM", "Rate", "Amount"]
+        col_widths = [0.5*inch, 3.6*inch, 0.8*inch, 0.6*inch, 1.0*inch, 1.2*inch]
+        span_cols = 4
+
+    lines, hsn_summary, _ = compute_invoice_tax(items, totals.get('is_intra', True))
+    data = [header]
+    for i, (item, amt) in enumerate(zip(items, lines["Base Amount"]), 1):
+        desc = str(item['Description']).replace('\n', ' ') 
+        if is_gst_bill:
+            data.append([str(i), desc, str(item.get('HSN', '')), f"{item['Qty']:.2f}", str(item.get('UOM', '')), f"{item['Rate']:.2f}", f"{amt:.2f}"])
+        else:
+            data.append([str(i), desc, f"{item['Qty']:.2f}", str(item.get('UOM', '')), f"{item['Rate']:.2f}", f"{amt:.2f}"])
+    
+    summary_start = len(data)
+    if is_gst_bill:
+        data.append(['Taxable Value', '', '', '', '', '', f"{totals['taxable']:.2f}"])
+        if totals.get('is_intra', True):
+            data.append(['Add: CGST', '', '', '', '', '', f"{totals['cgst']:.2f}"])
+            data.append(['Add: SGST', '', '', '', '', '', f"{totals['sgst']:.2f}"])
+        else:
+            data.append(['Add: IGST', '', '', '', '', '', f"{totals['igst']:.2f}"])
+    
+    data.append(['Grand Total', '', '', '', '', '', f"{totals['total']:.2f}"])
+    
+    last_col_idx = len(header) - 1
+    style_cmds = [
+        ('FONTNAME', (0,0), (-1,-1), font_body),
+        ('FONTSIZE', (0, 0), (-1, -1), 9),
+        ('ALIGN', (0,0), (-1,-1), 'CENTER'),
+        ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
+        ('ALIGN', (1,1), (1, summary_start-1), 'LEFT'),
+        ('ALIGN', (0, summary_start), (len(header)-2,-1), 'RIGHT'),
+        ('TOPPADDING', (0,0), (-1,-1), 6),
+        ('BOTTOMPADDING', (0,0), (-1,-1), 6),
+        ('GRID', (0,0), (-1,-1), 0.5, grid_color)
+    ]
+
+    if theme == 'Modern':
+        style_cmds.extend([
+            ('BACKGROUND', (0,0), (-1,0), accent_color),
+            ('TEXTCOLOR', (0,0), (-1,0), text_color_head),
+            ('FONTNAME', (0,0), (-1,0), font_header),
+            ('FONTNAME', (0, summary_start), (-1, -1), font_header),
+            ('BACKGROUND', (0, -1), (-1, -1), colors.whitesmoke),
+        ])
+    
+    for i in range(summary_start, len(data)): 
+        style_cmds.append(('SPAN', (0,i), (span_cols,i)))
+    
+    main_table = Table(data, colWidths=col_widths)
+    main_table.setStyle(TableStyle(style_cmds))
+
+    hsn_table = None
+    if is_gst_bill:
+        hsn_data = [['HSN/SAC', 'Rate', 'Taxable', 'CGST', 'SGST', 'IGST', 'Total']]
+        for row in hsn_summary.itertuples(index=False):
+            hsn_data.append([row.HSN, f"{row.Rate}%", f"{row.Taxable:.2f}", f"{row.CGST:.2f}", f"{row.SGST:.2f}", f"{row.IGST:.2f}", f"{row.Total:.2f}"])
+        t_taxable, t_cgst, t_sgst, t_igst, t_grand = hsn_summary[["Taxable", "CGST", "SGST", "IGST", "Total"]].sum()
+        hsn_data.append(['Total', '', f"{t_taxable:.2f}", f"{t_cgst:.2f}", f"{t_sgst:.2f}", f"{t_igst:.2f}", f"{t_grand:.2f}"])
+        
+        hsn_table = Table(hsn_data, colWidths=[1.2*inch, 0.8*inch, 1.2*inch, 1.0*inch, 1.0*inch, 1.0*inch, 1.2*inch])
+        hsn_table.setStyle(TableStyle([
+            ('FONTNAME', (0,0), (-1,-1), font_body), ('FONTSIZE', (0,0), (-1,-1), 8), ('ALIGN', (0,0), (-1,-1), 'CENTER'),
+            ('GRID', (0,0), (-1,-1), 0.5, colors.grey), ('BACKGROUND', (0,0), (-1,0), colors.whitesmoke),
+            ('FONTNAME', (0,0), (-1,0), font_header), ('FONTNAME', (0, -1), (-1, -1), font_header)
+        ]))
+
+    header_bottom_y = h - 300 
+    footer_height = 230 
+    usable_height = header_bottom_y - footer_height
+    
+    row_heights = measure_rows(main_table, w, h)
+    pages, last_part_h = paginate_rows(row_heights, usable_height)
+    table_parts = [table_slice(data, col_widths, row_heights, style_cmds, start, end) for start, end in pages]
+    
+    total_pages = len(table_parts)
+    hsn_needs_new_page = False
+    
+    if hsn_table:
+        htw, hth = hsn_table.wrapOn(c, w, h)
+        if (usable_height - last_part_h - 20) < hth:
+            total_pages += 1
+            hsn_needs_new_page = True
+
+    for page_idx, part in enumerate(table_parts):
+        y_start = draw_header_on_canvas(c, w, h, seller, buyer, inv_no, is_letterhead, theme, font_header, font_body, assets)
+        pw, ph = part.wrapOn(c, w, h)
+        part.drawOn(c, 30, y_start - ph)
+        current_y = y_start - ph - 20
+        draw_footer_on_canvas(c, w, h, seller, font_header, font_body, assets)
+        c.setFont(font_body, 8)
+        c.drawCentredString(w/2, 25, f"Page {page_idx+1} of {total_pages}") 
+        
+        if page_idx == len(table_parts) - 1:
+            if hsn_table:
+                if not hsn_needs_new_page: hsn_table.drawOn(c, 30, current_y - hth)
+                else:
+                    c.showPage()
+                    y_start_new = draw_header_on_canvas(c, w, h, seller, buyer, inv_no, is_letterhead, theme, font_header, font_body, assets)
+                    draw_footer_on_canvas(c, w, h, seller, font_header, font_body, assets)
+                    c.drawCentredString(w/2, 25, f"Page {total_pages} of {total_pages}")
+                    hsn_table.drawOn(c, 30, y_start_new - hth)
+        c.showPage()
+    c.save()
+
+
+# --- PDF CACHE ---
+def _file_fingerprint(path):
+    try:
+        st = os.stat(path); return [st.st_mtime_ns, st.st_size]
+    except OSError: return None
+
+# The seller profile without its login secret, for anything that leaves the
+# session (cache keys, bulk worker jobs).
+def seller_for_pdf(seller): return {k: v for k, v in seller.items() if k != "Password"}
+
+def pdf_cache_key(seller, buyer, items, inv_no, totals, is_letterhead=False):
+    seller = seller_for_pdf(seller)
+    content = [PDF_LAYOUT_VERSION, seller, buyer, items, str(inv_no), totals, bool(is_letterhead),
+               [_file_fingerprint(tenant_asset_path(seller.get("UserID"), kind)) for kind in ASSET_BOXES]]
+    return hashlib.sha256(json.dumps(content, sort_keys=True, default=str).encode()).hexdigest()
+
+# Rendered invoices stored on disk under their content hash, evicted least
+# recently used first once the directory grows past max_bytes. Bulk workers
+# share the directory, so each writes through its own temp file and the
+# directory is re-scanned (after every max_bytes / RESCAN_FRACTION written
+# here, and before evicting) to count what the other processes added.
+class PdfCache:
+    RESCAN_FRACTION = 16
+
+    def __init__(self, directory=PDF_CACHE_DIR, max_bytes=PDF_CACHE_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.bytes_saved = 0
+        self.unscanned_bytes = 0
+        os.makedirs(directory, exist_ok=True)
+        self._scan()
+
+    def _scan(self):
+        found = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if not entry.name.endswith(".pdf"): continue
+                try: st = entry.stat()
+                except OSError: continue  # evicted by another process meanwhile
+                found.append((st.st_atime, entry.name[:-4], st.st_size))
+        self.entries = OrderedDict((key, size) for _, key, size in sorted(found))
+        self.total_bytes = sum(self.entries.values())
+        self.unscanned_bytes = 0
+
+    def _path(self, key): return os.path.join(self.directory, key + ".pdf")
+
+    def get(self, key):
+        with self.lock:
+            size = self.entries.get(key)
+            if size is None:  # may have been written by another process
+                try: size = self.entries[key] = os.path.getsize(self._path(key))
+                except OSError:
+                    self.misses += 1; return None
+                self.total_bytes += size
+            try:
+                with open(self._path(key), "rb") as f: data = f.read()
+            except OSError:
+                self.entries.pop(key); self.total_bytes -= size; self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1; self.bytes_saved += size
+        try: os.utime(self._path(key))  # keeps LRU order across restarts
+        except OSError: pass
+        return data
+
+    def put(self, key, data):
+        tmp = f"{self._path(key)}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f: f.write(data)
+        os.replace(tmp, self._path(key))
+        with self.lock:
+            self.total_bytes += len(data) - self.entries.pop(key, 0)
+            self.entries[key] = len(data)
+            self.unscanned_bytes += len(data)
+            if self.total_bytes > self.max_bytes or self.unscanned_bytes * self.RESCAN_FRACTION > self.max_bytes:
+                self._scan()
+                self.entries.move_to_end(key)
+            while self.total_bytes > self.max_bytes and len(self.entries) > 1:
+                old_key, old_size = self.entries.popitem(last=False)
+                self.total_bytes -= old_size
+                try: os.remove(self._path(old_key))
+                except OSError: pass
+
+    def stats(self):
+        with self.lock:
+            total = self.hits + self.misses
+            return {"hits": self.hits, "misses": self.misses, "hit_rate": round(self.hits / total, 3) if total else 0.0,
+                    "bytes_saved": self.bytes_saved, "entries": len(self.entries), "bytes_cached": self.total_bytes}
+
+_PAGE_OBJECT = re.compile(rb"/Type\s*/Page(?![a-zA-Z])")
+
+def pdf_page_count(data):
+    return len(_PAGE_OBJECT.findall(data))
+
+def render_pdf_bytes(seller, buyer, items, inv_no, totals, is_letterhead=False, cache=None):
+    key = pdf_cache_key(seller, buyer, items, inv_no, totals, is_letterhead) if cache is not None else None
+    if key:
+        data = cache.get(key)
+        if data is not None: return data
+    buf = io.BytesIO()
+    generate_pdf(seller, buyer, items, inv_no, buf, totals, is_letterhead)
+    data = buf.getvalue()
+    if key: cache.put(key, data)
+    return data
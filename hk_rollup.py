@@ -0,0 +1,142 @@
+import argparse
+import os
+import sqlite3
+import threading
+import time
+
+import pandas as pd
+
+from hk_storage import STORAGE_BACKEND, open_backend
+
+# --- CONFIGURATION ---
+ROLLUP_FILE = os.environ.get("HK_ROLLUP_DB", "hisaabkeeper_rollups.db")
+PERIODS = {"day": 10, "month": 7}  # bucket = first N chars of the ISO date
+DAILY_BUCKETS = 31  # days charted on the dashboard
+MEASURES = ["Sales", "Taxable", "CGST", "SGST", "IGST"]
+SOURCE_COLUMNS = {"Sales": "Grand Total", "Taxable": "Total Taxable", "CGST": "CGST", "SGST": "SGST", "IGST": "IGST"}
+NO_MODE = "Not set"
+
+def _paise(values):
+    return (pd.to_numeric(values, errors='coerce').fillna(0.0) * 100).round().astype("int64")
+
+def _iso_dates(values):
+    return pd.to_datetime(pd.Series(values, dtype=object).astype(str).str.strip(), format="%d/%m/%Y", errors="coerce").dt.strftime("%Y-%m-%d")
+
+# Invoice rows -> one row per invoice with ISO date, payment mode and paise
+# amounts. Rows without a parseable date are dropped; a Bill No seen twice
+# (the outbox delivers at least once) counts once. That is safe because Bill
+# No is unique per tenant: the app rejects a reused number before saving.
+def invoice_facts(df_invoices):
+    df = df_invoices.drop_duplicates(subset=["Bill No"], keep="last") if "Bill No" in df_invoices.columns else df_invoices
+    facts = pd.DataFrame({"Bill No": df["Bill No"].astype(str) if "Bill No" in df.columns else "", "Date": _iso_dates(df["Date"]).to_numpy() if "Date" in df.columns else None})
+    mode = df["Payment Mode"].fillna("").astype(str).str.strip() if "Payment Mode" in df.columns else pd.Series("", index=df.index)
+    facts["Mode"] = mode.where(mode != "", NO_MODE).to_numpy()
+    for measure, col in SOURCE_COLUMNS.items():
+        facts[measure] = _paise(df[col]).to_numpy() if col in df.columns else 0
+    return facts.dropna(subset=["Date"]).reset_index(drop=True)
+
+# --- ROLLUP STORE ---
+# Daily and monthly totals per tenant, kept in a local SQLite file next to the
+# outbox. Saving an invoice adds it to its day and month buckets (amounts in
+# paise); the applied-invoice table makes that idempotent. The whole set can
+# be rebuilt from the Invoices table at any time, so the file is disposable.
+class RollupStore:
+    def __init__(self, path=ROLLUP_FILE):
+        self.path = path
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        with self.db:
+            self.db.execute("""CREATE TABLE IF NOT EXISTS rollups (
+                user_id TEXT NOT NULL, period TEXT NOT NULL, bucket TEXT NOT NULL, sales INTEGER NOT NULL DEFAULT 0,
+                taxable INTEGER NOT NULL DEFAULT 0, cgst INTEGER NOT NULL DEFAULT 0, sgst INTEGER NOT NULL DEFAULT 0,
+                igst INTEGER NOT NULL DEFAULT 0, invoices INTEGER NOT NULL DEFAULT 0, PRIMARY KEY (user_id, period, bucket))""")
+            self.db.execute("""CREATE TABLE IF NOT EXISTS rollup_modes (
+                user_id TEXT NOT NULL, period TEXT NOT NULL, bucket TEXT NOT NULL, mode TEXT NOT NULL,
+                sales INTEGER NOT NULL DEFAULT 0, invoices INTEGER NOT NULL DEFAULT 0, PRIMARY KEY (user_id, period, bucket, mode))""")
+            self.db.execute("CREATE TABLE IF NOT EXISTS rollup_invoices (user_id TEXT NOT NULL, bill_no TEXT NOT NULL, PRIMARY KEY (user_id, bill_no))")
+            self.db.execute("CREATE TABLE IF NOT EXISTS rollup_meta (user_id TEXT PRIMARY KEY, built REAL NOT NULL)")
+
+    def _apply(self, user_id, facts):
+        for period, width in PERIODS.items():
+            buckets = facts.assign(Bucket=facts["Date"].str[:width])
+            totals = buckets.groupby("Bucket")[MEASURES].sum().join(buckets.groupby("Bucket").size().rename("Invoices"))
+            self.db.executemany("""INSERT INTO rollups (user_id, period, bucket, sales, taxable, cgst, sgst, igst, invoices) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (user_id, period, bucket) DO UPDATE SET sales = sales + excluded.sales, taxable = taxable + excluded.taxable,
+                cgst = cgst + excluded.cgst, sgst = sgst + excluded.sgst, igst = igst + excluded.igst, invoices = invoices + excluded.invoices""",
+                [(user_id, period, bucket, *map(int, row)) for bucket, row in zip(totals.index, totals.itertuples(index=False))])
+            modes = buckets.groupby(["Bucket", "Mode"])["Sales"].agg(["sum", "size"])
+            self.db.executemany("""INSERT INTO rollup_modes (user_id, period, bucket, mode, sales, invoices) VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (user_id, period, bucket, mode) DO UPDATE SET sales = sales + excluded.sales, invoices = invoices + excluded.invoices""",
+                [(user_id, period, bucket, mode, int(s), int(n)) for (bucket, mode), s, n in zip(modes.index, modes["sum"], modes["size"])])
+
+    # Adds one saved invoice row; returns False if it was already counted.
+    def add(self, row):
+        user_id = str(row.get("UserID", ""))
+        facts = invoice_facts(pd.DataFrame([row]))
+        if facts.empty: return False
+        with self.lock, self.db:
+            if self.db.execute("INSERT OR IGNORE INTO rollup_invoices (user_id, bill_no) VALUES (?, ?)", (user_id, facts["Bill No"][0])).rowcount == 0: return False
+            self._apply(user_id, facts)
+        return True
+
+    def rebuild(self, user_id, df_invoices):
+        user_id = str(user_id)
+        facts = invoice_facts(df_invoices) if not df_invoices.empty else pd.DataFrame(columns=["Bill No", "Date", "Mode", *MEASURES])
+        with self.lock, self.db:
+            for table in ("rollups", "rollup_modes", "rollup_invoices"): self.db.execute(f"DELETE FROM {table} WHERE user_id = ?", (user_id,))
+            self.db.executemany("INSERT INTO rollup_invoices (user_id, bill_no) VALUES (?, ?)", [(user_id, b) for b in facts["Bill No"]])
+            if not facts.empty: self._apply(user_id, facts)
+            self.db.execute("INSERT OR REPLACE INTO rollup_meta (user_id, built) VALUES (?, ?)", (user_id, time.time()))
+        return len(facts)
+
+    def is_built(self, user_id):
+        with self.lock: return self.db.execute("SELECT 1 FROM rollup_meta WHERE user_id = ?", (str(user_id),)).fetchone() is not None
+
+    # Forces a rebuild on next use, e.g. after an add() that failed half-way.
+    def invalidate(self, user_id):
+        with self.lock, self.db: self.db.execute("DELETE FROM rollup_meta WHERE user_id = ?", (str(user_id),))
+
+    # The most recent `limit` buckets, oldest first, amounts in rupees.
+    def totals(self, user_id, period, limit=None):
+        sql = "SELECT bucket, sales, taxable, cgst, sgst, igst, invoices FROM rollups WHERE user_id = ? AND period = ? ORDER BY bucket DESC" + (" LIMIT ?" if limit else "")
+        with self.lock: rows = self.db.execute(sql, (str(user_id), period, *([limit] if limit else []))).fetchall()
+        df = pd.DataFrame(rows[::-1], columns=["Bucket", *MEASURES, "Invoices"])
+        df[MEASURES] = df[MEASURES].astype(float) / 100
+        return df
+
+    def modes(self, user_id, period, since=""):
+        with self.lock:
+            rows = self.db.execute("SELECT bucket, mode, sales, invoices FROM rollup_modes WHERE user_id = ? AND period = ? AND bucket >= ? ORDER BY bucket, mode",
+                                   (str(user_id), period, since)).fetchall()
+        df = pd.DataFrame(rows, columns=["Bucket", "Mode", "Sales", "Invoices"])
+        df["Sales"] = df["Sales"].astype(float) / 100
+        return df
+
+    def stats(self):
+        with self.lock:
+            return {"tenants": self.db.execute("SELECT COUNT(*) FROM rollup_meta").fetchone()[0],
+                    "invoices": self.db.execute("SELECT COUNT(*) FROM rollup_invoices").fetchone()[0],
+                    "buckets": self.db.execute("SELECT COUNT(*) FROM rollups").fetchone()[0]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild the dashboard rollups from the Invoices table.")
+    parser.add_argument("--user-id", action="append", help="tenant to rebuild (repeatable; default all)")
+    parser.add_argument("--backend", default=STORAGE_BACKEND, choices=["gsheets", "sqlite"])
+    parser.add_argument("--db", default=ROLLUP_FILE)
+    args = parser.parse_args()
+    conn = None
+    if args.backend == "gsheets":
+        import streamlit as st
+        from streamlit_gsheets import GSheetsConnection
+        conn = st.connection("gsheets", type=GSheetsConnection)
+    df = open_backend(args.backend, gsheets_conn=conn).read("Invoices")
+    df["UserID"] = df["UserID"].astype(str)
+    store = RollupStore(args.db)
+    for user_id in args.user_id or sorted(df["UserID"].unique()):
+        print(f"{user_id}: {store.rebuild(user_id, df[df['UserID'] == str(user_id)])} invoices")
+
+
+if __name__ == "__main__":
+    main()
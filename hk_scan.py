@@ -0,0 +1,152 @@
+import os
+import time
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import cv2
+import numpy as np
+from PIL import Image
+
+try:
+    import zxingcpp
+except ImportError:
+    zxingcpp = None
+
+# --- CONFIGURATION ---
+# Item barcodes are retail EAN/UPC or Code 128 shelf labels; searching only
+# those formats keeps zxing from running every other detector on each frame.
+SCAN_FORMATS = os.environ.get("HK_SCAN_FORMATS", "EAN13,EAN8,UPCA,UPCE,Code128")
+SCAN_MAX_SIDE = int(os.environ.get("HK_SCAN_MAX_SIDE", "960"))
+SCAN_WORKERS = int(os.environ.get("HK_SCAN_WORKERS", "0"))
+SCAN_DEBOUNCE_SECONDS = float(os.environ.get("HK_SCAN_DEBOUNCE_SECONDS", "2.0"))
+ROI = (0.15, 0.25, 0.85, 0.75)  # left, top, right, bottom as fractions of the frame
+
+def scan_formats(names=SCAN_FORMATS):
+    return zxingcpp.barcode_formats_from_str(names) if zxingcpp is not None and names else None
+
+# --- FRAME PREPARATION ---
+# Camera frames are reduced to a grayscale copy no longer than SCAN_MAX_SIDE
+# before any decoding; JPEG uploads are downscaled while decoding (draft), so
+# a 12 MP photo never exists at full resolution in memory. The centre crop is
+# also kept at twice that size for labels too small to survive the downscale.
+Frame = namedtuple("Frame", ["gray", "detail"])
+
+def crop_roi(gray, roi=ROI):
+    h, w = gray.shape[:2]
+    return np.ascontiguousarray(gray[int(h * roi[1]):int(h * roi[3]), int(w * roi[0]):int(w * roi[2])])
+
+def _fit(gray, max_side):
+    scale = max_side / max(gray.shape[:2])
+    return cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA) if scale < 1 else gray
+
+def prepare_frame(image, max_side=SCAN_MAX_SIDE):
+    if isinstance(image, np.ndarray):
+        gray = image if image.ndim == 2 else cv2.cvtColor(image, cv2.COLOR_RGB2GRAY)
+    else:
+        img = image if isinstance(image, Image.Image) else Image.open(image)
+        if img is not image: img.draft("L", (2 * max_side, 2 * max_side))
+        gray = np.asarray(img.convert("L"))
+    return Frame(_fit(gray, max_side), crop_roi(_fit(gray, 2 * max_side)))
+
+def rotate(gray, angle):
+    h, w = gray.shape[:2]
+    m = cv2.getRotationMatrix2D((w / 2, h / 2), angle, 1.0)
+    cos, sin = abs(m[0, 0]), abs(m[0, 1])
+    nw, nh = int(h * sin + w * cos), int(h * cos + w * sin)
+    m[0, 2] += nw / 2 - w / 2; m[1, 2] += nh / 2 - h / 2
+    return cv2.warpAffine(gray, m, (nw, nh), borderValue=255)
+
+# --- STRATEGIES ---
+# Each strategy takes a Frame and returns a list of (image, read_barcodes
+# options) attempts. They are ordered cheapest first: the centre crop at one
+# scale catches a code held up to the camera, the later ones pay for contrast
+# fixes, binarisation, rotation and finally the full-detail centre crop.
+def _roi(frame): return [(crop_roi(frame.gray), {"try_rotate": False, "try_downscale": False, "try_invert": False})]
+def _frame(frame): return [(frame.gray, {"try_rotate": False, "try_invert": False})]
+def _contrast(frame): return [(cv2.createCLAHE(clipLimit=3.0, tileGridSize=(8, 8)).apply(frame.gray), {"try_invert": False})]
+def _threshold(frame):
+    binary = cv2.adaptiveThreshold(cv2.GaussianBlur(frame.gray, (3, 3), 0), 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 31, 10)
+    return [(binary, {"binarizer": zxingcpp.Binarizer.FixedThreshold})]
+def _rotated(frame): return [(rotate(frame.gray, angle), {}) for angle in (45, -45)]
+def _detail(frame): return [(frame.detail, {"try_downscale": False})]
+
+STRATEGIES = [("roi", _roi), ("frame", _frame), ("contrast", _contrast), ("threshold", _threshold), ("rotate", _rotated), ("detail", _detail)]
+
+def _run(strategy, frame, formats):
+    for img, options in strategy(frame):
+        results = zxingcpp.read_barcodes(img, formats=formats, **options) if formats is not None else zxingcpp.read_barcodes(img, **options)
+        if results: return results[0].text
+    return None
+
+# --- DECODER ---
+# decode() returns (text, strategy name); (None, None) when nothing is found.
+# With a pool the strategies race and the first hit wins; unfinished ones are
+# cancelled or their results dropped.
+class BarcodeDecoder:
+    def __init__(self, formats=SCAN_FORMATS, workers=SCAN_WORKERS, max_side=SCAN_MAX_SIDE, strategies=STRATEGIES):
+        self.formats = scan_formats(formats)
+        self.max_side = max_side
+        self.strategies = strategies
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="hk-scan") if workers > 1 else None
+        self.decoded = 0
+        self.missed = 0
+        self.by_strategy = {}
+        self.total_ms = 0.0
+
+    def decode(self, image):
+        if zxingcpp is None: return None, None
+        start = time.perf_counter()
+        frame = prepare_frame(image, self.max_side)
+        text, name = self._race(frame) if self.pool else self._sequential(frame)
+        self._count(name, (time.perf_counter() - start) * 1000)
+        return text, name
+
+    def _sequential(self, frame):
+        for name, strategy in self.strategies:
+            text = _run(strategy, frame, self.formats)
+            if text: return text, name
+        return None, None
+
+    def _race(self, frame):
+        pending = {self.pool.submit(_run, strategy, frame, self.formats): name for name, strategy in self.strategies}
+        try:
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = pending.pop(future)
+                    text = future.result()
+                    if text: return text, name
+            return None, None
+        finally:
+            for future in pending: future.cancel()
+
+    def _count(self, name, ms):
+        self.total_ms += ms
+        if name: self.decoded += 1; self.by_strategy[name] = self.by_strategy.get(name, 0) + 1
+        else: self.missed += 1
+
+    def stats(self):
+        total = self.decoded + self.missed
+        return {"frames": total, "decoded": self.decoded, "avg_ms": round(self.total_ms / total, 1) if total else 0.0, "by_strategy": dict(self.by_strategy)}
+
+    def close(self):
+        if self.pool: self.pool.shutdown(wait=False, cancel_futures=True)
+
+# --- DEBOUNCE ---
+# A live camera reads the same label many times while it is in view, and two
+# labels in frame can alternate. accept() is True only for a code not seen in
+# the last `window` seconds; every read restarts that code's window, so an
+# item has to leave the frame before it can be counted again.
+class ScanDebouncer:
+    def __init__(self, window=SCAN_DEBOUNCE_SECONDS, max_codes=256):
+        self.window = window
+        self.max_codes = max_codes
+        self.seen = {}
+
+    def accept(self, code, now=None):
+        now = time.monotonic() if now is None else now
+        last = self.seen.get(code)
+        self.seen[code] = now
+        if len(self.seen) > self.max_codes:
+            self.seen = {c: t for c, t in self.seen.items() if now - t <= self.window}
+        return last is None or now - last > self.window
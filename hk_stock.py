@@ -0,0 +1,177 @@
+import argparse
+import os
+import sqlite3
+import threading
+import time
+
+import pandas as pd
+
+from hk_lines import explode_invoices
+from hk_storage import SCHEMA, STORAGE_BACKEND, open_backend
+from hk_tax import line_amounts
+
+# --- CONFIGURATION ---
+STOCK_FILE = os.environ.get("HK_STOCK_DB", "hisaabkeeper_stock.db")
+INWARD_LINE_COLUMNS = SCHEMA["InwardLines"]
+QTY_SCALE = 1000  # quantities are kept in thousandths (grams, millilitres) so running totals stay exact
+LOW_STOCK = float(os.environ.get("HK_LOW_STOCK", "5"))
+
+def _milli(values): return (pd.to_numeric(values, errors='coerce').fillna(0.0) * QTY_SCALE).round().astype("int64")
+
+def _text(values): return values.fillna("").astype(str).str.strip()
+
+# --- INWARD ENTRIES ---
+# A purchase is one Inward row (supplier, date, total) plus one InwardLines
+# row per item, keyed by (UserID, Inward No, Line) like InvoiceLines.
+def inward_lines(header, items):
+    items = [item for item in items if str(item.get("Item Name", "")).strip() and float(item.get("Qty") or 0) > 0]
+    amounts = line_amounts([item["Qty"] for item in items], [item.get("Rate") or 0 for item in items])
+    return [{"UserID": header["UserID"], "Inward No": header["Inward No"], "Line": n, "Date": header["Date"], "Item Name": str(item["Item Name"]).strip(),
+             "Qty": float(item["Qty"]), "UOM": item.get("UOM", ""), "Rate": float(item.get("Rate") or 0), "Amount": float(amount)}
+            for n, (item, amount) in enumerate(zip(items, amounts), 1)]
+
+# --- MOVEMENTS ---
+# One row per (kind, ref, item) with quantities in thousandths: inward lines
+# add stock, invoice lines take it away. Sales come from InvoiceLines, with
+# the Items JSON of invoices that have no stored lines yet.
+MOVEMENT_COLUMNS = ["Kind", "Ref", "Item", "In", "Out"]
+
+def sale_movements(df_invoices, df_lines=None):
+    lines = df_lines if df_lines is not None and not df_lines.empty else pd.DataFrame(columns=SCHEMA["InvoiceLines"])
+    if not df_invoices.empty:
+        have = pd.Index(lines["Bill No"].astype(str).unique())
+        missing = df_invoices[have.get_indexer(df_invoices["Bill No"].astype(str)) < 0]
+        if not missing.empty: lines = pd.concat([lines, explode_invoices(missing)], ignore_index=True)
+    if lines.empty: return pd.DataFrame(columns=MOVEMENT_COLUMNS)
+    lines = lines.drop_duplicates(subset=["Bill No", "Line"], keep="last")
+    df = pd.DataFrame({"Kind": "Invoice", "Ref": _text(lines["Bill No"]), "Item": _text(lines["Description"]), "In": 0, "Out": _milli(lines["Qty"])})
+    return df[df["Item"] != ""].groupby(["Kind", "Ref", "Item"], as_index=False)[["In", "Out"]].sum()
+
+def inward_movements(df_inward_lines):
+    if df_inward_lines.empty: return pd.DataFrame(columns=MOVEMENT_COLUMNS)
+    lines = df_inward_lines.drop_duplicates(subset=["Inward No", "Line"], keep="last")
+    df = pd.DataFrame({"Kind": "Inward", "Ref": _text(lines["Inward No"]), "Item": _text(lines["Item Name"]), "In": _milli(lines["Qty"]), "Out": 0})
+    return df[df["Item"] != ""].groupby(["Kind", "Ref", "Item"], as_index=False)[["In", "Out"]].sum()
+
+# --- STOCK STORE ---
+# Quantity in and out per item per tenant in a local SQLite file, like the
+# rollups and the ledger cache: every saved invoice or purchase is applied
+# once (tracked in stock_applied by its Bill No or Inward No, both unique per
+# tenant: the app rejects a reused Bill No and numbers each purchase itself)
+# and the file can be rebuilt from the tables at any time. On-hand levels are also held in memory per tenant and
+# patched on each add, so the POS reads a dict instead of querying or
+# re-aggregating on every rerun.
+class StockStore:
+    def __init__(self, path=STOCK_FILE):
+        self.path = path
+        self.lock = threading.Lock()
+        self.levels_by_user = {}
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        with self.db:
+            self.db.execute("""CREATE TABLE IF NOT EXISTS stock (
+                user_id TEXT NOT NULL, item TEXT NOT NULL, qty_in INTEGER NOT NULL DEFAULT 0, qty_out INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (user_id, item))""")
+            self.db.execute("CREATE TABLE IF NOT EXISTS stock_applied (user_id TEXT NOT NULL, kind TEXT NOT NULL, ref TEXT NOT NULL, PRIMARY KEY (user_id, kind, ref))")
+            self.db.execute("CREATE TABLE IF NOT EXISTS stock_meta (user_id TEXT PRIMARY KEY, built REAL NOT NULL)")
+
+    def _apply(self, user_id, moves):
+        totals = moves.groupby("Item")[["In", "Out"]].sum()
+        self.db.executemany("""INSERT INTO stock (user_id, item, qty_in, qty_out) VALUES (?, ?, ?, ?)
+            ON CONFLICT (user_id, item) DO UPDATE SET qty_in = qty_in + excluded.qty_in, qty_out = qty_out + excluded.qty_out""",
+            [(user_id, item, int(q_in), int(q_out)) for item, q_in, q_out in totals.itertuples()])
+        levels = self.levels_by_user.get(user_id)
+        if levels is not None:
+            for item, q_in, q_out in totals.itertuples(): levels[item] = levels.get(item, 0) + int(q_in) - int(q_out)
+
+    def _add(self, user_id, moves):
+        if moves.empty: return False
+        user_id = str(user_id)
+        with self.lock, self.db:
+            if self.db.execute("INSERT OR IGNORE INTO stock_applied (user_id, kind, ref) VALUES (?, ?, ?)", (user_id, moves["Kind"][0], moves["Ref"][0])).rowcount == 0: return False
+            self._apply(user_id, moves)
+        return True
+
+    # Both return False when the entry was already applied or has no items.
+    def add_sale(self, invoice_row): return self._add(invoice_row.get("UserID", ""), sale_movements(pd.DataFrame([invoice_row])))
+    def add_inward(self, header, lines): return self._add(header.get("UserID", ""), inward_movements(pd.DataFrame(lines, columns=INWARD_LINE_COLUMNS)))
+
+    def rebuild(self, user_id, df_invoices, df_invoice_lines, df_inward_lines):
+        user_id = str(user_id)
+        moves = pd.concat([sale_movements(df_invoices, df_invoice_lines), inward_movements(df_inward_lines)], ignore_index=True)
+        with self.lock, self.db:
+            for table in ("stock", "stock_applied"): self.db.execute(f"DELETE FROM {table} WHERE user_id = ?", (user_id,))
+            self.db.executemany("INSERT OR IGNORE INTO stock_applied (user_id, kind, ref) VALUES (?, ?, ?)",
+                                [(user_id, kind, ref) for kind, ref in moves[["Kind", "Ref"]].drop_duplicates().itertuples(index=False)])
+            self.levels_by_user.pop(user_id, None)
+            if not moves.empty: self._apply(user_id, moves)
+            self.db.execute("INSERT OR REPLACE INTO stock_meta (user_id, built) VALUES (?, ?)", (user_id, time.time()))
+        return len(moves)
+
+    def is_built(self, user_id):
+        with self.lock: return self.db.execute("SELECT 1 FROM stock_meta WHERE user_id = ?", (str(user_id),)).fetchone() is not None
+
+    # Forces a rebuild on next use, e.g. after an add that failed half-way.
+    def invalidate(self, user_id):
+        with self.lock, self.db:
+            self.db.execute("DELETE FROM stock_meta WHERE user_id = ?", (str(user_id),))
+            self.levels_by_user.pop(str(user_id), None)
+
+    def _levels(self, user_id):
+        levels = self.levels_by_user.get(user_id)
+        if levels is None:
+            rows = self.db.execute("SELECT item, qty_in - qty_out FROM stock WHERE user_id = ?", (user_id,)).fetchall()
+            levels = self.levels_by_user[user_id] = dict(rows)
+        return levels
+
+    # Quantity on hand, from memory after the first call per tenant; None for
+    # an item that has never moved.
+    def level(self, user_id, item):
+        with self.lock: q = self._levels(str(user_id)).get(str(item).strip())
+        return None if q is None else q / QTY_SCALE
+
+    def levels(self, user_id):
+        with self.lock: return {item: q / QTY_SCALE for item, q in self._levels(str(user_id)).items()}
+
+    # Every catalogue item (and anything else that has moved) with its totals.
+    def on_hand(self, user_id, df_items=None):
+        with self.lock: rows = self.db.execute("SELECT item, qty_in, qty_out FROM stock WHERE user_id = ? ORDER BY item", (str(user_id),)).fetchall()
+        df = pd.DataFrame(rows, columns=["Item", "In", "Out"])
+        df[["In", "Out"]] = df[["In", "Out"]].astype(float) / QTY_SCALE
+        if df_items is not None and not df_items.empty:
+            items = df_items.assign(Item=_text(df_items["Item Name"])).drop_duplicates(subset=["Item"])[["Item", "UOM"]]
+            df = items.merge(df, on="Item", how="outer").fillna({"In": 0.0, "Out": 0.0, "UOM": ""})
+        else: df["UOM"] = ""
+        df["On Hand"] = df["In"] - df["Out"]
+        return df[["Item", "UOM", "In", "Out", "On Hand"]].sort_values("Item", kind="stable").reset_index(drop=True)
+
+    def stats(self):
+        with self.lock:
+            return {"tenants": self.db.execute("SELECT COUNT(*) FROM stock_meta").fetchone()[0],
+                    "items": self.db.execute("SELECT COUNT(*) FROM stock").fetchone()[0],
+                    "entries": self.db.execute("SELECT COUNT(*) FROM stock_applied").fetchone()[0],
+                    "in_memory": len(self.levels_by_user)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild stock on hand from the Invoices, InvoiceLines and InwardLines tables.")
+    parser.add_argument("--user-id", action="append", help="tenant to rebuild (repeatable; default all)")
+    parser.add_argument("--backend", default=STORAGE_BACKEND, choices=["gsheets", "sqlite"])
+    parser.add_argument("--db", default=STOCK_FILE)
+    args = parser.parse_args()
+    conn = None
+    if args.backend == "gsheets":
+        import streamlit as st
+        from streamlit_gsheets import GSheetsConnection
+        conn = st.connection("gsheets", type=GSheetsConnection)
+    storage = open_backend(args.backend, gsheets_conn=conn)
+    tables = {name: storage.read(name) for name in ("Invoices", "InvoiceLines", "InwardLines")}
+    for df in tables.values(): df["UserID"] = df["UserID"].astype(str)
+    store = StockStore(args.db)
+    for user_id in args.user_id or sorted(set().union(*(set(df["UserID"]) for df in tables.values()))):
+        own = {name: df[df["UserID"] == str(user_id)] for name, df in tables.items()}
+        print(f"{user_id}: {store.rebuild(user_id, own['Invoices'], own['InvoiceLines'], own['InwardLines'])} movements")
+
+
+if __name__ == "__main__":
+    main()
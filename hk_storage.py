@@ -0,0 +1,438 @@
+import math
+import os
+import sqlite3
+import threading
+import time
+from datetime import date, datetime
+
+import pandas as pd
+from gspread.exceptions import WorksheetNotFound
+from gspread.utils import rowcol_to_a1
+
+# --- CONFIGURATION ---
+STORAGE_BACKEND = os.environ.get("HK_STORAGE_BACKEND", "gsheets")  # "gsheets" or "sqlite"
+SQLITE_DB_FILE = os.environ.get("HK_SQLITE_DB", "hisaabkeeper.db")
+CACHE_TTL = float(os.environ.get("HK_CACHE_TTL", "300"))  # seconds; picks up edits made outside the app
+
+# --- SCHEMA ---
+SCHEMA = {
+    "Users": ["UserID", "Username", "Password", "Business Name", "Tagline", "Is GST", "GSTIN", "PAN", "Mobile", "Email", "Template", "BillingStyle", "Addr1", "Addr2", "Pincode", "District", "State", "Bank Name", "Branch", "Account No", "IFSC", "UPI"],
+    "Customers": ["UserID", "Name", "GSTIN", "Address 1", "Address 2", "Address 3", "State", "Mobile", "Email"],
+    "Items": ["UserID", "Item Name", "Price", "UOM", "HSN", "Image", "Barcode", "Weight"],
+    "Invoices": ["UserID", "Bill No", "Date", "Buyer Name", "Items", "Total Taxable", "CGST", "SGST", "IGST", "Grand Total", "Ship Name", "Ship GSTIN", "Ship Addr1", "Ship Addr2", "Ship Addr3", "Payment Mode"],
+    "InvoiceLines": ["UserID", "Bill No", "Line", "Date", "Description", "HSN", "Qty", "UOM", "Rate", "GST Rate", "Amount"],
+    "Receipts": ["UserID", "Date", "Party Name", "Amount", "Note", "Receipt No", "Mode"],
+    "Inward": ["UserID", "Date", "Supplier Name", "Total Value", "Inward No", "Supplier Bill No"],
+    "InwardLines": ["UserID", "Inward No", "Line", "Date", "Item Name", "Qty", "UOM", "Rate", "Amount"]
+}
+
+def conform_to_schema(df, worksheet_name):
+    if worksheet_name in SCHEMA:
+        for col in SCHEMA[worksheet_name]:
+            if col not in df.columns: df[col] = ""
+        df = df[SCHEMA[worksheet_name]]
+    return df
+
+def to_cell(value):
+    if value is None: return ""
+    if hasattr(value, "item"): value = value.item()  # numpy scalars
+    if isinstance(value, float) and math.isnan(value): return ""
+    if isinstance(value, (date, datetime)): return str(value)
+    return value
+
+def rows_to_values(rows, header):
+    return [[to_cell(row.get(col, "")) for col in header] for row in rows]
+
+# --- APPEND-ONLY WRITES ---
+# Header row per worksheet, so an append is a single values.append call.
+_sheet_headers = {}
+
+def _sheet_header(ws, worksheet_name, header):
+    if worksheet_name in _sheet_headers: return _sheet_headers[worksheet_name], False
+    existing = ws.row_values(1)
+    if not existing:
+        _sheet_headers[worksheet_name] = header
+        return header, True
+    missing = [col for col in header if col not in existing]
+    if missing:
+        existing = existing + missing
+        ws.update(range_name="A1", values=[existing])
+    _sheet_headers[worksheet_name] = existing
+    return existing, False
+
+def forget_sheet_header(worksheet_name=None):
+    if worksheet_name is None: _sheet_headers.clear()
+    else: _sheet_headers.pop(worksheet_name, None)
+
+# streamlit_gsheets has no public way to get at the gspread worksheet behind
+# the connection, so its private lookup is used here and nowhere else.
+def open_worksheet(conn, worksheet_name):
+    select = getattr(conn.client, "_select_worksheet", None)
+    if select is None:
+        raise RuntimeError("This st-gsheets-connection version does not expose worksheets; "
+                           "install a version that does or set HK_STORAGE_BACKEND=sqlite")
+    return select(worksheet=worksheet_name)
+
+def append_rows(conn, worksheet_name, rows):
+    if not rows: return True
+    header = list(SCHEMA.get(worksheet_name, rows[0].keys()))
+    try:
+        ws = open_worksheet(conn, worksheet_name)
+    except WorksheetNotFound:
+        conn.create(worksheet=worksheet_name, data=conform_to_schema(pd.DataFrame(rows), worksheet_name))
+        forget_sheet_header(worksheet_name)
+        return True
+    header, needs_header = _sheet_header(ws, worksheet_name, header)
+    values = rows_to_values(rows, header)
+    if needs_header: values = [header] + values
+    ws.append_rows(values, value_input_option="USER_ENTERED", insert_data_option="INSERT_ROWS", table_range="A1")
+    return True
+
+# --- BACKENDS ---
+def match_mask(df, equals):
+    mask = pd.Series(True, index=df.index)
+    for col, value in equals.items(): mask &= df[col].astype(str) == str(value)
+    return mask
+
+def set_where(df, mask, changes):
+    for col, value in changes.items():
+        if col not in df.columns: df[col] = ""
+        if df[col].dtype != object: df[col] = df[col].astype(object)
+        df.loc[mask, col] = to_cell(value)
+    return df
+
+class StorageBackend:
+    # True when read_where/iter_where filter at the source instead of reading
+    # the whole sheet; CachedStorage uses it to decide what to cache.
+    filters_at_source = False
+
+    def read(self, worksheet_name): raise NotImplementedError
+    def append(self, worksheet_name, rows): raise NotImplementedError
+    def replace(self, worksheet_name, df): raise NotImplementedError
+    # Both return the number of rows touched.
+    def update_where(self, worksheet_name, equals, changes): raise NotImplementedError
+    def delete_where(self, worksheet_name, equals): raise NotImplementedError
+
+    # Backends that can filter at the source override this; the fallback
+    # reads the sheet and filters in pandas.
+    def read_where(self, worksheet_name, equals):
+        df = self.read(worksheet_name)
+        return df[match_mask(df, equals)].reset_index(drop=True)
+
+    def read_user(self, worksheet_name, user_id):
+        return self.read_where(worksheet_name, {"UserID": user_id})
+
+    def iter_where(self, worksheet_name, equals, chunk_size=5000):
+        df = self.read_where(worksheet_name, equals)
+        for start in range(0, len(df), chunk_size): yield df.iloc[start:start + chunk_size]
+
+
+class GSheetsBackend(StorageBackend):
+    def __init__(self, conn):
+        self.conn = conn
+
+    def read(self, worksheet_name):
+        return conform_to_schema(self.conn.read(worksheet=worksheet_name, ttl=0), worksheet_name)
+
+    def append(self, worksheet_name, rows):
+        return append_rows(self.conn, worksheet_name, rows)
+
+    def replace(self, worksheet_name, df):
+        try: self.conn.update(worksheet=worksheet_name, data=df)
+        except WorksheetNotFound: self.conn.create(worksheet=worksheet_name, data=df)
+        forget_sheet_header(worksheet_name)
+        return True
+
+    # Row lookups fetch only the key columns, then the change is sent as one
+    # batch request touching just the matching rows.
+    def _matching_rows(self, worksheet_name, equals):
+        try: ws = open_worksheet(self.conn, worksheet_name)
+        except WorksheetNotFound: return None, [], []
+        header, _ = _sheet_header(ws, worksheet_name, list(SCHEMA.get(worksheet_name, equals.keys())))
+        ranges = []
+        for col in equals:
+            letter = rowcol_to_a1(1, header.index(col) + 1)[:-1]
+            ranges.append(f"{letter}2:{letter}")
+        columns = ws.batch_get(ranges, value_render_option="UNFORMATTED_VALUE")
+        n_rows = max((len(c) for c in columns), default=0)
+        cell = lambda column, i: column[i][0] if i < len(column) and column[i] else ""
+        wanted = [str(v) for v in equals.values()]
+        rows = [i + 2 for i in range(n_rows) if all(str(cell(columns[j], i)) == wanted[j] for j in range(len(wanted)))]
+        return ws, header, rows
+
+    def update_where(self, worksheet_name, equals, changes):
+        ws, header, rows = self._matching_rows(worksheet_name, equals)
+        if not rows: return 0
+        data = [{"range": rowcol_to_a1(r, header.index(col) + 1), "values": [[to_cell(v)]]} for r in rows for col, v in changes.items()]
+        ws.batch_update(data, value_input_option="USER_ENTERED")
+        return len(rows)
+
+    def delete_where(self, worksheet_name, equals):
+        ws, header, rows = self._matching_rows(worksheet_name, equals)
+        if not rows: return 0
+        requests = [{"deleteDimension": {"range": {"sheetId": ws.id, "dimension": "ROWS", "startIndex": r - 1, "endIndex": r}}} for r in sorted(rows, reverse=True)]
+        ws.spreadsheet.batch_update({"requests": requests})
+        return len(rows)
+
+
+INDEXES = {
+    "Users": [["UserID"], ["Username"]],
+    "Customers": [["UserID"]],
+    "Items": [["UserID"], ["UserID", "Barcode"]],
+    "Invoices": [["UserID"], ["UserID", "Bill No"]],
+    "InvoiceLines": [["UserID", "Bill No"]],
+    "Receipts": [["UserID"]],
+    "Inward": [["UserID"]],
+    "InwardLines": [["UserID", "Inward No"]],
+}
+
+def _q(name): return '"' + name.replace('"', '""') + '"'
+
+# The text form of a key plus the number it spells, if it round-trips
+# exactly ("101" -> 101, but not "0101" or "1e3").
+def _key_values(value):
+    text = str(value)
+    for parse in (int, float):
+        try: number = parse(text)
+        except ValueError: continue
+        if str(number) == text: return (text, number)
+    return (text,)
+
+
+class SQLiteBackend(StorageBackend):
+    # Columns are declared without a type so cells keep whatever type was saved,
+    # the same as the sheet does (numbers stay numbers, barcodes stay text).
+    filters_at_source = True
+
+    def __init__(self, path=SQLITE_DB_FILE):
+        self.path = path
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        with self.lock:
+            for table, cols in SCHEMA.items():
+                self.db.execute(f"CREATE TABLE IF NOT EXISTS {_q(table)} ({', '.join(_q(c) for c in cols)})")
+                # Columns added to SCHEMA later are added to older files too.
+                have = {row[1] for row in self.db.execute(f"PRAGMA table_info({_q(table)})")}
+                for col in cols:
+                    if col not in have: self.db.execute(f"ALTER TABLE {_q(table)} ADD COLUMN {_q(col)}")
+                for idx_cols in INDEXES.get(table, []):
+                    idx_name = "idx_" + "_".join([table] + idx_cols).lower().replace(" ", "")
+                    self.db.execute(f"CREATE INDEX IF NOT EXISTS {_q(idx_name)} ON {_q(table)} ({', '.join(_q(c) for c in idx_cols)})")
+
+    def _columns(self, worksheet_name):
+        if worksheet_name not in SCHEMA: raise KeyError(f"Unknown worksheet: {worksheet_name}")
+        return SCHEMA[worksheet_name]
+
+    def _select_sql(self, worksheet_name, where=""):
+        cols = self._columns(worksheet_name)
+        return f"SELECT {', '.join(_q(c) for c in cols)} FROM {_q(worksheet_name)}" + (f" WHERE {where}" if where else "")
+
+    def _select(self, worksheet_name, where="", params=()):
+        with self.lock: rows = self.db.execute(self._select_sql(worksheet_name, where), params).fetchall()
+        return pd.DataFrame(rows, columns=self._columns(worksheet_name))
+
+    def _insert(self, worksheet_name, rows):
+        cols = self._columns(worksheet_name)
+        sql = f"INSERT INTO {_q(worksheet_name)} ({', '.join(_q(c) for c in cols)}) VALUES ({', '.join('?' * len(cols))})"
+        self.db.executemany(sql, rows_to_values(rows, cols))
+
+    def read(self, worksheet_name):
+        return self._select(worksheet_name)
+
+    def read_where(self, worksheet_name, equals):
+        where, params = self._where(worksheet_name, equals)
+        return self._select(worksheet_name, where, params)
+
+    # Streams from its own read connection (WAL allows concurrent readers), so
+    # a long export never holds the shared connection's lock.
+    def iter_where(self, worksheet_name, equals, chunk_size=5000):
+        where, params = self._where(worksheet_name, equals)
+        cols = self._columns(worksheet_name)
+        db = sqlite3.connect(self.path)
+        try:
+            cur = db.execute(self._select_sql(worksheet_name, where), params)
+            while True:
+                rows = cur.fetchmany(chunk_size)
+                if not rows: break
+                yield pd.DataFrame(rows, columns=cols)
+        finally: db.close()
+
+    def append(self, worksheet_name, rows):
+        if not rows: return True
+        with self.lock, self.db:
+            self._insert(worksheet_name, rows)
+        return True
+
+    def replace(self, worksheet_name, df):
+        with self.lock, self.db:
+            self.db.execute(f"DELETE FROM {_q(worksheet_name)}")
+            self._insert(worksheet_name, df.to_dict('records'))
+        return True
+
+    # Cells keep the type they were saved with, so a key given as text also
+    # matches the same number stored as INTEGER/REAL (the sheet compares
+    # str(cell) the same way). IN keeps the column indexes usable.
+    def _where(self, worksheet_name, equals):
+        cols = self._columns(worksheet_name)
+        clauses, params = [], []
+        for col, value in equals.items():
+            if col not in cols: raise KeyError(f"Unknown column: {col}")
+            values = _key_values(value)
+            clauses.append(f"{_q(col)} = ?" if len(values) == 1 else f"{_q(col)} IN ({', '.join('?' * len(values))})")
+            params.extend(values)
+        return " AND ".join(clauses), tuple(params)
+
+    def update_where(self, worksheet_name, equals, changes):
+        where, params = self._where(worksheet_name, equals)
+        cols = self._columns(worksheet_name)
+        for col in changes:
+            if col not in cols: raise KeyError(f"Unknown column: {col}")
+        assignments = ", ".join(f"{_q(col)} = ?" for col in changes)
+        with self.lock, self.db:
+            cur = self.db.execute(f"UPDATE {_q(worksheet_name)} SET {assignments} WHERE {where}", tuple(to_cell(v) for v in changes.values()) + params)
+        return cur.rowcount
+
+    def delete_where(self, worksheet_name, equals):
+        where, params = self._where(worksheet_name, equals)
+        with self.lock, self.db:
+            cur = self.db.execute(f"DELETE FROM {_q(worksheet_name)} WHERE {where}", params)
+        return cur.rowcount
+
+    def close(self):
+        self.db.close()
+
+
+def open_backend(name=None, gsheets_conn=None):
+    name = name or STORAGE_BACKEND
+    if name == "sqlite": return SQLiteBackend(SQLITE_DB_FILE)
+    if name == "gsheets":
+        if gsheets_conn is None: raise ValueError("gsheets backend needs a GSheetsConnection")
+        return GSheetsBackend(gsheets_conn)
+    raise ValueError(f"Unknown storage backend: {name}")
+
+
+# --- READ CACHE ---
+# Frames are cached per (worksheet, UserID); UserID None holds the whole sheet.
+# Writes made through this object patch the cached frames in place and bump the
+# key's version, so other tenants and worksheets are never evicted.
+class CachedStorage:
+    def __init__(self, backend, ttl=CACHE_TTL):
+        self.backend = backend
+        self.ttl = ttl
+        self.lock = threading.RLock()
+        self.frames = {}
+        self.versions = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _get(self, key):
+        entry = self.frames.get(key)
+        if entry is None: return None
+        if self.ttl and time.monotonic() - entry[1] > self.ttl:
+            del self.frames[key]; return None
+        return entry[0]
+
+    def _put(self, key, df):
+        self.frames[key] = (df, time.monotonic())
+
+    def _bump(self, key):
+        self.versions[key] = self.versions.get(key, 0) + 1
+
+    def version(self, worksheet_name, user_id=None):
+        return self.versions.get((worksheet_name, user_id), 0)
+
+    def read(self, worksheet_name):
+        key = (worksheet_name, None)
+        with self.lock:
+            df = self._get(key)
+            if df is not None:
+                self.hits += 1; return df.copy()
+            self.misses += 1
+        df = self.backend.read(worksheet_name)
+        with self.lock: self._put(key, df)
+        return df.copy()
+
+    def read_user(self, worksheet_name, user_id):
+        user_id = str(user_id)
+        key = (worksheet_name, user_id)
+        with self.lock:
+            df = self._get(key)
+            if df is not None:
+                self.hits += 1; return df.copy()
+            self.misses += 1
+            full = self._get((worksheet_name, None))
+        # A backend that cannot filter would download the whole sheet for
+        # every tenant, so read it once through the cache and slice that.
+        if full is None and not self.backend.filters_at_source: full = self.read(worksheet_name)
+        if full is None: df = self.backend.read_user(worksheet_name, user_id)
+        else: df = full[full["UserID"].astype(str) == user_id].reset_index(drop=True)
+        with self.lock: self._put(key, df)
+        return df.copy()
+
+    def read_where(self, worksheet_name, equals):
+        return self.backend.read_where(worksheet_name, equals)
+
+    def iter_user(self, worksheet_name, user_id, chunk_size=5000):
+        with self.lock: df = self._get((worksheet_name, str(user_id)))
+        if df is None and self.backend.filters_at_source:
+            yield from self.backend.iter_where(worksheet_name, {"UserID": str(user_id)}, chunk_size)
+            return
+        if df is None: df = self.read_user(worksheet_name, user_id)
+        else:
+            with self.lock: self.hits += 1
+        for start in range(0, len(df), chunk_size): yield df.iloc[start:start + chunk_size]
+
+    def append(self, worksheet_name, rows):
+        if not rows: return True
+        self.backend.append(worksheet_name, rows)
+        header = SCHEMA.get(worksheet_name, list(rows[0].keys()))
+        new_df = pd.DataFrame(rows_to_values(rows, header), columns=header)
+        with self.lock:
+            for (ws, uid), (df, loaded_at) in list(self.frames.items()):
+                if ws != worksheet_name: continue
+                part = new_df if uid is None else new_df[new_df["UserID"].astype(str) == uid]
+                if part.empty: continue
+                self.frames[(ws, uid)] = (pd.concat([df, part], ignore_index=True) if not df.empty else part.reset_index(drop=True), loaded_at)
+            self._bump((worksheet_name, None))
+            for uid in {str(r.get("UserID", "")) for r in rows}: self._bump((worksheet_name, uid))
+        return True
+
+    def replace(self, worksheet_name, df):
+        self.backend.replace(worksheet_name, df)
+        self.invalidate(worksheet_name)
+        return True
+
+    def _patch(self, worksheet_name, equals, patch):
+        with self.lock:
+            for (ws, uid), (df, loaded_at) in list(self.frames.items()):
+                if ws != worksheet_name: continue
+                mask = match_mask(df, equals)
+                if mask.any():
+                    self.frames[(ws, uid)] = (patch(df.copy(), mask), loaded_at)
+                    self._bump((ws, uid))
+            self._bump((worksheet_name, None))
+            if "UserID" in equals: self._bump((worksheet_name, str(equals["UserID"])))
+
+    def update_where(self, worksheet_name, equals, changes):
+        n = self.backend.update_where(worksheet_name, equals, changes)
+        if n: self._patch(worksheet_name, equals, lambda df, mask: set_where(df, mask, changes))
+        return n
+
+    def delete_where(self, worksheet_name, equals):
+        n = self.backend.delete_where(worksheet_name, equals)
+        if n: self._patch(worksheet_name, equals, lambda df, mask: df[~mask].reset_index(drop=True))
+        return n
+
+    def invalidate(self, worksheet_name=None, user_id=None):
+        with self.lock:
+            for key in list(self.frames):
+                if worksheet_name is not None and key[0] != worksheet_name: continue
+                if user_id is not None and key[1] not in (None, str(user_id)): continue
+                del self.frames[key]; self._bump(key)
+
+    def stats(self):
+        with self.lock:
+            total = self.hits + self.misses
+            return {"hits": self.hits, "misses": self.misses, "hit_rate": round(self.hits / total, 3) if total else 0.0, "cached_frames": len(self.frames)}
@@ -0,0 +1,61 @@
+from decimal import ROUND_HALF_UP, Decimal
+
+import numpy as np
+import pandas as pd
+
+SUMMARY_COLUMNS = ["HSN", "Rate", "Taxable", "CGST", "SGST", "IGST", "Total"]
+
+# Amounts are carried as integer paise. Line amounts are rounded half-up
+# after trimming float noise (2.675 * 1 is 267.49999... paise otherwise);
+# tax is computed per HSN/rate group, as on the HSN summary, and rounded
+# with Decimal, so the summary rows always add up to the invoice totals.
+def _round_half_up(values):
+    values = np.round(np.asarray(values, dtype=float), 6)
+    return (np.sign(values) * np.floor(np.abs(values) + 0.5)).astype(np.int64)
+
+def _to_paise(amounts):
+    return _round_half_up(np.asarray(amounts, dtype=float) * 100)
+
+# Vectorised helpers for reports that work on many invoices at once.
+def to_paise(amounts): return _to_paise(amounts)
+
+def gst_paise(taxable_paise, rates, divisor):
+    return _round_half_up(np.asarray(taxable_paise, dtype=float) * np.asarray(rates, dtype=float) / divisor)
+
+# Qty x Rate per line in rupees, rounded the same way as on the invoice.
+def line_amounts(qty, rate):
+    return _to_paise(np.asarray(qty, dtype=float) * np.asarray(rate, dtype=float)) / 100
+
+def _tax_paise(taxable_paise, rate, divisor):
+    return int((Decimal(int(taxable_paise)) * Decimal(str(rate)) / divisor).quantize(Decimal(1), rounding=ROUND_HALF_UP))
+
+def _numeric(df, col):
+    if col not in df.columns: return pd.Series(0.0, index=df.index)
+    return pd.to_numeric(df[col], errors='coerce').fillna(0.0).astype(float)
+
+# Returns (lines, summary, totals): the items with numeric Qty/Rate/GST Rate
+# plus "Base Amount" and "Tax Amount", one row per (HSN, rate), and the totals
+# dict used by the DB row and generate_pdf.
+def compute_invoice_tax(items, is_intra=True):
+    lines = items.copy() if isinstance(items, pd.DataFrame) else pd.DataFrame(list(items))
+    for col in ("Qty", "Rate", "GST Rate"): lines[col] = _numeric(lines, col)
+    hsn = lines["HSN"].fillna("").astype(str) if "HSN" in lines.columns else pd.Series("", index=lines.index)
+    base_paise = _to_paise(lines["Qty"].to_numpy() * lines["Rate"].to_numpy())
+    lines["Base Amount"] = base_paise / 100
+    lines["Tax Amount"] = _round_half_up(base_paise * lines["GST Rate"].to_numpy() / 100) / 100
+
+    groups = pd.DataFrame({"HSN": hsn.to_numpy(), "Rate": lines["GST Rate"].to_numpy(), "Taxable": base_paise}).groupby(["HSN", "Rate"], sort=True)["Taxable"].sum()
+    taxable = groups.to_numpy()
+    rates = groups.index.get_level_values("Rate")
+    if is_intra:
+        cgst = np.array([_tax_paise(t, r, 200) for t, r in zip(taxable, rates)], dtype=np.int64)
+        sgst, igst = cgst, np.zeros(len(taxable), dtype=np.int64)
+    else:
+        igst = np.array([_tax_paise(t, r, 100) for t, r in zip(taxable, rates)], dtype=np.int64)
+        cgst = sgst = np.zeros(len(taxable), dtype=np.int64)
+    total = taxable + cgst + sgst + igst
+    summary = pd.DataFrame({"HSN": groups.index.get_level_values("HSN"), "Rate": rates, "Taxable": taxable / 100,
+                            "CGST": cgst / 100, "SGST": sgst / 100, "IGST": igst / 100, "Total": total / 100}, columns=SUMMARY_COLUMNS)
+    totals = {"taxable": int(taxable.sum()) / 100, "cgst": int(cgst.sum()) / 100, "sgst": int(sgst.sum()) / 100,
+              "igst": int(igst.sum()) / 100, "total": int(total.sum()) / 100, "is_intra": bool(is_intra)}
+    return lines, summary, totals
@@ -0,0 +1,124 @@
+import argparse
+import base64
+import binascii
+import hashlib
+import io
+import os
+import re
+import threading
+from collections import OrderedDict
+
+from PIL import Image
+
+from hk_storage import STORAGE_BACKEND, open_backend
+
+# --- CONFIGURATION ---
+THUMB_DIR = os.environ.get("HK_THUMB_DIR", "thumbs")
+THUMB_CACHE_ITEMS = int(os.environ.get("HK_THUMB_CACHE_ITEMS", "1024"))
+THUMB_SIZE = (150, 150)
+_REF = re.compile(r"[0-9a-f]{64}")
+
+def is_thumb_ref(value): return bool(value) and _REF.fullmatch(str(value)) is not None
+
+def make_thumbnail(image_file):
+    img = Image.open(image_file)
+    img.thumbnail(THUMB_SIZE)
+    buff = io.BytesIO()
+    img.convert('RGB').save(buff, format="JPEG", quality=70)
+    return buff.getvalue()
+
+# --- THUMBNAIL STORE ---
+# Item pictures live on disk under the SHA-256 of their JPEG bytes
+# (thumbs/ab/abcd....jpg) and the Items row keeps only that hash. Bytes are
+# read once per process and kept in an LRU, so grids do no I/O or decoding on
+# rerun. Rows saved before the store existed still hold base64 text; those
+# are decoded once and cached under the same LRU.
+class ThumbnailStore:
+    def __init__(self, directory=THUMB_DIR, max_items=THUMB_CACHE_ITEMS):
+        self.directory = directory
+        self.max_items = max_items
+        self.lock = threading.Lock()
+        self.cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, ref): return os.path.join(self.directory, ref[:2], ref + ".jpg")
+
+    def _remember(self, key, data):
+        with self.lock:
+            self.cache[key] = data
+            self.cache.move_to_end(key)
+            while len(self.cache) > self.max_items: self.cache.popitem(last=False)
+
+    def put_bytes(self, data):
+        ref = hashlib.sha256(data).hexdigest()
+        path = self._path(ref)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, "wb") as f: f.write(data)
+            os.replace(tmp, path)
+        self._remember(ref, data)
+        return ref
+
+    def put(self, image_file):
+        try: return self.put_bytes(make_thumbnail(image_file))
+        except Exception: return ""
+
+    def get(self, value):
+        if not value or str(value) == 'nan': return None
+        key = str(value) if is_thumb_ref(value) else hashlib.sha1(str(value).encode()).hexdigest()
+        with self.lock:
+            data = self.cache.get(key)
+            if data is not None:
+                self.cache.move_to_end(key); self.hits += 1
+                return data
+            self.misses += 1
+        if is_thumb_ref(value):
+            try:
+                with open(self._path(key), "rb") as f: data = f.read()
+            except OSError: return None
+        else:
+            try: data = base64.b64decode(str(value), validate=True)
+            except (binascii.Error, ValueError): return None
+        self._remember(key, data)
+        return data
+
+    def stats(self):
+        with self.lock:
+            total = self.hits + self.misses
+            return {"hits": self.hits, "misses": self.misses, "hit_rate": round(self.hits / total, 3) if total else 0.0, "cached": len(self.cache)}
+
+# --- MIGRATION ---
+# Moves base64 pictures out of the Items table into the store, one update per
+# item. Values that do not decode are left in place and listed under
+# "failed" as (UserID, Item Name), so nothing is erased.
+def migrate_item_images(storage, store):
+    df = storage.read("Items")
+    legacy = df[df["Image"].fillna("").astype(str).map(lambda v: v not in ("", "nan") and not is_thumb_ref(v))]
+    moved, failed = 0, []
+    for row in legacy.to_dict('records'):
+        data = store.get(row["Image"])
+        if not data:
+            failed.append((str(row["UserID"]), row["Item Name"])); continue
+        # Item names repeat, so the old picture itself picks out the row.
+        moved += storage.update_where("Items", {"UserID": str(row["UserID"]), "Item Name": row["Item Name"], "Image": row["Image"]}, {"Image": store.put_bytes(data)}) > 0
+    return {"moved": moved, "failed": failed}
+
+def main():
+    parser = argparse.ArgumentParser(description="Move base64 item pictures from the Items table into the thumbnail store.")
+    parser.add_argument("--backend", default=STORAGE_BACKEND, choices=["gsheets", "sqlite"])
+    parser.add_argument("--thumb-dir", default=THUMB_DIR)
+    args = parser.parse_args()
+    conn = None
+    if args.backend == "gsheets":
+        import streamlit as st
+        from streamlit_gsheets import GSheetsConnection
+        conn = st.connection("gsheets", type=GSheetsConnection)
+    result = migrate_item_images(open_backend(args.backend, gsheets_conn=conn), ThumbnailStore(args.thumb_dir))
+    print(f"migrated {result['moved']} items")
+    for user_id, item_name in result["failed"]: print(f"skipped {item_name} (UserID {user_id}): picture could not be decoded")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+import re
+
+import numpy as np
+import pandas as pd
+
+# --- STATE CODES ---
+STATE_CODES = {
+    "01": "Jammu & Kashmir", "02": "Himachal Pradesh", "03": "Punjab", "04": "Chandigarh",
+    "05": "Uttarakhand", "06": "Haryana", "07": "Delhi", "08": "Rajasthan", "09": "Uttar Pradesh",
+    "10": "Bihar", "11": "Sikkim", "12": "Arunachal Pradesh", "13": "Nagaland", "14": "Manipur",
+    "15": "Mizoram", "16": "Tripura", "17": "Meghalaya", "18": "Assam", "19": "West Bengal",
+    "20": "Jharkhand", "21": "Odisha", "22": "Chhattisgarh", "23": "Madhya Pradesh",
+    "24": "Gujarat", "25": "Daman & Diu", "26": "Dadra & Nagar Haveli", "27": "Maharashtra",
+    "28": "Andhra Pradesh (Old)", "29": "Karnataka", "30": "Goa", "31": "Lakshadweep",
+    "32": "Kerala", "33": "Tamil Nadu", "34": "Puducherry", "35": "Andaman & Nicobar Islands",
+    "36": "Telangana", "37": "Andhra Pradesh", "38": "Ladakh", "97": "Other Territory",
+    "99": "Centre Jurisdiction"
+}
+
+# --- PATTERNS ---
+EMAIL_RE = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+MOBILE_RE = re.compile(r'[6-9]\d{9}')
+PAN_RE = re.compile(r'[A-Z]{5}[0-9]{4}[A-Z]{1}')
+GSTIN_RE = re.compile(r'[0-9]{2}[A-Z]{5}[0-9]{4}[A-Z]{1}[1-9A-Z]{1}Z[0-9A-Z]{1}')
+PATTERNS = {"email": EMAIL_RE, "mobile": MOBILE_RE, "pan": PAN_RE, "gstin": GSTIN_RE}
+
+# --- GSTIN CHECKSUM ---
+# The 15th character is a mod-36 check digit over the first 14: characters
+# 0-9A-Z count as 0-35, every second one is doubled, and each product adds
+# its quotient and remainder by 36.
+GSTIN_CHARSET = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_CHAR_VALUES = np.full(128, -1, dtype=np.int64)
+for _i, _ch in enumerate(GSTIN_CHARSET): _CHAR_VALUES[ord(_ch)] = _i
+_WEIGHTS = np.tile([1, 2], 7)
+
+def _gstin_checks(gstins):
+    codes = np.frombuffer("".join(gstins).encode("ascii"), dtype=np.uint8).reshape(-1, 15)
+    values = _CHAR_VALUES[codes]
+    products = values[:, :14] * _WEIGHTS
+    total = (products // 36 + products % 36).sum(axis=1)
+    return values[:, 14] == (36 - total % 36) % 36
+
+def gstin_check_digit(gstin):
+    values = [GSTIN_CHARSET.index(ch) * w for ch, w in zip(gstin[:14], _WEIGHTS)]
+    return GSTIN_CHARSET[(36 - sum(v // 36 + v % 36 for v in values) % 36) % 36]
+
+# --- SINGLE VALUES ---
+def is_valid_email(email): return EMAIL_RE.fullmatch(str(email)) is not None
+def is_valid_mobile(mobile): return MOBILE_RE.fullmatch(str(mobile)) is not None
+def is_valid_pan(pan): return PAN_RE.fullmatch(str(pan)) is not None
+def is_valid_gstin(gstin):
+    gstin = str(gstin)
+    return GSTIN_RE.fullmatch(gstin) is not None and gstin[:2] in STATE_CODES and gstin[14] == gstin_check_digit(gstin)
+
+def gstin_state_code(gstin): return str(gstin)[:2] if is_valid_gstin(gstin) else ""
+def gstin_state(gstin): return STATE_CODES.get(gstin_state_code(gstin), "")
+def gstin_pan(gstin): return str(gstin)[2:12] if is_valid_gstin(gstin) else ""
+
+# --- COLUMNS ---
+def _as_text(values):
+    values = values if isinstance(values, pd.Series) else pd.Series(values, dtype=object)
+    return values.fillna("").astype(str)
+
+def valid_mask(values, kind):
+    values = _as_text(values)
+    mask = values.str.fullmatch(PATTERNS[kind]).fillna(False).astype(bool)
+    if kind == "gstin" and mask.any():
+        ok = values[mask]
+        mask[mask] = ok.str[:2].isin(list(STATE_CODES)).to_numpy() & _gstin_checks(ok.tolist())
+    return mask
+
+def gstin_columns(gstins):
+    gstins = _as_text(gstins).str.upper()
+    ok = valid_mask(gstins, "gstin")
+    code = gstins.str[:2].where(ok, "")
+    return pd.DataFrame({"State Code": code, "State": code.map(STATE_CODES).fillna(""), "PAN": gstins.str[2:12].where(ok, "")})
+
+# rules maps column -> kind; empty cells pass unless the column is in required.
+# Returns one "; "-joined error string per row, "" for clean rows.
+def validate_columns(df, rules, required=()):
+    errors = pd.Series("", index=df.index, dtype=object)
+    def flag(mask, msg):
+        errors[mask] = errors[mask] + ("; " + msg)
+    for col in required:
+        values = df[col].fillna("").astype(str).str.strip() if col in df.columns else pd.Series("", index=df.index)
+        flag(values == "", f"{col} is required")
+    for col, kind in rules.items():
+        if col not in df.columns: continue
+        values = df[col].fillna("").astype(str).str.strip()
+        flag((values != "") & ~valid_mask(values, kind), f"Invalid {col}")
+    return errors.str.lstrip("; ")
+
+def error_report(df, errors, columns=("Name",), row_col="_row"):
+    bad = errors != ""
+    report = pd.DataFrame({"Row": df.loc[bad, row_col] if row_col in df.columns else df.index[bad] + 2})
+    for col in columns:
+        if col in df.columns: report[col] = df.loc[bad, col]
+    report["Errors"] = errors[bad]
+    return report.reset_index(drop=True)
@@ -0,0 +1,44 @@
+import io
+
+import pandas as pd
+from pypdf import PdfReader
+from reportlab.pdfgen import canvas
+
+from hk_bulk import PdfConcatenator, iter_invoice_jobs
+
+
+def small_pdf(*texts):
+    buf = io.BytesIO()
+    c = canvas.Canvas(buf)
+    for text in texts:
+        c.drawString(72, 720, text); c.showPage()
+    c.save()
+    return buf.getvalue()
+
+
+def test_concatenated_pdf_is_valid_and_keeps_every_page():
+    out = io.BytesIO()
+    merged = PdfConcatenator(out)
+    merged.add(small_pdf("INV-1 page 1", "INV-1 page 2"), "Invoice INV-1")
+    merged.add(small_pdf("INV-2 page 1"), "Invoice INV-2")
+    merged.close()
+    reader = PdfReader(io.BytesIO(out.getvalue()), strict=True)
+    assert len(reader.pages) == 3
+    assert [page.extract_text().strip() for page in reader.pages] == ["INV-1 page 1", "INV-1 page 2", "INV-2 page 1"]
+    assert [item.title for item in reader.outline] == ["Invoice INV-1", "Invoice INV-2"]
+    assert reader.get_destination_page_number(reader.outline[1]) == 2
+
+
+def test_empty_concatenation_is_still_a_pdf():
+    out = io.BytesIO()
+    PdfConcatenator(out).close()
+    assert len(PdfReader(io.BytesIO(out.getvalue()), strict=True).pages) == 0
+
+
+def test_jobs_filter_by_date_and_drop_the_password():
+    invoices = pd.DataFrame([{"Bill No": "1", "Date": "31/03/2025", "Buyer Name": "Ravi", "Items": "[]", "Grand Total": 10},
+                             {"Bill No": "2", "Date": "01/04/2025", "Buyer Name": "Ravi", "Items": "[]", "Grand Total": 20}])
+    seller = {"UserID": "U1", "Business Name": "HK Traders", "Password": "secret"}
+    jobs = list(iter_invoice_jobs(seller, [invoices], None, date_from=pd.Timestamp("2025-04-01")))
+    assert [job["inv_no"] for job in jobs] == ["2"]
+    assert "Password" not in jobs[0]["seller"]
@@ -0,0 +1,65 @@
+import pandas as pd
+
+import hk_catalog
+from hk_catalog import BarcodeIndex, BarcodeRegistry, barcode_keys, gtin_check_digit, has_valid_check_digit, upc_e_to_upc_a
+
+
+def with_check(body): return body + gtin_check_digit(body)
+
+
+def test_check_digit_of_known_codes():
+    assert has_valid_check_digit("4006381333931")  # EAN-13
+    assert has_valid_check_digit("036000291452")  # UPC-A
+    assert has_valid_check_digit("96385074")  # EAN-8
+    assert not has_valid_check_digit("4006381333932")
+    assert not has_valid_check_digit("40063813339")  # no length carries a check digit here
+
+
+def test_upc_e_expands_for_every_last_digit():
+    assert upc_e_to_upc_a("04252614") == "042100005264"  # last digit 0-2: manufacturer ends in it
+    for six, body in [("123450", "1200000345"), ("123452", "1220000345"), ("123453", "1230000045"),
+                      ("123454", "1234000005"), ("123455", "1234500005"), ("123459", "1234500009")]:
+        upc_a = with_check("0" + body)
+        assert upc_e_to_upc_a("0" + six + upc_a[-1]) == upc_a
+
+
+def test_upc_e_scan_finds_item_saved_as_upc_a():
+    index = BarcodeIndex(pd.DataFrame([{"Item Name": "Gum", "Barcode": "042100005264"}]))
+    assert barcode_keys("04252614") == ("4252614", ["42100005264"])
+    assert index.lookup("04252614")["Item Name"] == "Gum"
+
+
+def test_leading_zeros_meet_across_upc_a_ean_13_and_gtin_14():
+    index = BarcodeIndex(pd.DataFrame([{"Item Name": "Soap", "Barcode": "036000291452"}]))
+    for code in ("036000291452", "0036000291452", "00036000291452", " 36000291452 "):
+        assert index.lookup(code)["Item Name"] == "Soap"
+    assert index.lookup("4006381333931") is None
+
+
+def test_codes_scanned_without_their_check_digit():
+    index = BarcodeIndex(pd.DataFrame([{"Item Name": "Soap", "Barcode": "036000291452"}, {"Item Name": "Pen", "Barcode": "4006381333931"}]))
+    assert index.lookup("03600029145")["Item Name"] == "Soap"  # UPC-A body
+    assert index.lookup("400638133393")["Item Name"] == "Pen"  # EAN-13 body
+    assert barcode_keys("4006381333931") == ("4006381333931", [])
+
+
+def test_text_codes_are_case_insensitive_and_blank_is_no_key():
+    assert barcode_keys(" abc-12 ") == ("ABC-12", [])
+    assert barcode_keys(None) == barcode_keys("nan") == ("", [])
+    assert BarcodeIndex(pd.DataFrame([{"Item Name": "Box", "Barcode": "ABC-12"}])).lookup("abc-12")["Item Name"] == "Box"
+
+
+def test_registry_rebuilds_on_new_version_and_after_ttl(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(hk_catalog.time, "monotonic", lambda: clock[0])
+    registry = BarcodeRegistry(ttl=60)
+    items = pd.DataFrame([{"Item Name": "Soap", "Barcode": "036000291452"}])
+    registry.get("u1", 1, lambda: items)
+    assert registry.get("u1", 1, lambda: items) is registry.get("u1", 1, lambda: items) and registry.builds == 1
+    registry.add("u1", 2, {"Item Name": "Pen", "Barcode": "4006381333931"})
+    assert registry.get("u1", 2, lambda: items).lookup("4006381333931")["Item Name"] == "Pen" and registry.builds == 1
+    clock[0] += 61
+    index = registry.get("u1", 2, lambda: items)
+    assert registry.builds == 2 and index.lookup("4006381333931") is None
+    registry.get("u1", 3, lambda: items)
+    assert registry.builds == 3
@@ -0,0 +1,81 @@
+import json
+
+import pandas as pd
+
+from hk_gst import build_returns, classify_invoices, period_lines
+from hk_lines import invoice_lines
+from hk_tax import compute_invoice_tax
+
+SELLER = {"GSTIN": "27AAPFU0939F1ZV", "State": "Maharashtra"}
+CUSTOMERS = pd.DataFrame([{"Name": "Reg", "GSTIN": "27AAPFU0939F1ZV", "State": "Maharashtra"},
+                          {"Name": "Walk-in", "GSTIN": "", "State": "Gujarat"},
+                          {"Name": "Local", "GSTIN": "", "State": ""}])
+
+
+def invoice(bill_no, buyer, items, cgst=0.0, sgst=0.0, igst=0.0, date="10/04/2025"):
+    taxable = sum(q * r for _, q, r, _ in items)
+    return {"UserID": "u1", "Bill No": bill_no, "Date": date, "Buyer Name": buyer, "Total Taxable": taxable,
+            "CGST": cgst, "SGST": sgst, "IGST": igst, "Grand Total": taxable + cgst + sgst + igst,
+            "Items": json.dumps([{"Description": d, "HSN": "9608", "Qty": q, "UOM": "PCS", "Rate": r, "GST Rate": g} for d, q, r, g in items])}
+
+
+def invoices():
+    return pd.DataFrame([invoice("B1", "Reg", [("Pen", 10, 100, 18)], cgst=90, sgst=90),
+                         invoice("B2", "Walk-in", [("Desk", 1, 200000, 18)], igst=36000),
+                         invoice("B3", "Local", [("Ink", 2, 50, 5)], cgst=2.5, sgst=2.5),
+                         invoice("B4", "Local", [("Ink", 1, 50, 5)], date="10/05/2025")])
+
+
+def test_classify_invoices_sections_and_place_of_supply():
+    inv = classify_invoices(SELLER, invoices(), CUSTOMERS, 2025, 4).set_index("Bill No")
+    assert list(inv.index) == ["B1", "B2", "B3"]
+    assert inv["Section"].to_dict() == {"B1": "B2B", "B2": "B2CL", "B3": "B2CS"}
+    assert inv["POS"].to_dict() == {"B1": "27", "B2": "24", "B3": "27"}
+    assert inv["Inter"].to_dict() == {"B1": False, "B2": True, "B3": False}
+
+
+def test_period_lines_dedupes_redelivered_lines_and_falls_back():
+    df = invoices()
+    df.loc[2, "Items"] = ""  # B3: no JSON and no saved lines -> implied from the totals
+    inv = classify_invoices(SELLER, df, CUSTOMERS, 2025, 4)
+    saved = pd.DataFrame(invoice_lines(df.iloc[0].to_dict()))
+    lines = period_lines(inv, pd.concat([saved, saved], ignore_index=True))
+    assert lines.groupby("Bill No")["Amount"].sum().to_dict() == {"B1": 1000.0, "B2": 200000.0, "B3": 100.0}
+    assert lines.set_index("Bill No").loc["B3", "GST Rate"] == 5
+    assert len(lines) == 3
+
+
+def billed(bill_no, buyer, items, is_intra=True, date="12/04/2025"):
+    _, _, totals = compute_invoice_tax(items, is_intra)
+    return {"UserID": "u1", "Bill No": bill_no, "Date": date, "Buyer Name": buyer, "Items": json.dumps(items),
+            "Total Taxable": totals["taxable"], "CGST": totals["cgst"], "SGST": totals["sgst"], "IGST": totals["igst"], "Grand Total": totals["total"]}
+
+
+def item(desc, hsn, qty, rate, gst):
+    return {"Description": desc, "HSN": hsn, "Qty": qty, "UOM": "PCS", "Rate": rate, "GST Rate": gst}
+
+
+def test_returns_carry_the_tax_rounded_per_hsn_as_on_the_invoice():
+    # Each HSN group is 10.05 at 18%: CGST 0.9045 -> 0.90 twice on the invoice; one group of 20.10 would round to 1.81.
+    report = build_returns(SELLER, pd.DataFrame([billed("B1", "Reg", [item("A", "1001", 1, 10.05, 18), item("B", "2002", 1, 10.05, 18)])]), CUSTOMERS, 2025, 4)
+    assert (report["gstr3b"]["osup_det"]["camt"], report["gstr3b"]["osup_det"]["samt"]) == (1.80, 1.80)
+    assert report["b2b"][["camt", "samt"]].sum().tolist() == [180, 180]
+    assert report["hsn"]["camt"].tolist() == [90, 90]
+
+
+def test_gstr3b_totals_equal_the_saved_invoice_taxes():
+    rates = [0, 5, 12, 18, 28]
+    rows = [billed(f"B{n}", ["Reg", "Walk-in", "Local"][n % 3],
+                   [item(f"I{k}", f"{1000 + k % 4}", 1 + k % 3, round(3.35 + 7.77 * k + n, 2), rates[(n + k) % 5]) for k in range(1 + n % 6)],
+                   is_intra=n % 3 != 1) for n in range(30)]
+    df = pd.DataFrame(rows)
+    df.loc[0, "CGST"] = df.loc[0, "SGST"] = 1.0  # a header out of step with its items still wins
+    report = build_returns(SELLER, df, CUSTOMERS, 2025, 4)
+    osup = report["gstr3b"]["osup_det"]
+    assert (osup["iamt"], osup["camt"], osup["samt"]) == tuple(round(float(df[c].sum()), 2) for c in ("IGST", "CGST", "SGST"))
+    for c, head in (("IGST", "iamt"), ("CGST", "camt"), ("SGST", "samt")):
+        saved = int(round(df[c].sum() * 100))
+        assert report["hsn"][head].sum() == saved
+        assert sum(report[k][head].sum() for k in ("b2b", "b2cl", "b2cs")) == saved
+    unreg = df[df["Buyer Name"] != "Reg"]
+    assert round(sum(u["iamt"] for u in report["gstr3b"]["unreg_details"]), 2) == round(float(unreg["IGST"].sum()), 2)
@@ -0,0 +1,40 @@
+import io
+
+import pytest
+from openpyxl import Workbook
+
+from hk_import import import_customers
+from hk_storage import SQLiteBackend
+
+
+class CrashAfterAppend(SQLiteBackend):
+    # Saves the first batch, then dies before the checkpoint is written.
+    crashed = False
+
+    def append(self, worksheet_name, rows):
+        super().append(worksheet_name, rows)
+        if not self.crashed:
+            self.crashed = True
+            raise SystemExit("killed")
+        return True
+
+
+def workbook(n):
+    wb = Workbook()
+    ws = wb.active
+    ws.append(["Name", "GSTIN", "Mobile"])
+    for i in range(n): ws.append([f"Customer {i}", "", 9800000000 + i])
+    out = io.BytesIO(); wb.save(out)
+    return io.BytesIO(out.getvalue())
+
+
+def test_resume_after_crash_does_not_duplicate_batch(tmp_path):
+    storage = CrashAfterAppend(str(tmp_path / "hk.db"))
+    state = str(tmp_path / "imports.json")
+    with pytest.raises(SystemExit):
+        import_customers(storage, workbook(5), "U1", batch_size=2, state_path=state)
+    result = import_customers(storage, workbook(5), "U1", batch_size=2, state_path=state)
+    names = storage.read_user("Customers", "U1")["Name"]
+    assert sorted(names) == [f"Customer {i}" for i in range(5)]
+    assert result["imported"] == 5 and result["rejected"] == 0
+    storage.close()
@@ -0,0 +1,42 @@
+import pandas as pd
+
+from hk_ledger import LedgerStore, ageing, ledger_entries
+
+
+def entries():
+    invoices = pd.DataFrame([
+        {"Bill No": "B1", "Date": "01/01/2025", "Buyer Name": "Asha", "Grand Total": 100, "Payment Mode": "Credit"},
+        {"Bill No": "B2", "Date": "20/02/2025", "Buyer Name": "Asha", "Grand Total": 200, "Payment Mode": ""},
+        {"Bill No": "B3", "Date": "25/03/2025", "Buyer Name": "Asha", "Grand Total": 50, "Payment Mode": "Credit"},
+        {"Bill No": "B4", "Date": "25/03/2025", "Buyer Name": "Ravi", "Grand Total": 75, "Payment Mode": "Cash"},
+        {"Bill No": "B5", "Date": "", "Buyer Name": "Ravi", "Grand Total": 40, "Payment Mode": "Credit"},
+    ])
+    receipts = pd.DataFrame([
+        {"Receipt No": "R1", "Date": "01/03/2025", "Party Name": "Asha", "Amount": 150, "Mode": "Cash", "Note": ""},
+        {"Receipt No": "R2", "Date": "01/03/2025", "Party Name": "Mira", "Amount": 30, "Mode": "Online", "Note": ""},
+    ])
+    return ledger_entries(invoices, receipts)
+
+
+def test_ageing_settles_oldest_invoices_first():
+    table = ageing(entries(), as_of="2025-03-31").set_index("Party")
+    # Asha: 150 received clears B1 (100) and 50 of B2; B2 is 39 days old, B3 6 days.
+    assert table.loc["Asha", ["0-30", "31-60", "61-90", "90+", "Advance", "Balance"]].tolist() == [50.0, 150.0, 0.0, 0.0, 0.0, 200.0]
+    # Ravi's cash sale is not on account; the undated invoice goes to the oldest bucket.
+    assert table.loc["Ravi", ["90+", "Balance"]].tolist() == [40.0, 40.0]
+    assert table.loc["Mira", ["Advance", "Balance"]].tolist() == [30.0, -30.0]
+    assert list(table.index) == ["Asha", "Ravi", "Mira"]
+
+
+def test_ageing_drops_settled_parties_and_handles_no_entries():
+    df = entries()
+    df.loc[df["Ref"] == "R1", "Credit"] = 35000
+    assert list(ageing(df, as_of="2025-03-31")["Party"]) == ["Ravi", "Mira"]
+    assert ageing(entries().iloc[0:0]).empty
+
+
+def test_store_counts_a_redelivered_invoice_once(tmp_path):
+    store = LedgerStore(str(tmp_path / "ledger.db"))
+    row = {"UserID": "u1", "Bill No": "B1", "Date": "01/01/2025", "Buyer Name": "Asha", "Grand Total": 100, "Payment Mode": "Credit"}
+    assert store.add_invoice(row) and not store.add_invoice(dict(row))
+    assert store.balance("u1", "Asha") == 100.0
@@ -0,0 +1,18 @@
+import pandas as pd
+
+from hk_lines import hsn_turnover, invoice_lines, top_sellers
+
+
+def _lines():
+    row = {"UserID": "u1", "Bill No": "INV-1", "Date": "05/04/2025",
+           "Items": '[{"Description": "Pen", "HSN": "9608", "Qty": 2, "UOM": "PCS", "Rate": 10, "GST Rate": 18},'
+                    ' {"Description": "Ink", "HSN": "3215", "Qty": 1, "UOM": "PCS", "Rate": 50, "GST Rate": 18}]'}
+    return pd.DataFrame(invoice_lines(row))
+
+
+def test_redelivered_lines_count_once():
+    lines = _lines()
+    twice = pd.concat([lines, lines], ignore_index=True)
+    assert top_sellers(twice).set_index("Description")["Qty"].to_dict() == {"Ink": 1.0, "Pen": 2.0}
+    assert hsn_turnover(twice)["Taxable"].sum() == 70.0
+    assert hsn_turnover(twice)["Lines"].sum() == 2
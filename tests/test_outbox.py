@@ -0,0 +1,60 @@
+from hk_outbox import WriteBehindQueue
+
+
+class FlakyStorage:
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.appended = []
+        self.queue = None
+        self.seen_pending = []
+
+    def append(self, worksheet_name, rows):
+        if worksheet_name in self.failing: raise ConnectionError("sheet unavailable")
+        self.seen_pending.append(len(self.queue.pending_frame(worksheet_name)))
+        self.appended.append((worksheet_name, [r["UserID"] for r in rows]))
+        return True
+
+
+def make_queue(tmp_path, storage):
+    queue = WriteBehindQueue(storage, str(tmp_path / "outbox.db"), base_delay=60)
+    storage.queue = queue
+    return queue
+
+
+def test_failed_invoice_holds_back_that_tenants_lines(tmp_path):
+    storage = FlakyStorage(failing={"Invoices"})
+    queue = make_queue(tmp_path, storage)
+    queue.enqueue("Invoices", {"UserID": "U1", "Bill No": "1"})
+    queue.enqueue_many("InvoiceLines", [{"UserID": "U1", "Bill No": "1", "Line": 1}, {"UserID": "U2", "Bill No": "9", "Line": 1}])
+    assert queue.flush_once() == 1
+    assert storage.appended == [("InvoiceLines", ["U2"])]
+    storage.failing.clear()
+    assert queue.flush_once() == 0  # U1's invoice is still backing off, so its line waits too
+    assert queue.pending_count() == 2
+
+
+def test_rows_stay_pending_until_their_append_succeeds(tmp_path):
+    storage = FlakyStorage()
+    queue = make_queue(tmp_path, storage)
+    queue.enqueue_many("Invoices", [{"UserID": "U1", "Bill No": "1"}, {"UserID": "U1", "Bill No": "2"}])
+    assert len(queue.pending_frame("Invoices", "U1")) == 2
+    assert queue.flush_once() == 2
+    assert storage.seen_pending == [2]  # still visible while the append is running
+    assert queue.pending_frame("Invoices", "U1").empty
+
+
+def test_batch_is_sent_in_id_order_across_worksheets(tmp_path):
+    storage = FlakyStorage(failing={"Invoices"})
+    queue = WriteBehindQueue(storage, str(tmp_path / "outbox.db"), batch_size=3, base_delay=60)
+    storage.queue = queue
+    queue.enqueue_many("InvoiceLines", [{"UserID": "U1", "Bill No": "B1", "Line": 1}])
+    queue.enqueue("Invoices", {"UserID": "U1", "Bill No": "B2"})
+    queue.enqueue_many("InvoiceLines", [{"UserID": "U1", "Bill No": "B2", "Line": 1}])
+    assert queue.flush_once() == 1  # B1's line, then B2's invoice fails and B2's line must wait
+    assert storage.appended == [("InvoiceLines", ["U1"])]
+    assert [r["Bill No"] for r in queue.pending_rows("InvoiceLines", "U1")] == ["B2"]
+    storage.failing.clear()
+    with queue.db: queue.db.execute("UPDATE outbox SET next_attempt = 0")
+    assert queue.flush_once() == 2
+    assert [w for w, _ in storage.appended] == ["InvoiceLines", "Invoices", "InvoiceLines"]
+    assert queue.pending_count() == 0
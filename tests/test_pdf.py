@@ -0,0 +1,56 @@
+import io
+import os
+
+from pypdf import PdfReader
+
+from hk_pdf import PdfCache, clip_style, generate_pdf, paginate_rows
+from hk_tax import compute_invoice_tax
+
+
+def test_cache_shares_directory_and_budget_across_instances(tmp_path):
+    # Two instances stand in for two bulk worker processes.
+    a, b = PdfCache(str(tmp_path), max_bytes=1000), PdfCache(str(tmp_path), max_bytes=1000)
+    for i in range(10):
+        a.put(f"a{i}", b"x" * 100)
+        b.put(f"b{i}", b"y" * 100)
+    on_disk = sum(os.path.getsize(tmp_path / name) for name in os.listdir(tmp_path))
+    assert on_disk <= 1000
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".tmp")]
+    assert a.get("b9") == b"y" * 100
+    assert a.get("missing") is None
+
+def test_rows_break_onto_a_new_page_at_the_height_limit():
+    assert paginate_rows([10] * 10, 35) == ([(0, 3), (3, 6), (6, 9), (9, 10)], 10)
+    assert paginate_rows([10] * 6, 30) == ([(0, 3), (3, 6)], 30)  # an exact fit stays on the page
+    assert paginate_rows([50, 10], 30) == ([(0, 1), (1, 2)], 10)  # a row taller than the page still gets one
+
+
+def test_style_commands_are_clipped_to_each_pages_rows():
+    cmds = [("GRID", (0, 0), (-1, -1), 0.5), ("BACKGROUND", (0, 0), (-1, 0), "grey"),
+            ("SPAN", (0, 8), (5, 8)), ("ALIGN", (1, 1), (1, 7), "LEFT"), ("FONTNAME", (0, -2), (-1, -1), "Helvetica-Bold")]
+    assert clip_style(cmds, 10, 0, 4) == [("GRID", (0, 0), (-1, 3), 0.5), ("BACKGROUND", (0, 0), (-1, 0), "grey"), ("ALIGN", (1, 1), (1, 3), "LEFT")]
+    assert clip_style(cmds, 10, 4, 10) == [("GRID", (0, 0), (-1, 5), 0.5), ("SPAN", (0, 4), (5, 4)), ("ALIGN", (1, 0), (1, 3), "LEFT"),
+                                           ("FONTNAME", (0, 4), (-1, 5), "Helvetica-Bold")]
+
+
+def render(n_items):
+    seller = {"Business Name": "Firm", "Is GST": "Yes", "GSTIN": "27AAPFU0939F1ZV", "UserID": "u1"}
+    buyer = {"Name": "Ravi", "Date": "01/04/2025", "POS Code": "27", "Shipping": {}}
+    items = [{"Description": f"Item {i}", "HSN": "9608", "Qty": 1.0, "UOM": "PCS", "Rate": 10.0, "GST Rate": 18.0} for i in range(n_items)]
+    buf = io.BytesIO()
+    generate_pdf(seller, buyer, items, "INV-1", buf, compute_invoice_tax(items)[2])
+    return [page.extract_text() for page in PdfReader(io.BytesIO(buf.getvalue()), strict=True).pages]
+
+
+def test_long_invoice_keeps_every_row_and_ends_with_the_totals():
+    pages = render(60)
+    assert len(pages) > 1
+    assert sum(text.count("Item ") for text in pages) == 60
+    assert ["Grand Total" in text for text in pages] == [False] * (len(pages) - 1) + [True]
+    assert all(f"Page {i} of {len(pages)}" in text for i, text in enumerate(pages, 1))
+
+
+def test_hsn_summary_that_does_not_fit_gets_its_own_last_page():
+    pages = render(30)
+    assert "Grand Total" in pages[-2] and "Item " not in pages[-1] and "HSN/SAC" in pages[-1]
+    assert render(3)[0].count("HSN/SAC") == 2  # item table header and summary on one page
@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+
+from hk_rollup import RollupStore
+
+
+def invoices(n=40, seed=7):
+    rng = np.random.default_rng(seed)
+    days = pd.to_datetime("2025-03-20") + pd.to_timedelta(rng.integers(0, 25, n), unit="D")
+    taxable = rng.integers(100, 100000, n) / 100
+    inter = rng.random(n) < 0.3
+    igst = np.where(inter, np.round(taxable * 0.18, 2), 0.0)
+    cgst = np.where(inter, 0.0, np.round(taxable * 0.09, 2))
+    return pd.DataFrame({"UserID": "u1", "Bill No": [f"B{i}" for i in range(n)], "Date": days.strftime("%d/%m/%Y"),
+                         "Payment Mode": rng.choice(["Cash", "Online", ""], n), "Total Taxable": taxable,
+                         "CGST": cgst, "SGST": cgst, "IGST": igst, "Grand Total": np.round(taxable + 2 * cgst + igst, 2)})
+
+
+def expected(df, width):
+    bucket = pd.to_datetime(df["Date"], format="%d/%m/%Y").dt.strftime("%Y-%m-%d").str[:width]
+    out = df.groupby(bucket).agg(Sales=("Grand Total", "sum"), Taxable=("Total Taxable", "sum"), CGST=("CGST", "sum"),
+                                 SGST=("SGST", "sum"), IGST=("IGST", "sum"), Invoices=("Bill No", "size"))
+    return out.round(2).rename_axis("Bucket").reset_index()
+
+
+def test_totals_match_a_groupby_over_the_same_invoices(tmp_path):
+    df = invoices()
+    rebuilt, added = RollupStore(str(tmp_path / "a.db")), RollupStore(str(tmp_path / "b.db"))
+    assert rebuilt.rebuild("u1", df) == len(df)
+    for row in df.to_dict('records'): assert added.add(row)
+    for period, width in (("day", 10), ("month", 7)):
+        want = expected(df, width)
+        for store in (rebuilt, added):
+            got = store.totals("u1", period)
+            got[["Sales", "Taxable", "CGST", "SGST", "IGST"]] = got[["Sales", "Taxable", "CGST", "SGST", "IGST"]].round(2)
+            pd.testing.assert_frame_equal(got, want, check_dtype=False)
+    assert list(rebuilt.totals("u1", "day", limit=3)["Bucket"]) == list(expected(df, 10)["Bucket"])[-3:]
+    modes = rebuilt.modes("u1", "month").groupby("Mode")["Sales"].sum().round(2)
+    assert modes.to_dict() == df.groupby(df["Payment Mode"].replace("", "Not set"))["Grand Total"].sum().round(2).to_dict()
+
+
+def test_the_same_bill_no_is_counted_once(tmp_path):
+    store = RollupStore(str(tmp_path / "rollups.db"))
+    row = invoices(1).iloc[0].to_dict()
+    assert store.add(row) and not store.add(dict(row))
+    assert store.totals("u1", "day")["Invoices"].tolist() == [1]
+    assert store.stats()["invoices"] == 1
+
+
+def test_rebuild_counts_a_redelivered_row_once_and_replaces_old_totals(tmp_path):
+    store = RollupStore(str(tmp_path / "rollups.db"))
+    df = invoices(5)
+    store.add(invoices(1, seed=1).assign(**{"Bill No": "OLD"}).iloc[0].to_dict())
+    assert store.rebuild("u1", pd.concat([df, df.iloc[[0, 2]]], ignore_index=True)) == 5
+    assert store.totals("u1", "month")["Invoices"].sum() == 5
+    assert round(store.totals("u1", "month")["Sales"].sum(), 2) == round(df["Grand Total"].sum(), 2)
+    assert not store.add(df.iloc[2].to_dict()) and store.is_built("u1")
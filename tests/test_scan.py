@@ -0,0 +1,34 @@
+import pytest
+
+pytest.importorskip("cv2")
+
+from hk_scan import ScanDebouncer  # noqa: E402
+
+
+def test_a_label_held_in_view_counts_once():
+    debouncer = ScanDebouncer(window=2.0)
+    assert debouncer.accept("890100", now=0.0)
+    # Repeat reads keep restarting the window, so a label held for 5 s is one scan.
+    assert not any(debouncer.accept("890100", now=t / 2) for t in range(1, 11))
+
+
+def test_the_same_code_counts_again_after_leaving_the_frame():
+    debouncer = ScanDebouncer(window=2.0)
+    assert debouncer.accept("890100", now=0.0)
+    assert not debouncer.accept("890100", now=2.0)  # the window is inclusive
+    assert debouncer.accept("890100", now=4.5)
+
+
+def test_a_different_code_is_counted_straight_away():
+    debouncer = ScanDebouncer(window=2.0)
+    assert debouncer.accept("890100", now=0.0)
+    assert debouncer.accept("890200", now=0.1)
+    # Two labels in frame alternating are still one scan each.
+    assert not debouncer.accept("890100", now=0.2) and not debouncer.accept("890200", now=0.3)
+
+
+def test_old_codes_are_forgotten_when_the_table_is_full():
+    debouncer = ScanDebouncer(window=2.0, max_codes=3)
+    for i, code in enumerate("abcd"): debouncer.accept(code, now=float(i * 10))
+    assert set(debouncer.seen) == {"d"}
+    assert debouncer.accept("a", now=31.0)
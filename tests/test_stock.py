@@ -0,0 +1,39 @@
+import json
+
+import pandas as pd
+
+from hk_stock import StockStore, inward_lines
+
+
+def sale(bill_no, qty):
+    return {"UserID": "u1", "Bill No": bill_no, "Date": "01/04/2025",
+            "Items": json.dumps([{"Description": "Rice", "HSN": "1006", "Qty": qty, "UOM": "KG", "Rate": 60, "GST Rate": 0}])}
+
+
+def purchase(inward_no, qty):
+    header = {"UserID": "u1", "Inward No": inward_no, "Date": "01/04/2025"}
+    return header, inward_lines(header, [{"Item Name": "Rice", "Qty": qty, "UOM": "KG", "Rate": 50}])
+
+
+def test_redelivered_entries_are_applied_once(tmp_path):
+    store = StockStore(str(tmp_path / "stock.db"))
+    assert store.add_inward(*purchase("INW-1", 10))
+    assert store.add_sale(sale("B1", 2.5))
+    assert store.level("u1", "Rice") == 7.5  # loads the in-memory levels
+    assert not store.add_inward(*purchase("INW-1", 10))
+    assert not store.add_sale(sale("B1", 2.5))
+    assert store.level("u1", "Rice") == 7.5
+    assert store.add_sale(sale("B2", 0.125))
+    assert store.level("u1", "Rice") == 7.375
+    assert StockStore(store.path).level("u1", "Rice") == 7.375
+
+
+def test_rebuild_matches_incremental_adds_and_marks_entries_applied(tmp_path):
+    store = StockStore(str(tmp_path / "stock.db"))
+    header, lines = purchase("INW-1", 10)
+    invoices = pd.DataFrame([sale("B1", 2), sale("B1", 2), sale("B2", 1)])
+    assert store.rebuild("u1", invoices, None, pd.DataFrame(lines + lines)) == 3
+    assert store.levels("u1") == {"Rice": 7.0} and store.is_built("u1")
+    assert not store.add_sale(sale("B2", 1)) and not store.add_inward(header, lines)
+    store.invalidate("u1")
+    assert not store.is_built("u1")
@@ -0,0 +1,67 @@
+import pytest
+
+from hk_storage import CachedStorage, SQLiteBackend, StorageBackend
+
+
+@pytest.fixture
+def backend(tmp_path):
+    backend = SQLiteBackend(str(tmp_path / "hk.db"))
+    yield backend
+    backend.close()
+
+
+def invoice(user_id, bill_no, total=100.0):
+    return {"UserID": user_id, "Bill No": bill_no, "Date": "01/04/2025", "Buyer Name": "Ravi", "Grand Total": total}
+
+
+def test_read_where_matches_text_and_numeric_cells(backend):
+    backend.append("Invoices", [invoice(101, 7), invoice("101", "8"), invoice(202, 7)])
+    assert sorted(map(str, backend.read_where("Invoices", {"UserID": "101"})["Bill No"])) == ["7", "8"]
+    assert len(backend.read_where("Invoices", {"UserID": 101, "Bill No": "7"})) == 1
+    assert backend.read_where("Invoices", {"UserID": "0101"}).empty
+
+
+def test_read_where_unknown_column(backend):
+    with pytest.raises(KeyError):
+        backend.read_where("Invoices", {"Nope": "1"})
+
+
+def test_iter_where_chunks_and_empty_filter(backend):
+    backend.append("Invoices", [invoice("U1", f"B{i}") for i in range(5)] + [invoice("U2", "X")])
+    chunks = list(backend.iter_where("Invoices", {"UserID": "U1"}, chunk_size=2))
+    assert [len(c) for c in chunks] == [2, 2, 1]
+    assert sum(len(c) for c in backend.iter_where("Invoices", {})) == 6
+
+
+def test_update_and_delete_where_count_rows(backend):
+    backend.append("Invoices", [invoice(101, 1), invoice(101, 2), invoice(202, 1)])
+    assert backend.update_where("Invoices", {"UserID": "101", "Bill No": "1"}, {"Grand Total": 250.0}) == 1
+    assert backend.read_where("Invoices", {"UserID": "101", "Bill No": "1"})["Grand Total"][0] == 250.0
+    assert backend.delete_where("Invoices", {"UserID": "101"}) == 2
+    assert len(backend.read("Invoices")) == 1
+
+
+class SheetLikeBackend(SQLiteBackend):
+    # Stands in for the gsheets backend: no filtering at the source.
+    filters_at_source = False
+
+    def __init__(self, path):
+        super().__init__(path)
+        self.full_reads = 0
+
+    def read(self, worksheet_name):
+        self.full_reads += 1
+        return super().read(worksheet_name)
+
+    def read_where(self, worksheet_name, equals):
+        return StorageBackend.read_where(self, worksheet_name, equals)
+
+
+def test_cached_read_user_downloads_sheet_once(tmp_path):
+    backend = SheetLikeBackend(str(tmp_path / "hk.db"))
+    backend.append("Invoices", [invoice(f"U{i}", "1") for i in range(5)])
+    storage = CachedStorage(backend)
+    for i in range(5): assert len(storage.read_user("Invoices", f"U{i}")) == 1
+    assert sum(len(c) for c in storage.iter_user("Invoices", "U0")) == 1
+    assert backend.full_reads == 1
+    backend.close()
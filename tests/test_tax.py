@@ -0,0 +1,39 @@
+import pandas as pd
+
+from hk_tax import compute_invoice_tax, gst_paise, line_amounts, to_paise
+
+
+def items(*rows):
+    return pd.DataFrame([dict(zip(["Description", "HSN", "Qty", "Rate", "GST Rate"], row)) for row in rows])
+
+
+def test_line_amounts_round_half_up_without_float_noise():
+    lines, _, totals = compute_invoice_tax(items(("Pen", "9608", 1, 2.675, 0), ("Ink", "9608", 3, 0.335, 0)))
+    assert lines["Base Amount"].tolist() == [2.68, 1.01]
+    assert totals["taxable"] == 3.69
+    assert list(line_amounts([1, 3], [2.675, 0.335])) == [2.68, 1.01]
+
+
+def test_tax_is_rounded_per_hsn_rate_group_and_adds_up():
+    # Per line, 9% of 10.05 is 0.9045 -> 0.90 twice (1.80). On the group it is 1.809 -> 1.81.
+    _, summary, totals = compute_invoice_tax(items(("A", "1001", 1, 10.05, 18), ("B", "1001", 1, 10.05, 18), ("C", "2002", 2, 50, 5)))
+    assert summary[["HSN", "Rate", "Taxable", "CGST", "SGST"]].values.tolist() == [["1001", 18.0, 20.1, 1.81, 1.81], ["2002", 5.0, 100.0, 2.5, 2.5]]
+    assert totals["cgst"] == totals["sgst"] == 4.31 and totals["igst"] == 0
+    assert totals["total"] == round(summary["Total"].sum(), 2) == 128.72
+
+
+def test_inter_state_charges_igst_only():
+    _, summary, totals = compute_invoice_tax(items(("A", "1001", 1, 0.5, 5)), is_intra=False)
+    assert summary["IGST"].tolist() == [0.03]  # 2.5 paise rounds half up
+    assert (totals["cgst"], totals["sgst"], totals["igst"], totals["total"], totals["is_intra"]) == (0, 0, 0.03, 0.53, False)
+
+
+def test_blank_and_text_numbers_count_as_zero():
+    lines, _, totals = compute_invoice_tax(items(("A", None, "2", "", "12"), ("B", "", "x", 5, None)))
+    assert lines[["Qty", "Rate", "GST Rate"]].values.tolist() == [[2.0, 0.0, 12.0], [0.0, 5.0, 0.0]]
+    assert totals["total"] == 0
+
+
+def test_vectorised_helpers_match():
+    assert to_paise([1.005, 2.675, -1.005]).tolist() == [101, 268, -101]
+    assert gst_paise([1005, 2010], [18, 18], 200).tolist() == [90, 181]
@@ -0,0 +1,26 @@
+import base64
+import io
+
+from PIL import Image
+
+from hk_storage import SQLiteBackend
+from hk_thumbs import ThumbnailStore, is_thumb_ref, migrate_item_images
+
+
+def jpeg_base64(color):
+    buf = io.BytesIO()
+    Image.new("RGB", (4, 4), color).save(buf, format="JPEG")
+    return base64.b64encode(buf.getvalue()).decode()
+
+
+def test_migration_moves_good_pictures_and_keeps_broken_ones(tmp_path):
+    storage = SQLiteBackend(str(tmp_path / "hk.db"))
+    red, blue = jpeg_base64("red"), jpeg_base64("blue")
+    storage.append("Items", [{"UserID": "U1", "Item Name": "Soap", "Image": red}, {"UserID": "U1", "Item Name": "Soap", "Image": blue},
+                             {"UserID": "U1", "Item Name": "Oil", "Image": "not base64!"}])
+    result = migrate_item_images(storage, ThumbnailStore(str(tmp_path / "thumbs")))
+    assert result == {"moved": 2, "failed": [("U1", "Oil")]}
+    images = storage.read("Items").set_index("Item Name")["Image"]
+    assert all(is_thumb_ref(v) for v in images["Soap"]) and images["Soap"].nunique() == 2
+    assert images["Oil"] == "not base64!"
+    storage.close()
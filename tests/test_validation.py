@@ -0,0 +1,35 @@
+import pandas as pd
+
+from hk_validation import gstin_check_digit, gstin_columns, gstin_state, is_valid_gstin, valid_mask, validate_columns
+
+VALID = "27AAPFU0939F1ZV"
+
+
+def test_known_gstin_passes_and_check_digit_matches():
+    assert is_valid_gstin(VALID)
+    assert gstin_check_digit(VALID) == "V"
+    assert gstin_state(VALID) == "Maharashtra"
+
+
+def test_gstin_rejections():
+    assert not is_valid_gstin(VALID[:-1] + "W")  # wrong check digit
+    assert not is_valid_gstin("00" + VALID[2:14] + gstin_check_digit("00" + VALID[2:14]))  # unknown state code
+    assert not is_valid_gstin(VALID.lower())
+    assert not is_valid_gstin(VALID[:-1])
+
+
+def test_vectorised_check_agrees_with_single_value_check():
+    bodies = ["27AAPFU0939F1Z", "29ABCDE1234F1Z", "07AAACH7409R1Z", "24AAACR5055K1Z"]
+    values = [b + gstin_check_digit(b) for b in bodies] + [b + "0" for b in bodies] + ["", "NOT A GSTIN", None]
+    assert valid_mask(pd.Series(values), "gstin").tolist() == [is_valid_gstin(v) for v in values]
+
+
+def test_gstin_columns_split_state_and_pan():
+    cols = gstin_columns(pd.Series([VALID.lower(), "bad"]))
+    assert cols.values.tolist() == [["27", "Maharashtra", "AAPFU0939F"], ["", "", ""]]
+
+
+def test_validate_columns_reports_each_problem():
+    df = pd.DataFrame({"Name": ["Ravi", "", "Asha"], "GSTIN": [VALID, "27AAPFU0939F1ZX", ""], "Mobile": ["9876543210", "12345", ""]})
+    errors = validate_columns(df, {"GSTIN": "gstin", "Mobile": "mobile"}, required=["Name"])
+    assert errors.tolist() == ["", "Name is required; Invalid GSTIN; Invalid Mobile", ""]